@@ -5,18 +5,42 @@ This module provides enhanced content extraction capabilities:
 - JavaScript rendering for dynamic content (Playwright)
 - Archive service integration for paywall bypass
 - Enhanced fetcher combining all strategies
+
+Exports are imported lazily on first access so that importing the package
+does not pull in aiohttp, Playwright, or the extraction stack until a
+feature is actually used.
 """
 
-from .js_renderer import JSRenderer, render_url, PLAYWRIGHT_AVAILABLE
-from .archive import ArchiveService, fetch_from_archive
-from .enhanced_fetcher import EnhancedFetcher, EnhancedFetchResult
-
-__all__ = [
-    "JSRenderer",
-    "render_url",
-    "PLAYWRIGHT_AVAILABLE",
-    "ArchiveService",
-    "fetch_from_archive",
-    "EnhancedFetcher",
-    "EnhancedFetchResult",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .js_renderer import JSRenderer, render_url, PLAYWRIGHT_AVAILABLE
+    from .archive import ArchiveService, fetch_from_archive
+    from .enhanced_fetcher import EnhancedFetcher, EnhancedFetchResult
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "JSRenderer": ".js_renderer",
+    "render_url": ".js_renderer",
+    "PLAYWRIGHT_AVAILABLE": ".js_renderer",
+    "ArchiveService": ".archive",
+    "fetch_from_archive": ".archive",
+    "EnhancedFetcher": ".enhanced_fetcher",
+    "EnhancedFetchResult": ".enhanced_fetcher",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -12,16 +12,58 @@ captured before the paywall or have full content available.
 
 import asyncio
 import logging
+import random
 import re
+import threading
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Optional
 from urllib.parse import quote, urlparse
 
 import aiohttp
 
+# orjson is optional - a faster drop-in for decoding the CDX JSON
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# aiodns is optional - enables aiohttp's non-blocking c-ares DNS resolver
+try:
+    import aiodns  # noqa: F401
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+from ..cache import MemoryCache
+
 logger = logging.getLogger(__name__)
 
+# Statuses that signal a transient overload worth retrying
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_RETRY_DELAY = 10.0
+
+# Patterns used on every archive response, compiled once at import
+_ARCHIVE_TODAY_DATE_RE = re.compile(r"archive\.\w+/(\d{4})\.(\d{2})\.(\d{2})")
+_TIMEMAP_ENTRY_RE = re.compile(r'<([^>]+)>\s*((?:;\s*\w+="[^"]*"\s*)*)')
+_TIMEMAP_PARAM_RE = re.compile(r'(\w+)="([^"]*)"')
+_GHOSTARCHIVE_LINK_RE = re.compile(r'href="(/archive/[^"]+)"')
+_GOOGLE_DATE_RE = re.compile(r"as retrieved on (\w+ \d+, \d{4})")
+_WAYBACK_BANNER_START = "<!-- BEGIN WAYBACK TOOLBAR INSERT -->"
+_WAYBACK_BANNER_END = "<!-- END WAYBACK TOOLBAR INSERT -->"
+_WAYBACK_SCRIPT_RE = re.compile(
+    r'<script[^>]*src="[^"]*web\.archive\.org[^"]*"[^>]*>.*?</script>',
+    re.DOTALL | re.IGNORECASE
+)
+_GOOGLE_HEADER_RE = re.compile(
+    r'<div[^>]*style="[^"]*background:#[^"]*"[^>]*>.*?</div>\s*<hr[^>]*>',
+    re.DOTALL | re.IGNORECASE
+)
+
 
 @dataclass
 class ArchiveResult:
@@ -39,7 +81,8 @@ class ArchiveService:
     """
     Fetches content from various web archive services.
 
-    Tries multiple archives in order of reliability for bypassing paywalls:
+    Queries multiple archives concurrently, preferring them in order
+    of reliability for bypassing paywalls:
     1. Archive.today - Often has full article content
     2. Wayback Machine - Historical snapshots
     3. Google Cache - Recent cached version
@@ -50,9 +93,18 @@ class ArchiveService:
         timeout: int = 30,
         max_age_days: int = 30,  # Maximum age of cached content
         user_agent: str | None = None,
+        stagger_delay: float = 0.5,  # Head start (seconds) per service in priority order
+        cache_ttl: int = 3600,  # Seconds to remember a found archive
+        negative_cache_ttl: int = 900,  # Seconds to remember that nothing was found
+        max_response_bytes: int = 5 * 1024 * 1024,  # Abort archive pages larger than this
     ):
         self.timeout = timeout
         self.max_age_days = max_age_days
+        self._max_age = timedelta(days=max_age_days)
+        self.stagger_delay = stagger_delay
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self.max_response_bytes = max_response_bytes
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -64,11 +116,110 @@ class ArchiveService:
             "Accept-Language": "en-US,en;q=0.5",
         }
 
+        # Shared HTTP session (lazy initialized) so repeat lookups reuse
+        # pooled keep-alive connections instead of re-handshaking TLS
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Recent lookups keyed by original URL (hits and misses), plus
+        # in-flight lookups so concurrent callers share one request
+        self._cache = MemoryCache(max_size=1024)
+        self._inflight: dict[str, asyncio.Future[ArchiveResult]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                    # Falls back to the threaded getaddrinfo resolver
+                    resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        max_attempts: int = 3,
+        **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Issue a request on the shared session, retrying 429/503 responses.
+
+        Honors Retry-After when present, otherwise backs off exponentially
+        with jitter. Retries stop once they would exceed self.timeout.
+        """
+        session = await self._get_session()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+
+        attempt = 1
+        while True:
+            resp = await session.request(method, url, **kwargs)
+            if resp.status not in _RETRY_STATUSES or attempt >= max_attempts:
+                break
+
+            delay = self._retry_delay(resp, attempt)
+            if loop.time() + delay > deadline:
+                break
+
+            resp.release()
+            logger.debug(f"{url} returned {resp.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        try:
+            yield resp
+        finally:
+            resp.release()
+
+    def _retry_delay(self, resp: aiohttp.ClientResponse, attempt: int) -> float:
+        """Seconds to wait before retrying a throttled response."""
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), _MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; use our own backoff
+        return min(2 ** attempt + random.random(), _MAX_RETRY_DELAY)
+
+    async def _read_capped(self, resp: aiohttp.ClientResponse) -> str:
+        """Read and decode a response body, refusing oversized pages."""
+        chunks: list[bytes] = []
+        total = 0
+        async for chunk in resp.content.iter_chunked(65536):
+            total += len(chunk)
+            if total > self.max_response_bytes:
+                raise ValueError(
+                    f"Archive response exceeded {self.max_response_bytes} bytes"
+                )
+            chunks.append(chunk)
+        encoding = resp.charset or "utf-8"
+        return b"".join(chunks).decode(encoding, errors="replace")
+
     async def fetch(self, url: str) -> ArchiveResult:
         """
         Try to fetch content from archive services.
 
-        Attempts each service in order until one succeeds.
+        Queries all services concurrently and returns the first success.
+        Later services start after a short stagger so the more reliable
+        archives keep their head start when they respond quickly.
+
+        Results are cached per URL, including misses (for a shorter TTL).
 
         Args:
             url: Original URL to find in archives
@@ -76,7 +227,28 @@ class ArchiveService:
         Returns:
             ArchiveResult with archived content if found
         """
-        # Try each archive service in order
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent lookups of the same URL into one task. The
+        # shield keeps one caller's cancellation from aborting the others.
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, url: str) -> ArchiveResult:
+        """Look up a URL and remember the outcome."""
+        result = await self._fetch_uncached(url)
+        ttl = self.cache_ttl if result.success else self.negative_cache_ttl
+        self._cache.set(url, result, ttl=ttl)
+        return result
+
+    async def _fetch_uncached(self, url: str) -> ArchiveResult:
+        """Query all archive services, returning the first success."""
         services = [
             ("archive.today", self._fetch_archive_today),
             ("archive.ph", self._fetch_archive_ph),
@@ -85,15 +257,22 @@ class ArchiveService:
             ("google_cache", self._fetch_google_cache),
         ]
 
-        for service_name, fetch_func in services:
-            try:
-                result = await fetch_func(url)
-                if result.success and result.html:
-                    logger.info(f"Found {url} in {service_name}")
+        tasks = [
+            asyncio.create_task(
+                self._try_service(name, fetch_func, url, delay=i * self.stagger_delay)
+            )
+            for i, (name, fetch_func) in enumerate(services)
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is not None and result.success and result.html:
+                    logger.info(f"Found {url} in {result.source}")
                     return result
-            except Exception as e:
-                logger.debug(f"Failed to fetch from {service_name}: {e}")
-                continue
+        finally:
+            for task in tasks:
+                task.cancel()
 
         # No archive found
         return ArchiveResult(
@@ -106,6 +285,24 @@ class ArchiveService:
             error="No archived version found"
         )
 
+    async def _try_service(
+        self,
+        service_name: str,
+        fetch_func,
+        url: str,
+        delay: float = 0.0,
+    ) -> ArchiveResult | None:
+        """Run a single archive lookup, swallowing errors."""
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            return await fetch_func(url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Failed to fetch from {service_name}: {e}")
+            return None
+
     async def _fetch_archive_today(self, url: str) -> ArchiveResult:
         """
         Fetch from Archive.today (archive.is, archive.ph).
@@ -113,54 +310,7 @@ class ArchiveService:
         Archive.today often captures full article content including
         content that's normally behind paywalls.
         """
-        # Archive.today search API
-        search_url = f"https://archive.today/newest/{url}"
-
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.get(
-                search_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=True
-            ) as resp:
-                # If we get a 200, we have an archived version
-                if resp.status == 200:
-                    html = await resp.text()
-                    final_url = str(resp.url)
-
-                    # Extract the archive date from the URL if possible
-                    cached_date = self._parse_archive_today_date(final_url)
-
-                    # Check if content is too old
-                    if cached_date and self._is_too_old(cached_date):
-                        return ArchiveResult(
-                            url=final_url,
-                            original_url=url,
-                            html="",
-                            source="archive.today",
-                            cached_date=cached_date,
-                            success=False,
-                            error="Cached version too old"
-                        )
-
-                    return ArchiveResult(
-                        url=final_url,
-                        original_url=url,
-                        html=html,
-                        source="archive.today",
-                        cached_date=cached_date,
-                        success=True
-                    )
-
-                # 404 means no archive exists
-                return ArchiveResult(
-                    url=url,
-                    original_url=url,
-                    html="",
-                    source="archive.today",
-                    cached_date=None,
-                    success=False,
-                    error=f"Not found (status {resp.status})"
-                )
+        return await self._fetch_archive_is(url, "archive.today")
 
     async def _fetch_archive_ph(self, url: str) -> ArchiveResult:
         """
@@ -168,50 +318,157 @@ class ArchiveService:
 
         Sometimes archive.ph has different cached versions than archive.today.
         """
-        search_url = f"https://archive.ph/newest/{url}"
+        return await self._fetch_archive_is(url, "archive.ph")
 
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.get(
-                search_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=True
-            ) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    final_url = str(resp.url)
-
-                    cached_date = self._parse_archive_today_date(final_url)
-
-                    if cached_date and self._is_too_old(cached_date):
-                        return ArchiveResult(
-                            url=final_url,
-                            original_url=url,
-                            html="",
-                            source="archive.ph",
-                            cached_date=cached_date,
-                            success=False,
-                            error="Cached version too old"
-                        )
-
-                    return ArchiveResult(
-                        url=final_url,
-                        original_url=url,
-                        html=html,
-                        source="archive.ph",
-                        cached_date=cached_date,
-                        success=True
-                    )
+    async def _fetch_archive_is(self, url: str, host: str) -> ArchiveResult:
+        """
+        Fetch the newest snapshot from an archive.today mirror.
 
+        Resolves the snapshot (and its capture date) before downloading
+        anything, so stale archives are rejected without fetching the
+        page body.
+        """
+        status, snapshot_url, cached_date = await self._resolve_archive_is(url, host)
+
+        if snapshot_url is None:
+            # 404 means no archive exists
+            return ArchiveResult(
+                url=url,
+                original_url=url,
+                html="",
+                source=host,
+                cached_date=None,
+                success=False,
+                error=f"Not found (status {status})"
+            )
+
+        # Check if content is too old
+        if cached_date and self._is_too_old(cached_date):
+            return ArchiveResult(
+                url=snapshot_url,
+                original_url=url,
+                html="",
+                source=host,
+                cached_date=cached_date,
+                success=False,
+                error="Cached version too old"
+            )
+
+        async with self._request(
+            "GET",
+            snapshot_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            if resp.status != 200:
                 return ArchiveResult(
                     url=url,
                     original_url=url,
                     html="",
-                    source="archive.ph",
+                    source=host,
                     cached_date=None,
                     success=False,
                     error=f"Not found (status {resp.status})"
                 )
 
+            html = await self._read_capped(resp)
+            final_url = str(resp.url)
+
+        if cached_date is None:
+            cached_date = self._parse_archive_today_date(final_url)
+            if cached_date and self._is_too_old(cached_date):
+                return ArchiveResult(
+                    url=final_url,
+                    original_url=url,
+                    html="",
+                    source=host,
+                    cached_date=cached_date,
+                    success=False,
+                    error="Cached version too old"
+                )
+
+        return ArchiveResult(
+            url=final_url,
+            original_url=url,
+            html=html,
+            source=host,
+            cached_date=cached_date,
+            success=True
+        )
+
+    async def _resolve_archive_is(
+        self,
+        url: str,
+        host: str,
+    ) -> tuple[int, str | None, datetime | None]:
+        """
+        Find the newest snapshot URL and capture date on an archive.today mirror.
+
+        Reads the Memento timemap, which lists every snapshot in a single
+        response, instead of following the /newest/ redirect chain. Falls
+        back to a HEAD on /newest/ if the timemap is unavailable.
+
+        Returns:
+            (status, snapshot_url, cached_date); snapshot_url is None if
+            the URL has not been archived.
+        """
+        timemap_url = f"https://{host}/timemap/link/{url}"
+
+        async with self._request(
+            "GET",
+            timemap_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            status = resp.status
+            timemap = await self._read_capped(resp) if status == 200 else ""
+
+        if status == 200:
+            snapshot_url, cached_date = self._parse_timemap(timemap)
+            return (200 if snapshot_url else 404), snapshot_url, cached_date
+        if status == 404:
+            return status, None, None
+
+        search_url = f"https://{host}/newest/{url}"
+
+        async with self._request(
+            "HEAD",
+            search_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            status = resp.status
+            snapshot_url = str(resp.url)
+
+        # Some mirrors reject HEAD; fall back to a plain GET of the search URL
+        if status == 405:
+            return status, search_url, None
+        if status != 200:
+            return status, None, None
+
+        # Extract the archive date from the URL if possible
+        return status, snapshot_url, self._parse_archive_today_date(snapshot_url)
+
+    def _parse_timemap(self, timemap: str) -> tuple[str | None, datetime | None]:
+        """Pick the most recent memento from a link-format timemap."""
+        newest_url: str | None = None
+        newest_date: datetime | None = None
+
+        for match in _TIMEMAP_ENTRY_RE.finditer(timemap):
+            target, params = match.group(1), dict(_TIMEMAP_PARAM_RE.findall(match.group(2)))
+            if "memento" not in params.get("rel", "").split():
+                continue
+
+            try:
+                captured = parsedate_to_datetime(params["datetime"]).replace(tzinfo=None)
+            except (KeyError, TypeError, ValueError):
+                captured = None
+
+            if newest_url is None or (captured and (newest_date is None or captured > newest_date)):
+                newest_url, newest_date = target, captured
+
+        return newest_url, newest_date
+
     async def _fetch_ghostarchive(self, url: str) -> ArchiveResult:
         """
         Fetch from Ghostarchive.org.
@@ -220,71 +477,72 @@ class ArchiveService:
         """
         search_url = f"https://ghostarchive.org/search?term={quote(url, safe='')}"
 
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            # First search for the URL
-            async with session.get(
-                search_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=True
-            ) as resp:
-                if resp.status != 200:
-                    return ArchiveResult(
-                        url=url,
-                        original_url=url,
-                        html="",
-                        source="ghostarchive",
-                        cached_date=None,
-                        success=False,
-                        error=f"Search failed (status {resp.status})"
-                    )
-
-                search_html = await resp.text()
-
-                # Look for archive link in search results
-                # Ghostarchive links look like: /archive/xxxxx
-                match = re.search(r'href="(/archive/[^"]+)"', search_html)
-                if not match:
-                    return ArchiveResult(
-                        url=url,
-                        original_url=url,
-                        html="",
-                        source="ghostarchive",
-                        cached_date=None,
-                        success=False,
-                        error="No archive found"
-                    )
-
-                archive_path = match.group(1)
-                archive_url = f"https://ghostarchive.org{archive_path}"
-
-            # Fetch the actual archived page
-            async with session.get(
-                archive_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=True
-            ) as resp:
-                if resp.status != 200:
-                    return ArchiveResult(
-                        url=archive_url,
-                        original_url=url,
-                        html="",
-                        source="ghostarchive",
-                        cached_date=None,
-                        success=False,
-                        error=f"Failed to fetch archive (status {resp.status})"
-                    )
-
-                html = await resp.text()
+        # First search for the URL
+        async with self._request(
+            "GET",
+            search_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            if resp.status != 200:
+                return ArchiveResult(
+                    url=url,
+                    original_url=url,
+                    html="",
+                    source="ghostarchive",
+                    cached_date=None,
+                    success=False,
+                    error=f"Search failed (status {resp.status})"
+                )
 
+            search_html = await self._read_capped(resp)
+
+            # Look for archive link in search results
+            # Ghostarchive links look like: /archive/xxxxx
+            match = _GHOSTARCHIVE_LINK_RE.search(search_html)
+            if not match:
+                return ArchiveResult(
+                    url=url,
+                    original_url=url,
+                    html="",
+                    source="ghostarchive",
+                    cached_date=None,
+                    success=False,
+                    error="No archive found"
+                )
+
+            archive_path = match.group(1)
+            archive_url = f"https://ghostarchive.org{archive_path}"
+
+        # Fetch the actual archived page
+        async with self._request(
+            "GET",
+            archive_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            if resp.status != 200:
                 return ArchiveResult(
                     url=archive_url,
                     original_url=url,
-                    html=html,
+                    html="",
                     source="ghostarchive",
-                    cached_date=None,  # Ghostarchive doesn't expose dates easily
-                    success=True
+                    cached_date=None,
+                    success=False,
+                    error=f"Failed to fetch archive (status {resp.status})"
                 )
 
+            html = await self._read_capped(resp)
+
+            return ArchiveResult(
+                url=archive_url,
+                original_url=url,
+                html=html,
+                source="ghostarchive",
+                cached_date=None,  # Ghostarchive doesn't expose dates easily
+                success=True
+            )
+
     async def _fetch_wayback(self, url: str) -> ArchiveResult:
         """
         Fetch from the Wayback Machine (Internet Archive).
@@ -296,95 +554,97 @@ class ArchiveService:
             f"https://web.archive.org/cdx/search/cdx"
             f"?url={quote(url, safe='')}"
             f"&output=json"
+            f"&fl=timestamp,original"  # Only the fields we use
             f"&limit=1"
             f"&sort=reverse"  # Most recent first
         )
 
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            # First, check if there's an archived version
-            async with session.get(
-                cdx_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as resp:
-                if resp.status != 200:
-                    return ArchiveResult(
-                        url=url,
-                        original_url=url,
-                        html="",
-                        source="wayback",
-                        cached_date=None,
-                        success=False,
-                        error=f"CDX API error (status {resp.status})"
-                    )
-
-                data = await resp.json()
-
-                # Response is [header, ...rows], need at least one row
-                if len(data) < 2:
-                    return ArchiveResult(
-                        url=url,
-                        original_url=url,
-                        html="",
-                        source="wayback",
-                        cached_date=None,
-                        success=False,
-                        error="No snapshots found"
-                    )
-
-                # Extract timestamp and URL from the most recent snapshot
-                # Format: [urlkey, timestamp, original, mimetype, statuscode, digest, length]
-                snapshot = data[1]
-                timestamp = snapshot[1]
-                original_url = snapshot[2]
-
-                # Parse the timestamp (format: YYYYMMDDHHmmss)
-                cached_date = self._parse_wayback_date(timestamp)
-
-                # Check if too old
-                if cached_date and self._is_too_old(cached_date):
-                    return ArchiveResult(
-                        url=url,
-                        original_url=url,
-                        html="",
-                        source="wayback",
-                        cached_date=cached_date,
-                        success=False,
-                        error="Cached version too old"
-                    )
-
-            # Fetch the actual archived page
-            archive_url = f"https://web.archive.org/web/{timestamp}id_/{original_url}"
-
-            async with session.get(
-                archive_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=True
-            ) as resp:
-                if resp.status != 200:
-                    return ArchiveResult(
-                        url=archive_url,
-                        original_url=url,
-                        html="",
-                        source="wayback",
-                        cached_date=cached_date,
-                        success=False,
-                        error=f"Failed to fetch archive (status {resp.status})"
-                    )
-
-                html = await resp.text()
-
-                # Remove Wayback Machine toolbar/banner
-                html = self._clean_wayback_html(html)
+        # First, check if there's an archived version
+        async with self._request(
+            "GET",
+            cdx_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as resp:
+            if resp.status != 200:
+                return ArchiveResult(
+                    url=url,
+                    original_url=url,
+                    html="",
+                    source="wayback",
+                    cached_date=None,
+                    success=False,
+                    error=f"CDX API error (status {resp.status})"
+                )
+
+            body = await resp.read()
+            # CDX answers an unknown URL with an empty body rather than []
+            data = _json_loads(body) if body.strip() else []
 
+            # Response is [header, ...rows], need at least one row
+            if len(data) < 2:
+                return ArchiveResult(
+                    url=url,
+                    original_url=url,
+                    html="",
+                    source="wayback",
+                    cached_date=None,
+                    success=False,
+                    error="No snapshots found"
+                )
+
+            # Extract timestamp and URL from the most recent snapshot
+            # Format: [timestamp, original] (see fl= above)
+            timestamp, original_url = data[1]
+
+            # Parse the timestamp (format: YYYYMMDDHHmmss)
+            cached_date = self._parse_wayback_date(timestamp)
+
+            # Check if too old
+            if cached_date and self._is_too_old(cached_date):
+                return ArchiveResult(
+                    url=url,
+                    original_url=url,
+                    html="",
+                    source="wayback",
+                    cached_date=cached_date,
+                    success=False,
+                    error="Cached version too old"
+                )
+
+        # Fetch the actual archived page
+        archive_url = f"https://web.archive.org/web/{timestamp}id_/{original_url}"
+
+        async with self._request(
+            "GET",
+            archive_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            if resp.status != 200:
                 return ArchiveResult(
                     url=archive_url,
                     original_url=url,
-                    html=html,
+                    html="",
                     source="wayback",
                     cached_date=cached_date,
-                    success=True
+                    success=False,
+                    error=f"Failed to fetch archive (status {resp.status})"
                 )
 
+            html = await self._read_capped(resp)
+
+            # Remove Wayback Machine toolbar/banner
+            html = self._clean_wayback_html(html)
+
+            return ArchiveResult(
+                url=archive_url,
+                original_url=url,
+                html=html,
+                source="wayback",
+                cached_date=cached_date,
+                success=True
+            )
+
     async def _fetch_google_cache(self, url: str) -> ArchiveResult:
         """
         Fetch from Google Cache.
@@ -394,49 +654,48 @@ class ArchiveService:
         """
         cache_url = f"https://webcache.googleusercontent.com/search?q=cache:{quote(url, safe='')}"
 
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.get(
-                cache_url,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                allow_redirects=True
-            ) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-
-                    # Try to extract cache date from Google's header
-                    cached_date = self._parse_google_cache_date(html)
-
-                    # Clean up Google's wrapper
-                    html = self._clean_google_cache_html(html)
-
-                    return ArchiveResult(
-                        url=cache_url,
-                        original_url=url,
-                        html=html,
-                        source="google_cache",
-                        cached_date=cached_date,
-                        success=True
-                    )
+        async with self._request(
+            "GET",
+            cache_url,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            allow_redirects=True
+        ) as resp:
+            if resp.status == 200:
+                html = await self._read_capped(resp)
+
+                # Try to extract cache date from Google's header
+                cached_date = self._parse_google_cache_date(html)
+
+                # Clean up Google's wrapper
+                html = self._clean_google_cache_html(html)
 
                 return ArchiveResult(
-                    url=url,
+                    url=cache_url,
                     original_url=url,
-                    html="",
+                    html=html,
                     source="google_cache",
-                    cached_date=None,
-                    success=False,
-                    error=f"Not in cache (status {resp.status})"
+                    cached_date=cached_date,
+                    success=True
                 )
 
+            return ArchiveResult(
+                url=url,
+                original_url=url,
+                html="",
+                source="google_cache",
+                cached_date=None,
+                success=False,
+                error=f"Not in cache (status {resp.status})"
+            )
+
     def _is_too_old(self, cached_date: datetime) -> bool:
         """Check if the cached date is older than the maximum allowed age."""
-        max_age = timedelta(days=self.max_age_days)
-        return datetime.now() - cached_date > max_age
+        return datetime.now() - cached_date > self._max_age
 
     def _parse_archive_today_date(self, url: str) -> datetime | None:
         """Extract the archive date from an archive.today URL."""
         # URL format: https://archive.today/2024.01.15-123456/...
-        match = re.search(r"archive\.\w+/(\d{4})\.(\d{2})\.(\d{2})", url)
+        match = _ARCHIVE_TODAY_DATE_RE.search(url)
         if match:
             try:
                 return datetime(
@@ -458,10 +717,7 @@ class ArchiveService:
     def _parse_google_cache_date(self, html: str) -> datetime | None:
         """Extract cache date from Google Cache header."""
         # Google includes text like "This is Google's cache of ... as retrieved on Jan 15, 2024"
-        match = re.search(
-            r"as retrieved on (\w+ \d+, \d{4})",
-            html[:2000]  # Only check the beginning
-        )
+        match = _GOOGLE_DATE_RE.search(html, 0, 2000)  # Only check the beginning
         if match:
             try:
                 return datetime.strptime(match.group(1), "%b %d, %Y")
@@ -471,46 +727,40 @@ class ArchiveService:
 
     def _clean_wayback_html(self, html: str) -> str:
         """Remove Wayback Machine toolbar and scripts from HTML."""
-        # Remove the Wayback banner/toolbar
-        html = re.sub(
-            r'<!-- BEGIN WAYBACK TOOLBAR INSERT -->.*?<!-- END WAYBACK TOOLBAR INSERT -->',
-            '',
-            html,
-            flags=re.DOTALL
-        )
+        # Remove the Wayback banner/toolbar by splicing between its markers
+        start = html.find(_WAYBACK_BANNER_START)
+        if start != -1:
+            end = html.find(_WAYBACK_BANNER_END, start)
+            if end != -1:
+                html = html[:start] + html[end + len(_WAYBACK_BANNER_END):]
 
-        # Remove Wayback-specific scripts
-        html = re.sub(
-            r'<script[^>]*src="[^"]*web\.archive\.org[^"]*"[^>]*>.*?</script>',
-            '',
-            html,
-            flags=re.DOTALL | re.IGNORECASE
-        )
+        # Remove Wayback-specific scripts (skip the scan when none can match)
+        if "web.archive.org" in html:
+            html = _WAYBACK_SCRIPT_RE.sub('', html)
 
         return html
 
     def _clean_google_cache_html(self, html: str) -> str:
         """Remove Google Cache header from HTML."""
-        # Remove Google's cache header div
-        html = re.sub(
-            r'<div[^>]*style="[^"]*background:#[^"]*"[^>]*>.*?</div>\s*<hr[^>]*>',
-            '',
-            html,
-            count=1,
-            flags=re.DOTALL | re.IGNORECASE
-        )
+        # Remove Google's cache header div (skip the scan when none can match)
+        if "background:#" in html:
+            html = _GOOGLE_HEADER_RE.sub('', html, count=1)
         return html
 
 
 # Global service instance
 _service: Optional[ArchiveService] = None
+_service_lock = threading.Lock()
 
 
 def get_archive_service() -> ArchiveService:
     """Get or create the global archive service instance."""
     global _service
+    # Double-checked so the lock is only taken on first use
     if _service is None:
-        _service = ArchiveService()
+        with _service_lock:
+            if _service is None:
+                _service = ArchiveService()
     return _service
 
 
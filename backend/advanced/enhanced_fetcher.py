@@ -16,16 +16,58 @@ Usage:
     result = await fetcher.fetch(url)
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlparse
 
+from ..cache import MemoryCache
 from ..fetcher import Fetcher, FetchResult
 from .js_renderer import JSRenderer, PLAYWRIGHT_AVAILABLE
 from .archive import ArchiveService
 
 logger = logging.getLogger(__name__)
 
+# Known JS-heavy sites
+_JS_HEAVY_DOMAINS = frozenset({
+    "medium.com",
+    "substack.com",
+    "bloomberg.com",
+    "reuters.com",
+    "twitter.com",
+    "x.com",
+})
+
+# Sites whose bot protection almost always defeats headless rendering
+_BOT_WALLED_DOMAINS = frozenset({
+    "wsj.com",
+    "ft.com",
+    "nytimes.com",
+    "barrons.com",
+    "economist.com",
+})
+
+# How long a host stays on the skip list after JS render hits a bot wall
+_JS_BLOCKED_TTL = 6 * 60 * 60
+
+
+def _hostname(url: str) -> str:
+    """Extract the lowercased hostname from a URL."""
+    return (urlparse(url).hostname or "").rstrip(".")
+
+
+def _host_in_domains(url: str, domains: frozenset[str]) -> bool:
+    """Check whether the URL's host is one of the domains or a subdomain of one."""
+    host = _hostname(url)
+    # Test the host and each parent suffix: a.b.example.com, b.example.com, ...
+    while host:
+        if host in domains:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
 
 @dataclass
 class EnhancedFetchResult(FetchResult):
@@ -44,6 +86,7 @@ class EnhancedFetcher:
     2. If content is insufficient or paywalled:
        a. If JS rendering enabled and content looks dynamic -> try JS render
        b. If archive enabled and content looks paywalled -> try archives
+       Both run concurrently (archives slightly delayed); first good result wins
     3. Return best result available
     """
 
@@ -54,7 +97,10 @@ class EnhancedFetcher:
         timeout: int = 30,
         min_content_length: int = 500,
         js_render_timeout: int = 30000,
+        js_render_profile_dir: str | None = None,
         archive_max_age_days: int = 30,
+        archive_hedge_delay: float = 1.0,
+        bot_walled_domains: frozenset[str] | None = None,
     ):
         """
         Initialize the enhanced fetcher.
@@ -65,24 +111,46 @@ class EnhancedFetcher:
             timeout: HTTP request timeout in seconds
             min_content_length: Minimum content length to consider valid
             js_render_timeout: Playwright timeout in milliseconds
+            js_render_profile_dir: Persistent browser profile directory
+                (None for pooled throwaway contexts)
             archive_max_age_days: Maximum age for archived content
+            archive_hedge_delay: Seconds to wait after starting a JS render
+                before also starting archive lookups
+            bot_walled_domains: Domains where JS rendering is skipped in
+                favor of archives (defaults to a built-in list)
         """
         self.enable_js_render = enable_js_render and PLAYWRIGHT_AVAILABLE
         self.enable_archive = enable_archive
         self.min_content_length = min_content_length
+        self.archive_hedge_delay = archive_hedge_delay
 
         # Core fetcher
         self._fetcher = Fetcher(
             timeout=timeout,
             min_content_length=min_content_length
         )
+        self._paywalled_domains = frozenset(self._fetcher.PAYWALLED_DOMAINS)
+
+        # Hosts where JS rendering is not worth a browser navigation: a static
+        # list plus hosts that recently served a bot-detection page to it
+        self._bot_walled_domains = (
+            _BOT_WALLED_DOMAINS if bot_walled_domains is None else frozenset(bot_walled_domains)
+        )
+        self._js_blocked_hosts = MemoryCache(max_size=512)
+
+        # HTML extraction on multi-MB rendered/archived pages is CPU-bound;
+        # run it off the event loop so other fetches keep making progress
+        self._extract_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="extract")
 
         # Advanced services (lazy initialized)
         self._js_renderer: Optional[JSRenderer] = None
         self._archive_service: Optional[ArchiveService] = None
 
         if self.enable_js_render:
-            self._js_renderer = JSRenderer(timeout=js_render_timeout)
+            self._js_renderer = JSRenderer(
+                timeout=js_render_timeout,
+                user_data_dir=js_render_profile_dir,
+            )
 
         if self.enable_archive:
             self._archive_service = ArchiveService(
@@ -99,6 +167,9 @@ class EnhancedFetcher:
         """Stop any running services."""
         if self._js_renderer:
             await self._js_renderer.stop()
+        if self._archive_service:
+            await self._archive_service.close()
+        self._extract_pool.shutdown(wait=False)
 
     async def fetch(
         self,
@@ -128,12 +199,21 @@ class EnhancedFetcher:
             return await self._fetch_with_js(url)
 
         # Strategy 3: Try simple fetch first
-        primary_fetch_failed = False
         try:
             result = await self._fetcher.fetch(url)
+        except Exception as e:
+            original_error = str(e)
+            result = None
+            logger.warning(f"Primary fetch failed for {url}: {e}")
 
+        # Classify the primary result once for all fallback decisions
+        primary_fetch_failed = result is None
+        content_len = 0 if primary_fetch_failed else len(result.content)
+        is_paywalled = not primary_fetch_failed and result.source == "paywalled"
+
+        if not primary_fetch_failed:
             # Check if we got good content
-            if self._is_good_content(result):
+            if not is_paywalled and content_len >= self.min_content_length:
                 return EnhancedFetchResult(
                     url=result.url,
                     title=result.title,
@@ -146,35 +226,48 @@ class EnhancedFetcher:
                 )
 
             # Content is insufficient or paywalled
-            original_error = f"Insufficient content ({len(result.content)} chars)"
-            if result.source == "paywalled":
+            if is_paywalled:
                 original_error = "Content appears paywalled"
+            else:
+                original_error = f"Insufficient content ({content_len} chars)"
+
+        is_blocked = content_len > 0 and self._is_bot_detection_page(result.content)
+
+        # Strategies 4 + 5: JS rendering and archives, hedged in parallel.
+        # JS render is tried if content looks like it needs it or the primary
+        # fetch failed completely (403, connection error, etc.); archives if
+        # content is paywalled, blocked, or the primary fetch failed. Archive
+        # lookups start after a short delay so a quick JS render wins.
+        tasks: list[asyncio.Task] = []
+        if (
+            self.enable_js_render
+            and (primary_fetch_failed or self._should_try_js_render(url, content_len))
+            and not self._is_js_render_blocked(url)
+        ):
+            tasks.append(asyncio.create_task(self._fetch_with_js(url)))
+        if self.enable_archive and (primary_fetch_failed or is_blocked or self._should_try_archive(url, is_paywalled)):
+            delay = self.archive_hedge_delay if tasks else 0.0
+            tasks.append(asyncio.create_task(self._fetch_from_archive(url, delay=delay)))
 
-        except Exception as e:
-            original_error = str(e)
-            result = None
-            primary_fetch_failed = True
-            logger.warning(f"Primary fetch failed for {url}: {e}")
-
-        # Strategy 4: Try JS rendering if content looks like it needs it
-        # Also try if primary fetch failed completely (403, connection error, etc.)
-        if self.enable_js_render and (primary_fetch_failed or self._should_try_js_render(result, url)):
-            js_result = await self._fetch_with_js(url)
-            if js_result.fallback_used:  # Means it succeeded
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                fallback_result = await next_done
+                if not fallback_result.fallback_used:  # Means it failed
+                    continue
                 # Check if JS render result is still a bot detection page
-                if not self._is_bot_detection_page(js_result.content):
-                    js_result.original_error = original_error
-                    return js_result
-                else:
-                    logger.info(f"JS render returned bot detection page for {url}, trying archive")
+                if (
+                    fallback_result.fallback_used == "js_render"
+                    and self._is_bot_detection_page(fallback_result.content)
+                ):
+                    logger.info(f"JS render returned bot detection page for {url}, waiting on archive")
                     original_error = "JS render blocked by bot detection"
-
-        # Strategy 5: Try archive if content is paywalled, blocked, or primary fetch failed
-        if self.enable_archive and (primary_fetch_failed or self._should_try_archive(result, url) or self._is_bot_detection_page(result.content if result else "")):
-            archive_result = await self._fetch_from_archive(url)
-            if archive_result.fallback_used:  # Means it succeeded
-                archive_result.original_error = original_error
-                return archive_result
+                    self._js_blocked_hosts.set(_hostname(url), True, ttl=_JS_BLOCKED_TTL)
+                    continue
+                fallback_result.original_error = original_error
+                return fallback_result
+        finally:
+            for task in tasks:
+                task.cancel()
 
         # Return whatever we have, even if it's not great
         if result:
@@ -224,7 +317,7 @@ class EnhancedFetcher:
                 )
 
             # Extract content from rendered HTML
-            fetch_result = self._fetcher._extract_content(
+            fetch_result = await self._extract_content(
                 render_result.final_url,
                 render_result.html
             )
@@ -261,8 +354,11 @@ class EnhancedFetcher:
                 original_error=str(e)
             )
 
-    async def _fetch_from_archive(self, url: str) -> EnhancedFetchResult:
-        """Fetch from archive services."""
+    async def _fetch_from_archive(self, url: str, delay: float = 0.0) -> EnhancedFetchResult:
+        """Fetch from archive services, optionally after a hedging delay."""
+        if delay:
+            await asyncio.sleep(delay)
+
         if not self._archive_service:
             return EnhancedFetchResult(
                 url=url,
@@ -285,7 +381,7 @@ class EnhancedFetcher:
                 )
 
             # Extract content from archived HTML
-            fetch_result = self._fetcher._extract_content(
+            fetch_result = await self._extract_content(
                 archive_result.url,
                 archive_result.html
             )
@@ -323,46 +419,44 @@ class EnhancedFetcher:
                 original_error=str(e)
             )
 
+    async def _extract_content(self, url: str, html: str) -> FetchResult:
+        """Run the core fetcher's extraction in the extraction thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._extract_pool,
+            self._fetcher._extract_content,
+            url,
+            html,
+        )
+
     def _is_good_content(self, result: FetchResult) -> bool:
         """Check if the fetch result has sufficient content."""
         if result.source == "paywalled":
             return False
         return len(result.content) >= self.min_content_length
 
-    def _should_try_js_render(self, result: Optional[FetchResult], url: str) -> bool:
+    def _should_try_js_render(self, url: str, content_len: int) -> bool:
         """Determine if we should try JS rendering."""
-        # Known JS-heavy sites
-        js_heavy_domains = [
-            "medium.com",
-            "substack.com",
-            "bloomberg.com",
-            "reuters.com",
-            "twitter.com",
-            "x.com",
-        ]
-
-        for domain in js_heavy_domains:
-            if domain in url.lower():
-                return True
+        if _host_in_domains(url, _JS_HEAVY_DOMAINS):
+            return True
 
         # If we got very little content, might be a JS-rendered site
-        if result and len(result.content) < 200:
-            return True
+        return content_len < 200
 
-        return False
+    def _is_js_render_blocked(self, url: str) -> bool:
+        """Check if the host is known to serve bot-detection pages to JS rendering."""
+        if _host_in_domains(url, self._bot_walled_domains):
+            return True
+        return self._js_blocked_hosts.get(_hostname(url)) is not None
 
-    def _should_try_archive(self, result: Optional[FetchResult], url: str) -> bool:
+    def _should_try_archive(self, url: str, is_paywalled: bool) -> bool:
         """Determine if we should try archive services."""
         # If content is flagged as paywalled
-        if result and result.source == "paywalled":
+        if is_paywalled:
             return True
 
         # Check known paywalled domains
-        for domain in self._fetcher.PAYWALLED_DOMAINS:
-            if domain in url.lower():
-                return True
-
-        return False
+        return _host_in_domains(url, self._paywalled_domains)
 
     def _is_bot_detection_page(self, content: str) -> bool:
         """Check if content is a bot detection/CAPTCHA page."""
@@ -11,7 +11,11 @@ Install with: pip install playwright && playwright install chromium
 """
 
 import asyncio
+import fcntl
 import logging
+import os
+import shutil
+import tempfile
 from dataclasses import dataclass
 from typing import Optional
 
@@ -19,13 +23,155 @@ logger = logging.getLogger(__name__)
 
 # Playwright is optional - only import if available
 try:
-    from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logger.info("Playwright not installed - JS rendering disabled")
 
 
+# Tracking/analytics domains never needed for content extraction
+_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "facebook.net",
+    "facebook.com/tr",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "quantserve.com",
+    "scorecardresearch.com",
+)
+
+# Images, media and fonts are never needed for content extraction
+_BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "mp4", "webm", "mp3",
+    "woff", "woff2", "ttf", "otf",
+)
+
+# Wildcard patterns enforced by the browser's network stack through
+# Network.setBlockedURLs, so blocked requests never reach Python. Extensions
+# are anchored to the end of the path (optionally followed by a query) so
+# hosts like www.giffgaff.com don't match and block the page itself.
+_BLOCKED_URL_PATTERNS = [
+    *(f"*.{ext}" for ext in _BLOCKED_EXTENSIONS),
+    *(f"*.{ext}?*" for ext in _BLOCKED_EXTENSIONS),
+    *(f"*{domain}*" for domain in _BLOCKED_DOMAINS),
+]
+
+# Injected once per pooled context to hide automation indicators
+_STEALTH_JS = """
+    // Override navigator.webdriver
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Override navigator.plugins to look like a real browser
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [
+            { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
+            { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+            { name: 'Native Client', filename: 'internal-nacl-plugin' }
+        ]
+    });
+
+    // Override navigator.languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    // Override permissions query
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    // Hide automation-related Chrome properties
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+
+    // Override console.debug to prevent detection via console
+    const originalDebug = console.debug;
+    console.debug = function(...args) {
+        if (args[0] && typeof args[0] === 'string' && args[0].includes('puppeteer')) {
+            return;
+        }
+        return originalDebug.apply(console, args);
+    };
+"""
+
+# Chromium flags shared by the pooled browser and the persistent profile
+_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-setuid-sandbox",
+    "--no-sandbox",
+    # Stealth args to avoid detection
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--window-size=1920,1080",
+    "--start-maximized",
+]
+
+# Context settings that make the headless browser look like desktop Chrome
+_CONTEXT_OPTIONS = {
+    "user_agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    ),
+    "viewport": {"width": 1920, "height": 1080},
+    "java_script_enabled": True,
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+    # Add realistic browser properties
+    "extra_http_headers": {
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Sec-Ch-Ua": '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"macOS"',
+    },
+}
+
+# True once any common article container is in the DOM
+_ARTICLE_READY_JS = (
+    "document.querySelector("
+    "\"article, [role='main'], .article-content, .story-body, .post-content, main\""
+    ") !== null"
+)
+
+# Scrolls down until the document stops growing (at most maxScrolls
+# times), then back to the top; scrolling up triggers no lazy loading
+_SCROLL_JS = """
+async (maxScrolls) => {
+    let lastHeight = 0;
+    for (let i = 0; i < maxScrolls; i++) {
+        window.scrollBy(0, window.innerHeight);
+        const height = document.body.scrollHeight;
+        if (height === lastHeight) break;
+        lastHeight = height;
+        await new Promise(resolve => setTimeout(resolve, 250));
+    }
+    window.scrollTo(0, 0);
+}
+"""
+
+# Removes non-content nodes before serializing the DOM
+_STRIP_SCRIPTS_JS = (
+    "document.querySelectorAll('script,style,link[rel=preload]')"
+    ".forEach(n => n.remove())"
+)
+
+
 @dataclass
 class RenderResult:
     """Result of rendering a page with JavaScript."""
@@ -41,7 +187,11 @@ class JSRenderer:
     Renders JavaScript-heavy pages using a headless browser.
 
     Uses Playwright with Chromium for reliable rendering.
-    Implements connection pooling to avoid browser startup overhead.
+    Keeps one browser and a pool of reusable contexts to avoid browser
+    startup and per-render context setup overhead. With a user_data_dir,
+    renders instead share one persistent context whose HTTP cache survives
+    across renders and restarts. Only one process can own the profile at a
+    time; other processes fall back to a throwaway temporary profile.
     """
 
     def __init__(
@@ -49,6 +199,10 @@ class JSRenderer:
         timeout: int = 45000,  # milliseconds - increased for slow sites
         scroll_to_load: bool = True,
         max_scrolls: int = 3,
+        max_contexts: int = 4,
+        context_max_uses: int = 50,
+        max_concurrency: int = 4,
+        user_data_dir: str | None = None,
     ):
         """
         Initialize the JS renderer.
@@ -57,14 +211,37 @@ class JSRenderer:
             timeout: Page load timeout in milliseconds
             scroll_to_load: Scroll page to trigger lazy loading
             max_scrolls: Maximum number of scroll iterations
+            max_contexts: Maximum number of pooled browser contexts
+            context_max_uses: Renders before a pooled context is recycled
+            max_concurrency: Maximum number of renders in flight at once
+            user_data_dir: Directory for a persistent browser profile,
+                shared across restarts. Disables pooling.
         """
         self.timeout = timeout
         self.scroll_to_load = scroll_to_load
         self.max_scrolls = max_scrolls
+        self.max_contexts = max_contexts
+        self.context_max_uses = context_max_uses
+        self.user_data_dir = user_data_dir
+        # Profile actually in use, and the lock file held on user_data_dir
+        # while this process owns it
+        self._profile_dir: str | None = None
+        self._profile_lock = None
 
         self._playwright = None
         self._browser: Optional["Browser"] = None
+        self._persistent: Optional["BrowserContext"] = None
+        # Guards browser startup only; renders run concurrently on the
+        # shared browser, bounded by the semaphore
         self._lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(max_concurrency)
+
+        # Pool of idle, pre-configured contexts; created on demand up to
+        # max_contexts and handed out to one render at a time. A None entry
+        # signals that a closed context freed a slot.
+        self._context_pool: asyncio.Queue["BrowserContext | None"] = asyncio.Queue()
+        self._context_uses: dict["BrowserContext", int] = {}
+        self._contexts_open = 0
 
     @property
     def is_available(self) -> bool:
@@ -72,46 +249,170 @@ class JSRenderer:
         return PLAYWRIGHT_AVAILABLE
 
     async def start(self) -> None:
-        """Start the browser instance."""
+        """Start the browser instance. Safe to call repeatedly."""
         if not PLAYWRIGHT_AVAILABLE:
             raise RuntimeError("Playwright is not installed. Run: pip install playwright && playwright install chromium")
 
+        if self._started:
+            return
+
         async with self._lock:
-            if self._browser is None:
-                self._playwright = await async_playwright().start()
+            if self._started:
+                return
+            self._playwright = await async_playwright().start()
+            if self.user_data_dir:
+                self._profile_dir = self._claim_profile()
+                try:
+                    self._persistent = await self._playwright.chromium.launch_persistent_context(
+                        self._profile_dir,
+                        headless=True,
+                        args=_LAUNCH_ARGS,
+                        **_CONTEXT_OPTIONS,
+                    )
+                except BaseException:
+                    self._release_profile()
+                    raise
+                await self._persistent.add_init_script(_STEALTH_JS)
+                logger.info(f"Started Playwright with persistent profile {self._profile_dir}")
+            else:
                 self._browser = await self._playwright.chromium.launch(
                     headless=True,
-                    args=[
-                        "--disable-gpu",
-                        "--disable-dev-shm-usage",
-                        "--disable-setuid-sandbox",
-                        "--no-sandbox",
-                        # Stealth args to avoid detection
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-infobars",
-                        "--window-size=1920,1080",
-                        "--start-maximized",
-                    ]
+                    args=_LAUNCH_ARGS,
                 )
                 logger.info("Started Playwright browser")
 
+    @property
+    def _started(self) -> bool:
+        return self._browser is not None or self._persistent is not None
+
+    def _claim_profile(self) -> str:
+        """
+        Lock user_data_dir and return the profile directory to launch with.
+
+        Chromium refuses to share a profile between processes, so when
+        another worker already holds the lock this process gets a temporary
+        profile that stop() deletes.
+        """
+        os.makedirs(self.user_data_dir, exist_ok=True)
+        lock = open(os.path.join(self.user_data_dir, ".renderer.lock"), "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            logger.info(f"Profile {self.user_data_dir} in use, using a temporary profile")
+            return tempfile.mkdtemp(prefix="js-renderer-")
+        self._profile_lock = lock
+        return os.path.join(self.user_data_dir, "profile")
+
+    def _release_profile(self) -> None:
+        """Unlock the shared profile, or delete the temporary one."""
+        profile_dir, self._profile_dir = self._profile_dir, None
+        lock, self._profile_lock = self._profile_lock, None
+        if lock is not None:
+            lock.close()  # closing the file drops the flock
+        elif profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
     async def stop(self) -> None:
         """Stop the browser instance."""
-        async with self._lock:
-            if self._browser:
-                await self._browser.close()
-                self._browser = None
-            if self._playwright:
-                await self._playwright.stop()
-                self._playwright = None
-                logger.info("Stopped Playwright browser")
-
-    async def render(self, url: str) -> RenderResult:
+        # Detach before awaiting so a repeated stop() is a no-op
+        browser, self._browser = self._browser, None
+        persistent, self._persistent = self._persistent, None
+        playwright, self._playwright = self._playwright, None
+
+        while not self._context_pool.empty():
+            if (context := self._context_pool.get_nowait()) is not None:
+                await self._close_context(context)
+        # Contexts still checked out are closed when their render ends
+        self._context_uses.clear()
+        self._contexts_open = 0
+
+        if browser:
+            await browser.close()
+        if persistent:
+            await persistent.close()
+        self._release_profile()
+        if playwright:
+            await playwright.stop()
+            logger.info("Stopped Playwright browser")
+
+    async def _build_context(self) -> "BrowserContext":
+        """
+        Create a browser context with stealth settings.
+
+        Init scripts registered on the context apply to every page later
+        opened in it, so this setup runs once per pooled context rather
+        than once per render.
+        """
+        context = await self._browser.new_context(**_CONTEXT_OPTIONS)
+
+        # Inject stealth scripts to hide automation indicators
+        await context.add_init_script(_STEALTH_JS)
+
+        return context
+
+    async def _acquire_context(self) -> "BrowserContext":
+        """Check out an idle pooled context, creating one if under the cap."""
+        if self._persistent is not None:
+            # Pages share the persistent context; the semaphore bounds them
+            return self._persistent
+        while True:
+            if self._context_pool.empty() and self._contexts_open < self.max_contexts:
+                # Claim the slot before awaiting so concurrent callers respect the cap
+                self._contexts_open += 1
+                try:
+                    context = await self._build_context()
+                except BaseException:
+                    self._contexts_open -= 1
+                    raise
+                self._context_uses[context] = 0
+                return context
+            context = await self._context_pool.get()
+            if context is not None:
+                return context
+            # None means a slot was freed; loop round to build a context
+
+    async def _release_context(self, context: "BrowserContext", discard: bool = False) -> None:
+        """Return a context to the pool, recycling it if worn out or broken."""
+        if context is self._persistent:
+            return
+        if context not in self._context_uses:
+            # Pool was torn down by stop() while this render was running
+            discard = True
+        else:
+            self._context_uses[context] += 1
+        if discard or self._context_uses[context] >= self.context_max_uses:
+            await self._close_context(context)
+        else:
+            self._context_pool.put_nowait(context)
+
+    async def _close_context(self, context: "BrowserContext") -> None:
+        """Close a context and free its pool slot."""
+        if self._context_uses.pop(context, None) is not None:
+            self._contexts_open -= 1
+            # Wake a caller blocked on an empty pool so it builds a
+            # replacement in the freed slot
+            self._context_pool.put_nowait(None)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+    async def render(
+        self,
+        url: str,
+        extract_selector: str | None = None,
+        strip_scripts: bool = False,
+    ) -> RenderResult:
         """
         Render a page and return the resulting HTML.
 
         Args:
             url: URL to render
+            extract_selector: If set, return only the outerHTML of the first
+                matching element (full page if nothing matches)
+            strip_scripts: Remove script, style and preload nodes before
+                serializing
 
         Returns:
             RenderResult with rendered HTML content
@@ -126,84 +427,41 @@ class JSRenderer:
             )
 
         # Ensure browser is started
-        if self._browser is None:
-            await self.start()
+        await self.start()
 
+        async with self._sem:
+            return await self._render(url, extract_selector, strip_scripts)
+
+    async def render_many(self, urls: list[str]) -> list[RenderResult]:
+        """
+        Render several pages concurrently.
+
+        Renders share the context pool and are bounded by max_concurrency,
+        so a batch takes roughly as long as its slowest pages rather than
+        the sum of all of them.
+
+        Args:
+            urls: URLs to render
+
+        Returns:
+            RenderResults in the same order as urls
+        """
+        return list(await asyncio.gather(*(self.render(url) for url in urls)))
+
+    async def _render(
+        self,
+        url: str,
+        extract_selector: str | None,
+        strip_scripts: bool,
+    ) -> RenderResult:
+        """Render a page on a pooled context. Caller holds the semaphore."""
+        context: Optional["BrowserContext"] = None
+        discard_context = False
         page: Optional["Page"] = None
         try:
-            # Create a new page/context for this request with stealth settings
-            context = await self._browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/122.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1920, "height": 1080},
-                java_script_enabled=True,
-                locale="en-US",
-                timezone_id="America/New_York",
-                # Add realistic browser properties
-                extra_http_headers={
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Sec-Ch-Ua": '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
-                    "Sec-Ch-Ua-Mobile": "?0",
-                    "Sec-Ch-Ua-Platform": '"macOS"',
-                },
-            )
-
+            context = await self._acquire_context()
             page = await context.new_page()
-
-            # Inject stealth scripts to hide automation indicators
-            await page.add_init_script("""
-                // Override navigator.webdriver
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-
-                // Override navigator.plugins to look like a real browser
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
-                        { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
-                        { name: 'Native Client', filename: 'internal-nacl-plugin' }
-                    ]
-                });
-
-                // Override navigator.languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-
-                // Override permissions query
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-
-                // Hide automation-related Chrome properties
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                    app: {}
-                };
-
-                // Override console.debug to prevent detection via console
-                const originalDebug = console.debug;
-                console.debug = function(...args) {
-                    if (args[0] && typeof args[0] === 'string' && args[0].includes('puppeteer')) {
-                        return;
-                    }
-                    return originalDebug.apply(console, args);
-                };
-            """)
-
-            # Block unnecessary resources to speed up loading
-            await page.route("**/*.{png,jpg,jpeg,gif,webp,svg,ico}", lambda route: route.abort())
-            await page.route("**/*", self._filter_requests)
+            await self._block_subresources(context, page)
 
             # Navigate to the page - use domcontentloaded for faster initial load
             # then wait for content to appear
@@ -218,28 +476,53 @@ class JSRenderer:
                     error="No response received"
                 )
 
-            # Wait for article content to load (try common selectors)
+            # Wait for article content to load (try common selectors in
+            # one native querySelector call)
             try:
-                await page.wait_for_selector(
-                    "article, [role='main'], .article-content, .story-body, .post-content, main",
+                await page.wait_for_function(
+                    _ARTICLE_READY_JS,
                     timeout=10000  # 10 seconds for content to appear
                 )
             except Exception:
-                # If no article selector found, just wait a bit
-                await page.wait_for_timeout(2000)
+                # No article selector; wait until the page has some text
+                # instead of sleeping a fixed interval
+                try:
+                    await page.wait_for_function(
+                        "document.body && document.body.innerText.length > 500",
+                        timeout=2000,
+                    )
+                except Exception:
+                    # Timed out, or the page re-navigated mid-wait
+                    pass
 
             # Scroll to trigger lazy loading
             if self.scroll_to_load:
                 await self._scroll_page(page)
 
-            # Wait a bit for any final rendering
-            await page.wait_for_timeout(1000)
+            # Let requests triggered by scrolling settle, but don't hold the
+            # render hostage to long-polling or analytics beacons
+            try:
+                await page.wait_for_load_state("networkidle", timeout=1500)
+            except PlaywrightTimeout:
+                pass
 
-            # Get the final HTML
-            html = await page.content()
-            final_url = page.url
+            if strip_scripts:
+                await page.evaluate(_STRIP_SCRIPTS_JS)
 
-            await context.close()
+            # Get the final HTML, serializing only the requested subtree
+            # when possible to keep the CDP payload small
+            html = None
+            if extract_selector:
+                try:
+                    html = await page.eval_on_selector(
+                        extract_selector, "el => el.outerHTML"
+                    )
+                except Exception:
+                    # Selector matched nothing; fall back to the full page
+                    pass
+            if not html:
+                html = await page.content()
+            final_url = page.url
 
             return RenderResult(
                 url=url,
@@ -259,6 +542,8 @@ class JSRenderer:
             )
         except Exception as e:
             logger.error(f"Error rendering {url}: {e}")
+            # The context may be in a bad state (e.g. crashed target)
+            discard_context = True
             return RenderResult(
                 url=url,
                 html="",
@@ -272,47 +557,18 @@ class JSRenderer:
                     await page.close()
                 except Exception:
                     pass
+            if context is not None:
+                await self._release_context(context, discard=discard_context)
 
-    async def _filter_requests(self, route) -> None:
-        """Filter out unnecessary requests to speed up rendering."""
-        url = route.request.url
-
-        # Block known tracking/analytics domains
-        blocked_domains = [
-            "google-analytics.com",
-            "googletagmanager.com",
-            "facebook.net",
-            "facebook.com/tr",
-            "doubleclick.net",
-            "googlesyndication.com",
-            "adservice.google.com",
-            "amazon-adsystem.com",
-            "quantserve.com",
-            "scorecardresearch.com",
-        ]
-
-        for domain in blocked_domains:
-            if domain in url:
-                await route.abort()
-                return
-
-        # Block font files (not needed for content extraction)
-        if any(ext in url for ext in [".woff", ".woff2", ".ttf", ".otf"]):
-            await route.abort()
-            return
-
-        await route.continue_()
+    async def _block_subresources(self, context: "BrowserContext", page: "Page") -> None:
+        """Block unnecessary resources natively in Chromium to speed up loading."""
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
 
     async def _scroll_page(self, page: "Page") -> None:
-        """Scroll the page to trigger lazy loading."""
-        for i in range(self.max_scrolls):
-            # Scroll down
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await page.wait_for_timeout(300)
-
-        # Scroll back to top
-        await page.evaluate("window.scrollTo(0, 0)")
-        await page.wait_for_timeout(200)
+        """Scroll the page to trigger lazy loading, in one round-trip."""
+        await page.evaluate(_SCROLL_JS, self.max_scrolls)
 
 
 # Global renderer instance
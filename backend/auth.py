@@ -10,19 +10,68 @@ Supports three authentication modes:
 """
 
 import secrets
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import APIKeyHeader
 
 from .config import config, get_db
+from .oauth import get_session_from_cookie
 
 if TYPE_CHECKING:
     from .database import Database
+    from .database.models import DBUser
 
 # Header name for the API key
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
+# Seconds between last-login writes for the same user
+LOGIN_TOUCH_INTERVAL = 60.0
+
+
+class AuthSettings(NamedTuple):
+    """Snapshot of the auth configuration read on every request."""
+    api_key: bytes
+    api_key_configured: bool
+    oauth_enabled: bool
+    admin_emails: frozenset[str]
+
+
+def load_auth_settings() -> AuthSettings:
+    """
+    Snapshot the auth configuration.
+
+    Called at import and again at application startup, so request handlers
+    read plain tuple fields instead of re-evaluating config properties.
+    Call again after changing auth settings on the config object.
+    """
+    global _settings
+    api_key = config.AUTH_API_KEY or ""
+    _settings = AuthSettings(
+        api_key=api_key.encode(),
+        api_key_configured=bool(api_key),
+        oauth_enabled=config.OAUTH_ENABLED,
+        admin_emails=frozenset(e.lower() for e in config.ADMIN_EMAILS or ()),
+    )
+    return _settings
+
+
+_settings = load_auth_settings()
+
+
+class CurrentUser(NamedTuple):
+    """Identity resolved by get_current_user, cached on request.state.user."""
+    id: int
+    email: str
+    provider: str | None
+
+
+def _api_key_matches(api_key: str) -> bool:
+    """Constant-time comparison against the configured key."""
+    raw = api_key.encode()
+    # Key length is not secret, so a mismatch can skip the digest compare
+    return len(raw) == len(_settings.api_key) and secrets.compare_digest(raw, _settings.api_key)
+
 
 def verify_api_key_only(api_key: str | None = Security(API_KEY_HEADER)) -> str:
     """
@@ -40,10 +89,8 @@ def verify_api_key_only(api_key: str | None = Security(API_KEY_HEADER)) -> str:
     Raises:
         HTTPException: If authentication is enabled and the key is missing or invalid
     """
-    configured_key = config.AUTH_API_KEY
-
     # If no auth key is configured, skip authentication (local dev mode)
-    if not configured_key:
+    if not _settings.api_key_configured:
         return ""
 
     # Auth is enabled - require valid key
@@ -55,7 +102,7 @@ def verify_api_key_only(api_key: str | None = Security(API_KEY_HEADER)) -> str:
         )
 
     # Use constant-time comparison to prevent timing attacks
-    if not secrets.compare_digest(api_key, configured_key):
+    if not _api_key_matches(api_key):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -88,8 +135,8 @@ def verify_api_key(
     Raises:
         HTTPException: If authentication fails
     """
-    api_key_configured = bool(config.AUTH_API_KEY)
-    oauth_configured = config.OAUTH_ENABLED
+    api_key_configured = _settings.api_key_configured
+    oauth_configured = _settings.oauth_enabled
 
     # No auth configured - allow all (dev mode)
     if not api_key_configured and not oauth_configured:
@@ -97,12 +144,11 @@ def verify_api_key(
 
     # Check API key first if provided
     if api_key and api_key_configured:
-        if secrets.compare_digest(api_key, config.AUTH_API_KEY):
+        if _api_key_matches(api_key):
             return api_key
 
     # Check OAuth session
     if oauth_configured:
-        from .oauth import get_session_from_cookie
         session = get_session_from_cookie(request)
         if session:
             return ""  # Authenticated via OAuth
@@ -167,31 +213,31 @@ def get_current_user(
     Raises:
         HTTPException: If authentication fails
     """
-    api_key_configured = bool(config.AUTH_API_KEY)
-    oauth_configured = config.OAUTH_ENABLED
+    api_key_configured = _settings.api_key_configured
+    oauth_configured = _settings.oauth_enabled
 
     # Check OAuth session first (most specific user identity)
     if oauth_configured:
-        from .oauth import get_session_from_cookie
         session = get_session_from_cookie(request)
         if session:
-            # Get or create user from OAuth session
-            user_id = db.users.get_or_create(
+            # Get or create user from OAuth session and record the login
+            user_id = db.users.get_or_create_and_touch(
                 email=session.email,
                 name=session.name,
-                provider=session.provider
+                provider=session.provider,
+                min_interval=LOGIN_TOUCH_INTERVAL,
             )
-            db.users.update_last_login(user_id)
+            request.state.user = CurrentUser(user_id, session.email, session.provider)
             return user_id
 
     # Check API key
     if api_key and api_key_configured:
-        if secrets.compare_digest(api_key, config.AUTH_API_KEY):
-            return db.users.get_or_create_api_user()
+        if _api_key_matches(api_key):
+            return _api_user(request, db)
 
     # Dev mode (no auth configured) - use shared API user
     if not api_key_configured and not oauth_configured:
-        return db.users.get_or_create_api_user()
+        return _api_user(request, db)
 
     # Authentication required but not provided
     if api_key_configured and not oauth_configured:
@@ -220,6 +266,31 @@ def get_current_user(
     )
 
 
+def _api_user(request: Request, db: "Database") -> int:
+    """Resolve the shared API user and cache its identity on the request."""
+    user_id = db.users.get_or_create_api_user()
+    request.state.user = CurrentUser(user_id, db.users.API_KEY_USER_EMAIL, "api_key")
+    return user_id
+
+
+def _lookup_user(
+    db: "Database", user_id: int, request: Request | None
+) -> "CurrentUser | DBUser | None":
+    """Return the identity cached by get_current_user, or load it."""
+    if request is not None:
+        cached = getattr(request.state, "user", None)
+        if cached is not None and cached.id == user_id:
+            return cached
+    return db.users.get_by_id(user_id)
+
+
+def _has_admin_access(user: "CurrentUser | DBUser") -> bool:
+    # API key users always have admin access
+    if user.provider == "api_key":
+        return True
+    return user.email.lower() in _settings.admin_emails
+
+
 def require_admin(
     request: Request,
     db: "Database" = Depends(get_db),
@@ -236,21 +307,18 @@ def require_admin(
     Returns:
         User ID if admin, raises 403 otherwise
     """
-    if not config.ADMIN_EMAILS:
+    # No admin list configured - skip the user lookup entirely
+    if not _settings.admin_emails:
         return user_id
 
-    user = db.users.get_by_id(user_id)
+    user = _lookup_user(db, user_id, request)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
         )
 
-    # API key users always have admin access
-    if user.provider == "api_key":
-        return user_id
-
-    if user.email.lower() in config.ADMIN_EMAILS:
+    if _has_admin_access(user):
         return user_id
 
     raise HTTPException(
@@ -259,13 +327,11 @@ def require_admin(
     )
 
 
-def is_admin_user(db: "Database", user_id: int) -> bool:
+def is_admin_user(db: "Database", user_id: int, request: Request | None = None) -> bool:
     """Check if a user has admin privileges (non-dependency helper)."""
-    if not config.ADMIN_EMAILS:
+    if not _settings.admin_emails:
         return True
-    user = db.users.get_by_id(user_id)
+    user = _lookup_user(db, user_id, request)
     if not user:
         return False
-    if user.provider == "api_key":
-        return True
-    return user.email.lower() in config.ADMIN_EMAILS
+    return _has_admin_access(user)
@@ -8,28 +8,65 @@ Provides:
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
+import functools
 import json
 import hashlib
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# orjson is optional - parses bytes directly and serializes much faster;
+# the files it writes are plain JSON either way
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, default=str).encode()
+
+    _json_loads = json.loads
+
+
+# Memoized: a miss followed by a set hashes the same key several times
+@functools.lru_cache(maxsize=4096)
+def _hash_key(key: str) -> str:
+    """Hash a cache key to its file name stem."""
+    # Same 16 hex chars as hexdigest()[:16] (existing files stay valid),
+    # without hex-encoding the whole 32-byte digest
+    return hashlib.sha256(key.encode()).digest()[:8].hex()
+
+
+# Distinguishes a miss from a cached falsy value (None, 0, "", [])
+_MISS = object()
+
+
+@dataclass(slots=True)
 class CacheEntry:
     key: str
     value: Any
-    created_at: datetime
-    expires_at: datetime | None
+    created_at: float  # time.monotonic() seconds
+    expires_at: float | None
 
 
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
 
     @abstractmethod
-    def get(self, key: str) -> Any | None:
-        """Get a value from cache."""
+    def get(self, key: str, default: Any = None) -> Any | None:
+        """Get a value from cache, or default if it isn't cached."""
         pass
 
     @abstractmethod
@@ -53,60 +90,49 @@ class MemoryCache(CacheBackend):
 
     def __init__(self, max_size: int = 256):
         self.max_size = max_size
-        self._cache: dict[str, CacheEntry] = {}
-        self._access_order: list[str] = []  # Track access order for LRU
-
-    def get(self, key: str) -> Any | None:
-        if key not in self._cache:
-            return None
+        # Insertion order doubles as LRU order: most recently used at the end
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
 
-        entry = self._cache[key]
+    def get(self, key: str, default: Any = None) -> Any | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return default
 
         # Check expiration
-        if entry.expires_at and entry.expires_at < datetime.now():
+        if entry.expires_at is not None and entry.expires_at < time.monotonic():
             self.delete(key)
-            return None
+            return default
 
-        # Update access order (move to end for LRU)
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+        # Mark as most recently used
+        self._cache.move_to_end(key)
 
         return entry.value
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        # Evict if at capacity
-        while len(self._cache) >= self.max_size and key not in self._cache:
-            self._evict_oldest()
-
-        expires_at = datetime.now() + timedelta(seconds=ttl) if ttl else None
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            # Evict if at capacity
+            while self._cache and len(self._cache) >= self.max_size:
+                self._evict_oldest()
 
+        now = time.monotonic()
         self._cache[key] = CacheEntry(
             key=key,
             value=value,
-            created_at=datetime.now(),
-            expires_at=expires_at
+            created_at=now,
+            expires_at=now + ttl if ttl else None
         )
 
-        # Update access order
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
-
     def delete(self, key: str) -> None:
         self._cache.pop(key, None)
-        if key in self._access_order:
-            self._access_order.remove(key)
 
     def clear(self) -> None:
         self._cache.clear()
-        self._access_order.clear()
 
     def _evict_oldest(self):
         """Evict least recently used entry."""
-        if self._access_order:
-            oldest_key = self._access_order.pop(0)
-            self._cache.pop(oldest_key, None)
+        self._cache.popitem(last=False)
 
     @property
     def size(self) -> int:
@@ -119,6 +145,7 @@ class DiskCache(CacheBackend):
     def __init__(self, cache_dir: Path, ttl_days: int = 30):
         self.cache_dir = cache_dir
         self.ttl_days = ttl_days
+        self._ttl_seconds = ttl_days * 86400
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _key_to_path(self, key: str) -> Path:
@@ -127,6 +154,10 @@ class DiskCache(CacheBackend):
         Keys like 'summary:http://...' go to cache_dir/summary/
         Keys like 'clustering:abc123' go to cache_dir/clustering/
         Keys without a prefix go to cache_dir/misc/
+
+        Within each type, files are sharded into up to 256 subdirectories by
+        the first two hex characters of the hash to keep directories small.
+        Directories are created on write, not here.
         """
         # Extract prefix from key (e.g., 'summary', 'clustering')
         if ":" in key:
@@ -134,55 +165,88 @@ class DiskCache(CacheBackend):
         else:
             prefix = "misc"
 
-        # Create subdirectory for this cache type
-        subdir = self.cache_dir / prefix
-        subdir.mkdir(parents=True, exist_ok=True)
+        hashed = _hash_key(key)
+        return self.cache_dir / prefix / hashed[:2] / f"{hashed}.json"
 
-        hashed = hashlib.sha256(key.encode()).hexdigest()[:16]
-        return subdir / f"{hashed}.json"
+    def _open(self, path: Path) -> BinaryIO | None:
+        """Open an entry, moving it from its pre-sharding location if needed."""
+        try:
+            return open(path, "rb")
+        except FileNotFoundError:
+            pass
 
-    def get(self, key: str) -> Any | None:
-        path = self._key_to_path(key)
-        if not path.exists():
+        legacy = path.parent.parent / path.name
+        try:
+            f = open(legacy, "rb")
+        except FileNotFoundError:
             return None
 
         try:
-            data = json.loads(path.read_text())
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(legacy, path)
+        except OSError:
+            pass
+        return f
+
+    def get(self, key: str, default: Any = None) -> Any | None:
+        path = self._key_to_path(key)
+        f = self._open(path)
+        if f is None:
+            return default
+
+        # Entries are never modified in place, so the file's mtime is its
+        # creation time; expired entries are dropped without being parsed
+        with f:
+            expired = time.time() - os.fstat(f.fileno()).st_mtime > self._ttl_seconds
+            raw = None if expired else f.read()
+        if expired:
+            path.unlink(missing_ok=True)
+            return default
+
+        try:
+            data = _json_loads(raw)
 
             # Verify key matches (handle hash collisions)
             if data.get("key") != key:
-                return None
-
-            # Check TTL
-            created = datetime.fromisoformat(data["created_at"])
-            if datetime.now() - created > timedelta(days=self.ttl_days):
-                path.unlink(missing_ok=True)
-                return None
+                return default
 
             return data["value"]
 
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError):
             # Corrupted cache file
             path.unlink(missing_ok=True)
-            return None
+            return default
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        data = {"key": key, "value": value}
+
+        try:
+            payload = _json_dumps(data)
+        except TypeError:
+            # Skip caching if value isn't JSON serializable
+            return
+
         path = self._key_to_path(key)
-        data = {
-            "key": key,
-            "value": value,
-            "created_at": datetime.now().isoformat()
-        }
 
+        # Write to a temp file in the same directory and rename over the
+        # target, so readers never see a partially written entry
+        tmp_path = None
         try:
-            path.write_text(json.dumps(data, default=str))
-        except (TypeError, IOError):
-            # Skip caching if value isn't JSON serializable or disk error
-            pass
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Skip caching on disk error
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
 
     def delete(self, key: str) -> None:
         path = self._key_to_path(key)
         path.unlink(missing_ok=True)
+        # Also drop an unmigrated pre-sharding copy so it can't resurface
+        (path.parent.parent / path.name).unlink(missing_ok=True)
 
     def clear(self, cache_type: str | None = None) -> None:
         """Clear cached files.
@@ -195,7 +259,7 @@ class DiskCache(CacheBackend):
             # Clear specific subdirectory
             subdir = self.cache_dir / cache_type
             if subdir.exists():
-                for file in subdir.glob("*.json"):
+                for file in subdir.glob("**/*.json"):
                     file.unlink(missing_ok=True)
         else:
             # Clear all subdirectories and root-level files
@@ -203,24 +267,52 @@ class DiskCache(CacheBackend):
                 file.unlink(missing_ok=True)
 
     def cleanup_expired(self) -> int:
-        """Remove expired cache entries. Returns count of removed entries."""
+        """Remove expired cache entries. Returns count of removed entries.
+
+        Entries are written once and never modified in place, so a file's
+        mtime is its creation time and the sweep needs only stat calls
+        rather than reading and parsing every file.
+        """
+        cutoff = time.time() - self._ttl_seconds
         removed = 0
-        # Search all subdirectories
-        for file in self.cache_dir.glob("**/*.json"):
+        for entry in self._scan(self.cache_dir):
             try:
-                data = json.loads(file.read_text())
-                created = datetime.fromisoformat(data["created_at"])
-                if datetime.now() - created > timedelta(days=self.ttl_days):
-                    file.unlink()
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
                     removed += 1
-            except (json.JSONDecodeError, KeyError, ValueError):
-                file.unlink(missing_ok=True)
-                removed += 1
+            except FileNotFoundError:
+                pass
         return removed
 
+    def _scan(self, directory: Path | str) -> Iterator[os.DirEntry]:
+        """Yield every cache file below a directory."""
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._scan(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry
+
 
 class TieredCache(CacheBackend):
-    """Two-tier cache: memory (fast) -> disk (persistent)."""
+    """Two-tier cache: memory (fast) -> disk (persistent).
+
+    Disk writes are write-behind: set() updates memory and queues the disk
+    write for a background thread, so callers don't wait on serialization
+    and file I/O. Call flush() to wait for queued writes and close() on
+    shutdown.
+    """
+
+    # Recent disk misses are remembered briefly so repeated lookups of
+    # not-yet-cached keys skip the filesystem; the TTL bounds how long a
+    # write by another process can go unseen
+    MISS_TTL = 60
+    # Disk hits are promoted to memory on the second read, so one-off
+    # scans don't push hot entries out of the memory tier
+    TRACKED_KEYS = 4096
+    # Queued disk operations; when full, set() drains the queue and writes
+    # synchronously instead
+    WRITE_QUEUE_SIZE = 1024
 
     def __init__(
         self,
@@ -230,28 +322,116 @@ class TieredCache(CacheBackend):
     ):
         self.memory = MemoryCache(max_size=memory_size)
         self.disk = DiskCache(cache_dir, ttl_days=ttl_days)
+        self._recent_misses = MemoryCache(max_size=self.TRACKED_KEYS)
+        self._disk_hits = MemoryCache(max_size=self.TRACKED_KEYS)
 
-    def get(self, key: str) -> Any | None:
+        # Values queued for disk, readable until written even if the memory
+        # tier has evicted them
+        self._pending: dict[str, Any] = {}
+        self._pending_lock = threading.Lock()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._writer: threading.Thread | None = None
+
+    def get(self, key: str, default: Any = None) -> Any | None:
         # Check memory first
-        if value := self.memory.get(key):
+        if (value := self.memory.get(key, _MISS)) is not _MISS:
             return value
 
+        with self._pending_lock:
+            if (value := self._pending.get(key, _MISS)) is not _MISS:
+                return value
+
+        if self._recent_misses.get(key):
+            return default
+
         # Fall back to disk
-        if value := self.disk.get(key):
-            # Promote to memory for faster subsequent access
-            self.memory.set(key, value)
+        if (value := self.disk.get(key, _MISS)) is not _MISS:
+            if self._disk_hits.get(key):
+                # Promote to memory for faster subsequent access
+                self._disk_hits.delete(key)
+                self.memory.set(key, value)
+            else:
+                self._disk_hits.set(key, True)
             return value
 
-        return None
+        self._recent_misses.set(key, True, ttl=self.MISS_TTL)
+        return default
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         # Store in both tiers
+        self._recent_misses.delete(key)
+        self._disk_hits.delete(key)
         self.memory.set(key, value, ttl)
-        self.disk.set(key, value, ttl)
+        with self._pending_lock:
+            self._pending[key] = value
+        if not self._enqueue(("set", key, value, ttl)):
+            # Drain first so an older queued write of the same key can't
+            # land after this one
+            self.flush()
+            self._write(("set", key, value, ttl))
 
     def delete(self, key: str) -> None:
+        self._disk_hits.delete(key)
         self.memory.delete(key)
-        self.disk.delete(key)
+        with self._pending_lock:
+            self._pending.pop(key, None)
+        # Queued behind any pending write of the same key, so it can't be
+        # resurrected by a write that lands after the delete
+        if not self._enqueue(("delete", key, None, None)):
+            self.flush()
+            self.disk.delete(key)
+
+    def flush(self) -> None:
+        """Wait until all queued disk writes have completed."""
+        self._write_queue.join()
+
+    def close(self) -> None:
+        """Flush queued writes and stop the writer thread."""
+        self.flush()
+        if self._writer is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _enqueue(self, op: tuple) -> bool:
+        """Queue a disk operation; returns False if the queue is full."""
+        if self._writer is None:
+            with self._pending_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._drain, name="cache-writer", daemon=True
+                    )
+                    self._writer.start()
+        try:
+            self._write_queue.put_nowait(op)
+            return True
+        except queue.Full:
+            return False
+
+    def _drain(self) -> None:
+        """Writer thread: apply queued disk operations in order."""
+        while (op := self._write_queue.get()) is not None:
+            try:
+                self._write(op)
+            except Exception:
+                # Keep the thread alive: flush() and close() wait on the queue
+                logger.exception("Cache write-behind failed for key %r", op[1])
+            finally:
+                self._write_queue.task_done()
+        self._write_queue.task_done()
+
+    def _write(self, op: tuple) -> None:
+        action, key, value, ttl = op
+        if action == "set":
+            try:
+                self.disk.set(key, value, ttl)
+            finally:
+                with self._pending_lock:
+                    # A newer set() may have replaced the value meanwhile
+                    if self._pending.get(key) is value:
+                        del self._pending[key]
+        else:
+            self.disk.delete(key)
 
     def clear(self, cache_type: str | None = None) -> None:
         """Clear cache.
@@ -260,6 +440,7 @@ class TieredCache(CacheBackend):
             cache_type: If specified, only clear this type (e.g., 'summary', 'clustering').
                        If None, clear all cache types.
         """
+        self.flush()
         if cache_type:
             # Clear only matching keys from memory
             keys_to_remove = [k for k in self.memory._cache if k.startswith(f"{cache_type}:")]
@@ -267,10 +448,12 @@ class TieredCache(CacheBackend):
                 self.memory.delete(key)
         else:
             self.memory.clear()
+        self._disk_hits.clear()
         self.disk.clear(cache_type)
 
     def cleanup_expired(self) -> int:
         """Remove expired disk cache entries."""
+        self.flush()
         return self.disk.cleanup_expired()
 
 
@@ -5,8 +5,12 @@ Groups articles by semantic topic using LLM to identify
 themes across titles and summaries.
 """
 
+import asyncio
+import functools
 import hashlib
 import json
+import re
+import struct
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -17,8 +21,62 @@ if TYPE_CHECKING:
     from .cache import TieredCache
     from .database import DBArticle
 
+# orjson is optional - parses the response several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+# Body of a markdown code block (```json ... ```); the closing fence may be
+# missing if the response was truncated
+_FENCE_RE = re.compile(r"```[\w-]*\s*(.*?)\s*(?:```|\Z)", re.S)
+
+_PROMPT_TEMPLATE = """Analyze these article titles and summaries. Group them into {min_clusters}-{max_clusters} specific topic clusters.
+
+Articles:
+{articles_text}
+
+Return your response as valid JSON with this exact structure:
+{{
+  "topics": [
+    {{"label": "Topic Name", "article_ids": [1, 2, 3]}}
+  ]
+}}
+
+Rules:
+- Create SPECIFIC, NARROW topics - not broad categories
+- BAD: "Technology" or "Politics" (too broad)
+- GOOD: "OpenAI GPT Models", "EU AI Regulation", "Tesla Earnings" (specific)
+- Each topic should ideally have 2-5 articles
+- If a topic would have 6+ articles, split it into more specific subtopics
+- Every article must be assigned to exactly one topic
+- Use short but specific topic labels (2-5 words)
+- If an article doesn't fit any group, put it in "Other" topic
+- Return ONLY the JSON, no other text"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_article_line(
+    article_id: int,
+    title: str,
+    summary_short: str | None,
+    content_head: str | None
+) -> str:
+    """Format one article for the clustering prompt.
+
+    Memoized because the same articles are re-clustered throughout a
+    session; every displayed field is part of the key, so edited articles
+    get a fresh line.
+    """
+    # Use summary if available, otherwise first part of content
+    description = summary_short or ""
+    if not description and content_head:
+        description = content_head + "..."
+    return f"[id={article_id}] \"{title}\" - {description}"
+
+
+@dataclass(slots=True)
 class Topic:
     """Represents a topic cluster."""
     id: str
@@ -26,7 +84,7 @@ class Topic:
     article_ids: list[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusteringResult:
     """Result of clustering operation."""
     topics: list[Topic]
@@ -75,60 +133,123 @@ class Clusterer:
             ClusteringResult with list of Topic objects
         """
         if len(articles) < 2:
-            # Not enough articles to cluster
-            return ClusteringResult(
-                topics=[Topic(
-                    id="all",
-                    label="All Articles",
-                    article_ids=[a.id for a in articles]
-                )],
-                cached=False
-            )
+            return self._single_topic(articles)
 
-        # Scale cluster count based on number of articles
-        # Aim for ~3-5 articles per cluster on average
-        num_articles = len(articles)
-        if min_clusters is None:
-            min_clusters = max(2, num_articles // 5)
-        if max_clusters is None:
-            max_clusters = max(min_clusters + 2, num_articles // 3, 10)
+        min_clusters, max_clusters = self._cluster_bounds(
+            len(articles), min_clusters, max_clusters
+        )
 
         # Generate cache key from article IDs
         cache_key = self._make_cache_key(articles)
 
         # Check cache first
         if self.cache:
-            cached = self.cache.get(cache_key)
-            if cached and isinstance(cached, dict):
-                topics = [
-                    Topic(
-                        id=t["id"],
-                        label=t["label"],
-                        article_ids=t["article_ids"]
-                    )
-                    for t in cached.get("topics", [])
-                ]
-                if topics:
-                    return ClusteringResult(topics=topics, cached=True)
+            cached = self._from_cached(self.cache.get(cache_key))
+            if cached:
+                return cached
 
         # Build prompt with article info
         prompt = self._build_prompt(articles, min_clusters, max_clusters)
 
-        # Use fast model for clustering (doesn't need complex reasoning)
-        model = self.provider.get_model_for_tier(ModelTier.FAST)
-
         # Call LLM with JSON mode if supported
-        response = self.provider.complete(
-            user_prompt=prompt,
-            model=model,
-            max_tokens=self.MAX_TOKENS,
-            json_mode=self.provider.capabilities.supports_json_mode,
-        )
+        response = self.provider.complete(**self._completion_args(prompt))
 
         # Parse response
         result = self._parse_response(response.text, articles)
+        self._store(cache_key, result)
+        return result
+
+    async def cluster_async(
+        self,
+        articles: list["DBArticle"],
+        min_clusters: int | None = None,
+        max_clusters: int | None = None
+    ) -> ClusteringResult:
+        """
+        Async version of cluster.
+
+        Awaits the provider's async completion instead of blocking an
+        executor thread for the LLM roundtrip.
+        """
+        if len(articles) < 2:
+            return self._single_topic(articles)
+
+        min_clusters, max_clusters = self._cluster_bounds(
+            len(articles), min_clusters, max_clusters
+        )
+        cache_key = self._make_cache_key(articles)
+
+        if self.cache:
+            # Only fall back to a thread when the lookup may touch disk
+            cached = self.cache.memory.get(cache_key)
+            if cached is None:
+                cached = await asyncio.to_thread(self.cache.get, cache_key)
+            cached = self._from_cached(cached)
+            if cached:
+                return cached
+
+        prompt = self._build_prompt(articles, min_clusters, max_clusters)
+        response = await self.provider.complete_async(**self._completion_args(prompt))
+
+        result = self._parse_response(response.text, articles)
+        # Disk writes are queued by the cache, so this doesn't block
+        self._store(cache_key, result)
+        return result
+
+    @staticmethod
+    def _single_topic(articles: list["DBArticle"]) -> ClusteringResult:
+        """Put all articles in one topic (too few to cluster, or bad response)."""
+        return ClusteringResult(
+            topics=[Topic(
+                id="all",
+                label="All Articles",
+                article_ids=[a.id for a in articles]
+            )],
+            cached=False
+        )
 
-        # Cache the result
+    @staticmethod
+    def _cluster_bounds(
+        num_articles: int,
+        min_clusters: int | None,
+        max_clusters: int | None
+    ) -> tuple[int, int]:
+        """Scale cluster count to aim for ~3-5 articles per cluster."""
+        if min_clusters is None:
+            min_clusters = max(2, num_articles // 5)
+        if max_clusters is None:
+            max_clusters = max(min_clusters + 2, num_articles // 3, 10)
+        return min_clusters, max_clusters
+
+    def _completion_args(self, prompt: str) -> dict:
+        """Arguments for the clustering completion call."""
+        return {
+            "user_prompt": prompt,
+            # Use fast model for clustering (doesn't need complex reasoning)
+            "model": self.provider.get_model_for_tier(ModelTier.FAST),
+            "max_tokens": self.MAX_TOKENS,
+            "json_mode": self.provider.capabilities.supports_json_mode,
+        }
+
+    @staticmethod
+    def _from_cached(cached) -> ClusteringResult | None:
+        """Rebuild a ClusteringResult from a cached value, if usable."""
+        if not cached or not isinstance(cached, dict):
+            return None
+        topics = [
+            Topic(
+                id=t["id"],
+                label=t["label"],
+                article_ids=t["article_ids"]
+            )
+            for t in cached.get("topics", [])
+        ]
+        if not topics:
+            return None
+        return ClusteringResult(topics=topics, cached=True)
+
+    def _store(self, cache_key: str, result: ClusteringResult) -> None:
+        """Cache a clustering result."""
         if self.cache and result.topics:
             self.cache.set(
                 cache_key,
@@ -145,13 +266,14 @@ class Clusterer:
                 ttl=self.CACHE_TTL
             )
 
-        return result
-
     def _make_cache_key(self, articles: list["DBArticle"]) -> str:
         """Generate cache key from sorted article IDs."""
         ids = sorted(a.id for a in articles)
-        id_str = ",".join(str(i) for i in ids)
-        hash_val = hashlib.sha256(id_str.encode()).hexdigest()[:16]
+        # Pack IDs as little-endian int64s: one contiguous buffer, no
+        # intermediate strings
+        hash_val = hashlib.blake2b(
+            struct.pack(f"<{len(ids)}q", *ids), digest_size=8
+        ).hexdigest()
         return f"clustering:{hash_val}"
 
     def _build_prompt(
@@ -161,42 +283,20 @@ class Clusterer:
         max_clusters: int
     ) -> str:
         """Build the clustering prompt."""
-        # Format articles for the prompt
-        article_lines = []
-        for article in articles:
-            # Use summary if available, otherwise first part of content
-            description = article.summary_short or ""
-            if not description and article.content:
-                description = article.content[:150] + "..."
-
-            article_lines.append(
-                f"[id={article.id}] \"{article.title}\" - {description}"
+        articles_text = "\n".join(
+            _format_article_line(
+                article.id,
+                article.title,
+                article.summary_short,
+                article.content[:150] if article.content else None,
             )
-
-        articles_text = "\n".join(article_lines)
-
-        return f"""Analyze these article titles and summaries. Group them into {min_clusters}-{max_clusters} specific topic clusters.
-
-Articles:
-{articles_text}
-
-Return your response as valid JSON with this exact structure:
-{{
-  "topics": [
-    {{"label": "Topic Name", "article_ids": [1, 2, 3]}}
-  ]
-}}
-
-Rules:
-- Create SPECIFIC, NARROW topics - not broad categories
-- BAD: "Technology" or "Politics" (too broad)
-- GOOD: "OpenAI GPT Models", "EU AI Regulation", "Tesla Earnings" (specific)
-- Each topic should ideally have 2-5 articles
-- If a topic would have 6+ articles, split it into more specific subtopics
-- Every article must be assigned to exactly one topic
-- Use short but specific topic labels (2-5 words)
-- If an article doesn't fit any group, put it in "Other" topic
-- Return ONLY the JSON, no other text"""
+            for article in articles
+        )
+        return _PROMPT_TEMPLATE.format(
+            min_clusters=min_clusters,
+            max_clusters=max_clusters,
+            articles_text=articles_text,
+        )
 
     def _parse_response(
         self,
@@ -204,36 +304,17 @@ Rules:
         articles: list["DBArticle"]
     ) -> ClusteringResult:
         """Parse LLM response into ClusteringResult."""
-        text = text.strip()
+        # Handle case where response has markdown code blocks
+        if match := _FENCE_RE.search(text):
+            text = match.group(1)
 
         # Try to extract JSON from response
         try:
-            # Handle case where response has markdown code blocks
-            if text.startswith("```"):
-                # Remove the opening ```json or ``` line
-                lines = text.split("\n", 1)
-                if len(lines) > 1:
-                    text = lines[1]
-                else:
-                    text = text[3:]  # Just strip ``` if no newline
-
-                # Remove closing ``` if present
-                if text.rstrip().endswith("```"):
-                    text = text.rstrip()[:-3]
-
-                text = text.strip()
-
-            data = json.loads(text)
-        except json.JSONDecodeError:
-            # Fallback: put all articles in one group
-            return ClusteringResult(
-                topics=[Topic(
-                    id="all",
-                    label="All Articles",
-                    article_ids=[a.id for a in articles]
-                )],
-                cached=False
-            )
+            data = _json_loads(text)
+        except ValueError:
+            # Fallback: put all articles in one group (orjson and json
+            # decode errors are both ValueErrors)
+            return self._single_topic(articles)
 
         # Parse topics from response
         topics: list[Topic] = []
@@ -269,24 +350,6 @@ Rules:
 
         return ClusteringResult(topics=topics, cached=False)
 
-    async def cluster_async(
-        self,
-        articles: list["DBArticle"],
-        min_clusters: int | None = None,
-        max_clusters: int | None = None
-    ) -> ClusteringResult:
-        """
-        Async version of cluster.
-
-        Note: Wraps sync call in executor for now.
-        """
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.cluster(articles, min_clusters, max_clusters)
-        )
-
 
 def create_clusterer(
     provider: LLMProvider,
@@ -85,6 +85,9 @@ class Config:
     ENABLE_JS_RENDER: bool = _parse_bool(os.getenv("ENABLE_JS_RENDER"), default=True)
     ENABLE_ARCHIVE: bool = _parse_bool(os.getenv("ENABLE_ARCHIVE"), default=True)
     JS_RENDER_TIMEOUT: int = int(os.getenv("JS_RENDER_TIMEOUT", "30000"))  # ms
+    # Persistent Chromium profile directory; keeps the HTTP cache warm across
+    # renders (empty = pooled throwaway contexts)
+    JS_RENDER_PROFILE_DIR: str = os.getenv("JS_RENDER_PROFILE_DIR", "")
     ARCHIVE_MAX_AGE_DAYS: int = int(os.getenv("ARCHIVE_MAX_AGE_DAYS", "30"))
 
     # OAuth Configuration
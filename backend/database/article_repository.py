@@ -4,6 +4,8 @@ Article repository - CRUD operations for articles.
 
 import json
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 
 from .connection import DatabaseConnection
 from .converters import row_to_article
@@ -26,6 +28,18 @@ class ArticleRepository:
         a.is_featured, a.featured_at, a.featured_by_user_id, a.featured_note
     """.strip()
 
+    # Same columns for list views, which never show the article body or full
+    # summary; leaving them out avoids copying large text out of SQLite
+    ARTICLE_LIST_COLUMNS = """
+        a.id, a.feed_id, a.url, a.title, a.author, NULL AS content, a.content_hash,
+        a.summary_short, NULL AS summary_full, a.key_points, a.model_used, a.summarized_at,
+        a.published_at, a.created_at, a.source_url, a.content_type, a.file_name,
+        a.file_path, a.reading_time_minutes, a.word_count, a.featured_image,
+        a.has_code_blocks, a.site_name, a.user_id, a.feed_name, a.related_links,
+        a.extracted_keywords, a.related_links_error, a.promoted_to_composer,
+        a.is_featured, a.featured_at, a.featured_by_user_id, a.featured_note
+    """.strip()
+
     def __init__(self, db: DatabaseConnection):
         self._db = db
 
@@ -46,22 +60,45 @@ class ArticleRepository:
         site_name: str | None = None,
     ) -> int | None:
         """Add a new article. Returns article ID or None if duplicate."""
+        return self.add_many([{
+            "feed_id": feed_id, "url": url, "title": title, "content": content,
+            "author": author, "published_at": published_at,
+            "content_hash": content_hash, "source_url": source_url,
+            "reading_time_minutes": reading_time_minutes, "word_count": word_count,
+            "featured_image": featured_image, "has_code_blocks": has_code_blocks,
+            "site_name": site_name,
+        }])[0]
+
+    def add_many(self, articles: list[dict]) -> list[int | None]:
+        """
+        Add several articles in one transaction (a single commit).
+
+        Each dict holds add()'s keyword arguments. Returns the new article IDs
+        in input order, with None for URLs that already exist.
+        """
+        if not articles:
+            return []
+        ids: list[int | None] = []
         with self._db.conn() as conn:
-            try:
-                cursor = conn.execute(
+            for article in articles:
+                published_at = article.get("published_at")
+                row = conn.execute(
                     """INSERT INTO articles
                        (feed_id, url, title, content, author, published_at, content_hash, source_url,
                         reading_time_minutes, word_count, featured_image, has_code_blocks, site_name)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (feed_id, url, title, content, author,
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(url) DO NOTHING
+                       RETURNING id""",
+                    (article["feed_id"], article["url"], article["title"],
+                     article.get("content"), article.get("author"),
                      published_at.isoformat() if published_at else None,
-                     content_hash, source_url,
-                     reading_time_minutes, word_count, featured_image, has_code_blocks, site_name)
-                )
-                return cursor.lastrowid
-            except Exception:
-                # Duplicate URL
-                return None
+                     article.get("content_hash"), article.get("source_url"),
+                     article.get("reading_time_minutes"), article.get("word_count"),
+                     article.get("featured_image"), article.get("has_code_blocks", False),
+                     article.get("site_name"))
+                ).fetchone()
+                ids.append(row["id"] if row else None)
+        return ids
 
     def get(self, article_id: int) -> DBArticle | None:
         """Get single article by ID (without user-specific state)."""
@@ -119,7 +156,8 @@ class ArticleRepository:
         summarized_only: bool | None = None,
         sort_by: str = "newest",
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        include_content: bool = True
     ) -> list[DBArticle]:
         """
         Get articles with optional filters, including per-user read/bookmark state.
@@ -133,14 +171,16 @@ class ArticleRepository:
             sort_by: Sort order
             limit: Maximum number of articles to return
             offset: Number of articles to skip
+            include_content: Load content and summary_full (None otherwise, for list views)
         """
+        columns = self.ARTICLE_COLUMNS if include_content else self.ARTICLE_LIST_COLUMNS
         # Join with user_article_state for per-user read/bookmark status
         # Also LEFT JOIN article_briefs for the sentence-length neutral brief used in list preview
         # Use COALESCE to default to 0 (unread) when no state record exists
         # Note: We use explicit column list (ARTICLE_COLUMNS) instead of a.* to avoid
         # column name conflicts with the old is_read/is_bookmarked columns in articles table
         query = f"""
-            SELECT {self.ARTICLE_COLUMNS},
+            SELECT {columns},
                    COALESCE(uas.is_read, 0) as is_read,
                    COALESCE(uas.is_bookmarked, 0) as is_bookmarked,
                    uas.read_at,
@@ -178,8 +218,9 @@ class ArticleRepository:
         params.extend([limit, offset])
 
         with self._db.conn() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [row_to_article(row) for row in rows]
+            # Convert while iterating the cursor rather than after fetchall(),
+            # so the raw rows are never all held in memory at once
+            return [row_to_article(row) for row in conn.execute(query, params)]
 
     def get_shared_since(
         self,
@@ -206,16 +247,14 @@ class ArticleRepository:
         params: list = [since.isoformat(), since.isoformat()]
 
         if feed_ids:
-            placeholders = ",".join("?" * len(feed_ids))
-            query += f" AND a.feed_id IN ({placeholders})"
-            params.extend(feed_ids)
+            query += " AND a.feed_id IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(feed_ids))
 
         query += " ORDER BY COALESCE(a.published_at, a.created_at) DESC LIMIT ?"
         params.append(limit)
 
         with self._db.conn() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [row_to_article(row) for row in rows]
+            return [row_to_article(row) for row in conn.execute(query, params)]
 
     def update_content(self, article_id: int, content: str):
         """Update article content."""
@@ -254,9 +293,10 @@ class ArticleRepository:
     ):
         """Update article summary."""
         with self._db.conn() as conn:
+            # json() validates and minifies in SQLite, so rows store compact JSON
             conn.execute(
                 """UPDATE articles SET
-                   summary_short = ?, summary_full = ?, key_points = ?,
+                   summary_short = ?, summary_full = ?, key_points = json(?),
                    model_used = ?, summarized_at = ?
                    WHERE id = ?""",
                 (summary_short, summary_full, json.dumps(key_points),
@@ -270,12 +310,13 @@ class ArticleRepository:
         """Fetch articles by IDs, preserving the given order. Missing IDs are silently skipped."""
         if not ids:
             return []
-        placeholders = ",".join("?" * len(ids))
         with self._db.conn() as conn:
-            rows = conn.execute(
-                f"SELECT * FROM articles WHERE id IN ({placeholders})", ids
-            ).fetchall()
-        article_map = {row["id"]: row_to_article(row) for row in rows}
+            article_map = {
+                row["id"]: row_to_article(row) for row in conn.execute(
+                    "SELECT * FROM articles WHERE id IN (SELECT value FROM json_each(?))",
+                    (json.dumps(ids),)
+                )
+            }
         return [article_map[i] for i in ids if i in article_map]
 
     def get_ids_for_archive(self, days: int) -> list[int]:
@@ -302,10 +343,10 @@ class ArticleRepository:
         """Return all article IDs belonging to any of the given feeds."""
         if not feed_ids:
             return []
-        placeholders = ",".join("?" * len(feed_ids))
         with self._db.conn() as conn:
             rows = conn.execute(
-                f"SELECT id FROM articles WHERE feed_id IN ({placeholders})", feed_ids
+                "SELECT id FROM articles WHERE feed_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(feed_ids),)
             ).fetchall()
             return [row["id"] for row in rows]
 
@@ -313,10 +354,10 @@ class ArticleRepository:
         """Return only the IDs from the given list that still exist in the database."""
         if not ids:
             return set()
-        placeholders = ",".join("?" * len(ids))
         with self._db.conn() as conn:
             rows = conn.execute(
-                f"SELECT id FROM articles WHERE id IN ({placeholders})", ids
+                "SELECT id FROM articles WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(ids),)
             ).fetchall()
             return {row["id"] for row in rows}
 
@@ -329,55 +370,52 @@ class ArticleRepository:
             else:
                 escaped = query.replace('"', '""')
                 fts_query = f'title: "{escaped}" OR content: "{escaped}"'
+            # rank is configured as weighted bm25 when the table is created
             rows = conn.execute("""
-                SELECT a.* FROM articles a
-                JOIN articles_fts fts ON a.id = fts.rowid
+                SELECT a.* FROM articles_fts fts
+                JOIN articles a ON a.id = fts.rowid
                 WHERE articles_fts MATCH ?
                 ORDER BY rank
                 LIMIT ?
-            """, (fts_query, limit)).fetchall()
+            """, (fts_query, limit))
             return [row_to_article(row) for row in rows]
 
     def get_duplicates(self) -> list[tuple[str, list[DBArticle]]]:
         """Find articles with duplicate content_hash across different feeds."""
+        # One pass: a window count finds the duplicated hashes, and ordering by
+        # hash keeps each group's rows contiguous for groupby
         with self._db.conn() as conn:
-            hash_rows = conn.execute("""
-                SELECT content_hash, COUNT(*) as cnt
-                FROM articles
-                WHERE content_hash IS NOT NULL AND content_hash != ''
-                GROUP BY content_hash
-                HAVING cnt > 1
-                ORDER BY cnt DESC
-            """).fetchall()
-
-            duplicates = []
-            for hash_row in hash_rows:
-                content_hash = hash_row["content_hash"]
-                article_rows = conn.execute(
-                    "SELECT * FROM articles WHERE content_hash = ? ORDER BY published_at DESC",
-                    (content_hash,)
-                ).fetchall()
-                articles = [row_to_article(row) for row in article_rows]
-                duplicates.append((content_hash, articles))
-
-            return duplicates
+            rows = conn.execute("""
+                SELECT * FROM (
+                    SELECT *, COUNT(*) OVER (PARTITION BY content_hash) AS dup_count
+                    FROM articles
+                    WHERE content_hash IS NOT NULL AND content_hash != ''
+                )
+                WHERE dup_count > 1
+                ORDER BY dup_count DESC, content_hash, published_at DESC
+            """)
+            return [
+                (content_hash, [row_to_article(row) for row in group])
+                for content_hash, group in groupby(rows, key=itemgetter("content_hash"))
+            ]
 
     def get_duplicate_ids(self) -> set[int]:
         """Get IDs of duplicate articles (keeping the oldest/first one)."""
-        duplicates = self.get_duplicates()
-        ids_to_hide = set()
-
-        for _, articles in duplicates:
-            if len(articles) <= 1:
-                continue
-            sorted_articles = sorted(
-                articles,
-                key=lambda a: a.published_at or a.created_at
-            )
-            for article in sorted_articles[1:]:
-                ids_to_hide.add(article.id)
-
-        return ids_to_hide
+        # datetime() normalizes published_at (ISO "T" separator) and the
+        # created_at default (space separator) so they compare correctly
+        with self._db.conn() as conn:
+            rows = conn.execute("""
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY content_hash
+                        ORDER BY datetime(COALESCE(published_at, created_at)), id
+                    ) AS rn
+                    FROM articles
+                    WHERE content_hash IS NOT NULL AND content_hash != ''
+                )
+                WHERE rn > 1
+            """)
+            return {row["id"] for row in rows}
 
     def archive_old(
         self,
@@ -410,57 +448,33 @@ class ArticleRepository:
         one_week_ago = (now - timedelta(days=7)).isoformat()
         one_month_ago = (now - timedelta(days=30)).isoformat()
 
+        # All counts in one scan of the shared articles; COALESCE(SUM(...), 0)
+        # because SUM over no rows is NULL
         with self._db.conn() as conn:
-            # Total shared articles
-            total = conn.execute(
-                "SELECT COUNT(*) as cnt FROM articles WHERE user_id IS NULL"
-            ).fetchone()["cnt"]
-
-            # Unread articles for this user
-            unread = conn.execute("""
-                SELECT COUNT(*) as cnt FROM articles a
-                LEFT JOIN user_article_state uas
-                    ON uas.article_id = a.id AND uas.user_id = ?
-                WHERE a.user_id IS NULL
-                  AND COALESCE(uas.is_read, 0) = 0
-            """, (user_id,)).fetchone()["cnt"]
-
-            # Bookmarked articles for this user
-            bookmarked = conn.execute("""
-                SELECT COUNT(*) as cnt FROM articles a
+            row = conn.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    COALESCE(SUM(COALESCE(uas.is_read, 0) = 0), 0) as unread,
+                    COALESCE(SUM(COALESCE(uas.is_bookmarked, 0) = 1), 0) as bookmarked,
+                    COALESCE(SUM(COALESCE(a.published_at, a.created_at) >= :week), 0) as last_week,
+                    COALESCE(SUM(COALESCE(a.published_at, a.created_at) >= :month
+                                 AND COALESCE(a.published_at, a.created_at) < :week), 0) as last_month,
+                    COALESCE(SUM(COALESCE(a.published_at, a.created_at) < :month), 0) as older_than_month,
+                    MIN(COALESCE(a.published_at, a.created_at)) as oldest
+                FROM articles a
                 LEFT JOIN user_article_state uas
-                    ON uas.article_id = a.id AND uas.user_id = ?
+                    ON uas.article_id = a.id AND uas.user_id = :user_id
                 WHERE a.user_id IS NULL
-                  AND COALESCE(uas.is_bookmarked, 0) = 1
-            """, (user_id,)).fetchone()["cnt"]
-
-            last_week = conn.execute(
-                "SELECT COUNT(*) as cnt FROM articles WHERE user_id IS NULL AND (published_at >= ? OR (published_at IS NULL AND created_at >= ?))",
-                (one_week_ago, one_week_ago)
-            ).fetchone()["cnt"]
-
-            last_month = conn.execute(
-                "SELECT COUNT(*) as cnt FROM articles WHERE user_id IS NULL AND (published_at >= ? OR (published_at IS NULL AND created_at >= ?)) AND (published_at < ? OR (published_at IS NULL AND created_at < ?))",
-                (one_month_ago, one_month_ago, one_week_ago, one_week_ago)
-            ).fetchone()["cnt"]
-
-            older_than_month = conn.execute(
-                "SELECT COUNT(*) as cnt FROM articles WHERE user_id IS NULL AND (published_at < ? OR (published_at IS NULL AND created_at < ?))",
-                (one_month_ago, one_month_ago)
-            ).fetchone()["cnt"]
-
-            oldest = conn.execute(
-                "SELECT MIN(COALESCE(published_at, created_at)) as oldest FROM articles WHERE user_id IS NULL"
-            ).fetchone()["oldest"]
+            """, {"user_id": user_id, "week": one_week_ago, "month": one_month_ago}).fetchone()
 
             return {
-                "total": total,
-                "unread": unread,
-                "bookmarked": bookmarked,
-                "last_week": last_week,
-                "last_month": last_month,
-                "older_than_month": older_than_month,
-                "oldest_article": oldest
+                "total": row["total"],
+                "unread": row["unread"],
+                "bookmarked": row["bookmarked"],
+                "last_week": row["last_week"],
+                "last_month": row["last_month"],
+                "older_than_month": row["older_than_month"],
+                "oldest_article": row["oldest"]
             }
 
     # Note: get_unread_count has been moved to UserArticleStateRepository
@@ -472,13 +486,14 @@ class ArticleRepository:
         limit: int = 100
     ) -> dict[str, list[DBArticle]]:
         """Get articles grouped by date (YYYY-MM-DD)."""
-        articles = self.get_many(user_id=user_id, unread_only=unread_only, limit=limit)
+        articles = self.get_many(
+            user_id=user_id, unread_only=unread_only, limit=limit, include_content=False
+        )
         grouped: dict[str, list[DBArticle]] = {}
         for article in articles:
-            date_key = (article.published_at or article.created_at).strftime("%Y-%m-%d")
-            if date_key not in grouped:
-                grouped[date_key] = []
-            grouped[date_key].append(article)
+            # date().isoformat() is YYYY-MM-DD, several times cheaper than strftime
+            date_key = (article.published_at or article.created_at).date().isoformat()
+            grouped.setdefault(date_key, []).append(article)
         return grouped
 
     def feature(
@@ -532,15 +547,14 @@ class ArticleRepository:
             ).fetchall()
             if overflow_rows:
                 ids = [row["id"] for row in overflow_rows]
-                placeholders = ",".join("?" * len(ids))
                 conn.execute(
-                    f"""UPDATE articles
+                    """UPDATE articles
                         SET is_featured = 0,
                             featured_at = NULL,
                             featured_by_user_id = NULL,
                             featured_note = NULL
-                        WHERE id IN ({placeholders})""",
-                    ids,
+                        WHERE id IN (SELECT value FROM json_each(?))""",
+                    (json.dumps(ids),),
                 )
             return True
 
@@ -577,10 +591,10 @@ class ArticleRepository:
         limit: int = 100
     ) -> dict[int, list[DBArticle]]:
         """Get articles grouped by feed ID."""
-        articles = self.get_many(user_id=user_id, unread_only=unread_only, limit=limit)
+        articles = self.get_many(
+            user_id=user_id, unread_only=unread_only, limit=limit, include_content=False
+        )
         grouped: dict[int, list[DBArticle]] = {}
         for article in articles:
-            if article.feed_id not in grouped:
-                grouped[article.feed_id] = []
-            grouped[article.feed_id].append(article)
+            grouped.setdefault(article.feed_id, []).append(article)
         return grouped
@@ -2,39 +2,130 @@
 Database connection management and schema initialization.
 """
 
+import queue
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
 
+# Per-connection settings; SQLite forgets these when a connection closes
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",  # Faster writes, still safe with WAL
+    "PRAGMA cache_size = -64000",  # 64MB cache (negative = KB)
+    "PRAGMA temp_store = MEMORY",  # Store temp tables in memory
+    "PRAGMA mmap_size = 268435456",  # 256MB memory-mapped I/O
+    "PRAGMA busy_timeout = 5000",  # Wait up to 5s for a writer instead of failing
+)
+
+
 class DatabaseConnection:
-    """Manages database connection and schema."""
+    """Manages database connection and schema.
+
+    Connections are pooled and reused rather than opened per operation, so
+    the page cache and compiled statements stay warm between calls. Each
+    connection is used by one caller at a time.
+    """
+
+    # Idle connections kept open; extra concurrent callers open their own
+    # connection, which is closed instead of pooled when they finish
+    POOL_SIZE = 8
+
+    # Compiled statements kept per connection, keyed by SQL text. The
+    # repositories have well over the default 128 distinct queries, which
+    # would otherwise evict each other
+    STATEMENT_CACHE_SIZE = 256
+
+    # Stored in PRAGMA user_version once _migrate_columns has run, so later
+    # startups skip the per-column table_info checks
+    SCHEMA_VERSION = 1
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # LIFO so the most recently used (warmest) connection is reused first
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=self.POOL_SIZE)
+        self._enable_wal()
         self._init_schema()
 
-    @contextmanager
-    def conn(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection with row factory and performance optimizations."""
+    def _enable_wal(self):
+        """Switch the database file to WAL mode.
+
+        The journal mode is stored in the database file, so this only needs
+        to run once rather than on every connection. WAL allows concurrent
+        reads during writes.
+        """
         connection = sqlite3.connect(self.db_path)
+        try:
+            connection.execute("PRAGMA journal_mode = WAL")
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with row factory and performance optimizations."""
+        # Pooled connections are handed between threads, one user at a time
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
         connection.row_factory = sqlite3.Row
-        # Enable foreign key constraints
-        connection.execute("PRAGMA foreign_keys = ON")
-        # Performance optimizations for better concurrency and throughput
-        connection.execute("PRAGMA journal_mode = WAL")  # Allow concurrent reads during writes
-        connection.execute("PRAGMA synchronous = NORMAL")  # Faster writes, still safe with WAL
-        connection.execute("PRAGMA cache_size = -64000")  # 64MB cache (negative = KB)
-        connection.execute("PRAGMA temp_store = MEMORY")  # Store temp tables in memory
-        connection.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped I/O
+        for pragma in _CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    @contextmanager
+    def conn(self) -> Iterator[sqlite3.Connection]:
+        """Get a database connection; commits on success, rolls back on error."""
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+
         try:
             yield connection
             connection.commit()
-        finally:
+        except BaseException:
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                # Unusable connection; don't return it to the pool
+                connection.close()
+                raise
+            self._release(connection)
+            raise
+        self._release(connection)
+
+    def _release(self, connection: sqlite3.Connection):
+        """Return a connection to the pool, or close it if the pool is full."""
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
             connection.close()
 
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def optimize(self):
+        """Refresh query planner statistics and merge FTS index segments."""
+        with self.conn() as connection:
+            connection.execute("PRAGMA optimize")
+            connection.execute("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')")
+
+    def vacuum(self):
+        """Rebuild the database file to reclaim space left by deleted rows."""
+        with self.conn() as connection:
+            # VACUUM cannot run inside a transaction
+            connection.commit()
+            connection.execute("VACUUM")
+            connection.execute("REINDEX")
+
     def _init_schema(self):
         """Initialize database schema."""
         with self.conn() as connection:
@@ -97,9 +188,13 @@ class DatabaseConnection:
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_articles_feed ON articles(feed_id);
-                CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at DESC);
-                -- Composite index for efficient feed+date queries
-                CREATE INDEX IF NOT EXISTS idx_articles_feed_published ON articles(feed_id, published_at DESC);
+                -- Match the default list order (newest first, ties by created_at) so
+                -- article lists read the index in order instead of sorting.
+                -- These replace the published_at-only indexes of older versions.
+                DROP INDEX IF EXISTS idx_articles_published;
+                DROP INDEX IF EXISTS idx_articles_feed_published;
+                CREATE INDEX IF NOT EXISTS idx_articles_order ON articles(published_at DESC, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_articles_feed_order ON articles(feed_id, published_at DESC, created_at DESC);
                 -- Note: is_read/is_bookmarked indexes are now on user_article_state
                 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
                 CREATE INDEX IF NOT EXISTS idx_user_article_state_user ON user_article_state(user_id);
@@ -110,29 +205,36 @@ class DatabaseConnection:
                 CREATE INDEX IF NOT EXISTS idx_user_article_state_composite ON user_article_state(user_id, article_id, is_read);
             """)
 
-            # Create FTS5 virtual table if it doesn't exist
+            # Create (or upgrade) the FTS5 virtual table
             result = connection.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='articles_fts'"
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name='articles_fts'"
             ).fetchone()
 
-            if not result:
+            if not result or "prefix=" not in result[0]:
+                # Tables from older versions lack the prefix index and stemming
+                # tokenizer; FTS5 options are fixed at creation, so rebuild.
                 connection.executescript("""
+                    DROP TRIGGER IF EXISTS articles_ai;
+                    DROP TRIGGER IF EXISTS articles_au;
+                    DROP TRIGGER IF EXISTS articles_ad;
+                    DROP TABLE IF EXISTS articles_fts;
+
                     CREATE VIRTUAL TABLE articles_fts USING fts5(
                         title,
                         content,
                         summary_full,
                         content='articles',
-                        content_rowid='id'
+                        content_rowid='id',
+                        prefix='2 3 4',
+                        tokenize='porter unicode61 remove_diacritics 2'
                     );
+                    INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');
 
-                    CREATE TRIGGER articles_ai AFTER INSERT ON articles BEGIN
-                        INSERT INTO articles_fts(rowid, title, content, summary_full)
-                        VALUES (new.id, new.title, new.content, new.summary_full);
-                    END;
+                    -- Rank title matches above summaries, summaries above body text
+                    INSERT INTO articles_fts(articles_fts, rank)
+                    VALUES ('rank', 'bm25(10.0, 1.0, 2.0)');
 
-                    CREATE TRIGGER articles_au AFTER UPDATE ON articles BEGIN
-                        INSERT INTO articles_fts(articles_fts, rowid, title, content, summary_full)
-                        VALUES ('delete', old.id, old.title, old.content, old.summary_full);
+                    CREATE TRIGGER articles_ai AFTER INSERT ON articles BEGIN
                         INSERT INTO articles_fts(rowid, title, content, summary_full)
                         VALUES (new.id, new.title, new.content, new.summary_full);
                     END;
@@ -142,38 +244,13 @@ class DatabaseConnection:
                         VALUES ('delete', old.id, old.title, old.content, old.summary_full);
                     END;
                 """)
+            self._migrate_fts_update_trigger(connection)
+
+            # Column migrations; skipped once the file records the current version
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version < self.SCHEMA_VERSION:
+                self._migrate_columns(connection)
 
-            # Migrations
-            self._migrate_add_column(connection, "articles", "source_url", "TEXT")
-            self._migrate_add_column(connection, "articles", "content_type", "TEXT")
-            self._migrate_add_column(connection, "articles", "file_name", "TEXT")
-            self._migrate_add_column(connection, "articles", "file_path", "TEXT")
-            self._migrate_add_column(connection, "articles", "reading_time_minutes", "INTEGER")
-            self._migrate_add_column(connection, "articles", "word_count", "INTEGER")
-            self._migrate_add_column(connection, "articles", "featured_image", "TEXT")
-            self._migrate_add_column(connection, "articles", "has_code_blocks", "BOOLEAN DEFAULT FALSE")
-            self._migrate_add_column(connection, "articles", "site_name", "TEXT")
-
-            # Multi-user support: add user_id to articles for library item ownership
-            # RSS articles have user_id = NULL (shared), library items have user_id set
-            self._migrate_add_column(connection, "articles", "user_id", "INTEGER REFERENCES users(id) ON DELETE CASCADE")
-
-            # Store original feed name for archived articles (when feed is deleted but article is preserved)
-            self._migrate_add_column(connection, "articles", "feed_name", "TEXT")
-
-            # Related links feature (Exa neural search)
-            self._migrate_add_column(connection, "articles", "related_links", "TEXT")
-            self._migrate_add_column(connection, "articles", "extracted_keywords", "TEXT")
-            self._migrate_add_column(connection, "articles", "related_links_error", "TEXT")
-
-            # Composer integration: timestamp when article was promoted to Composer
-            self._migrate_add_column(connection, "articles", "promoted_to_composer", "TIMESTAMP")
-
-            # Featured (admin-curated, globally visible). Capped at 32 by application logic.
-            self._migrate_add_column(connection, "articles", "is_featured", "BOOLEAN DEFAULT FALSE")
-            self._migrate_add_column(connection, "articles", "featured_at", "TIMESTAMP")
-            self._migrate_add_column(connection, "articles", "featured_by_user_id", "INTEGER REFERENCES users(id) ON DELETE SET NULL")
-            self._migrate_add_column(connection, "articles", "featured_note", "TEXT")
             connection.execute(
                 "CREATE INDEX IF NOT EXISTS idx_articles_featured ON articles(is_featured, featured_at DESC)"
             )
@@ -323,6 +400,107 @@ class DatabaseConnection:
             # This handles databases that were created before multi-user support was added
             self._migrate_article_state_to_user_state(connection)
 
+            # Runs after the state migration so migrated rows are counted by the backfill
+            self._init_unread_counters(connection)
+
+            if version < self.SCHEMA_VERSION:
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _init_unread_counters(self, conn: sqlite3.Connection):
+        """
+        Maintain per-feed article counts and per-user read counts with triggers.
+
+        A feed's unread count for a user is feeds.article_count minus that
+        user's feed_read_counts.read_count, so feed lists no longer scan and
+        group every article. The counters are backfilled once, when the
+        table is first created.
+        """
+        needs_backfill = not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='feed_read_counts'"
+        ).fetchone()
+
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS feed_read_counts (
+                user_id    INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                feed_id    INTEGER NOT NULL REFERENCES feeds(id) ON DELETE CASCADE,
+                read_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, feed_id)
+            ) WITHOUT ROWID;
+        """)
+
+        if needs_backfill:
+            conn.executescript("""
+                UPDATE feeds SET article_count = (
+                    SELECT COUNT(*) FROM articles a WHERE a.feed_id = feeds.id
+                );
+
+                INSERT INTO feed_read_counts (user_id, feed_id, read_count)
+                SELECT uas.user_id, a.feed_id, COUNT(*)
+                FROM user_article_state uas
+                JOIN articles a ON a.id = uas.article_id
+                WHERE COALESCE(uas.is_read, 0) != 0
+                GROUP BY uas.user_id, a.feed_id;
+            """)
+
+        conn.executescript("""
+            -- Article counts per feed
+            CREATE TRIGGER IF NOT EXISTS feed_count_ai AFTER INSERT ON articles BEGIN
+                UPDATE feeds SET article_count = article_count + 1 WHERE id = new.feed_id;
+            END;
+
+            -- Before the delete, so read state is still present when a
+            -- cascade removes it (the state trigger below can then no longer
+            -- find the article and leaves the counter alone)
+            CREATE TRIGGER IF NOT EXISTS feed_count_bd BEFORE DELETE ON articles BEGIN
+                UPDATE feeds SET article_count = article_count - 1 WHERE id = old.feed_id;
+                UPDATE feed_read_counts SET read_count = read_count - 1
+                WHERE feed_id = old.feed_id AND user_id IN (
+                    SELECT user_id FROM user_article_state
+                    WHERE article_id = old.id AND COALESCE(is_read, 0) != 0
+                );
+            END;
+
+            -- Articles move between feeds when archived on feed deletion
+            CREATE TRIGGER IF NOT EXISTS feed_count_au AFTER UPDATE OF feed_id ON articles
+            WHEN old.feed_id != new.feed_id BEGIN
+                UPDATE feeds SET article_count = article_count - 1 WHERE id = old.feed_id;
+                UPDATE feeds SET article_count = article_count + 1 WHERE id = new.feed_id;
+                UPDATE feed_read_counts SET read_count = read_count - 1
+                WHERE feed_id = old.feed_id AND user_id IN (
+                    SELECT user_id FROM user_article_state
+                    WHERE article_id = new.id AND COALESCE(is_read, 0) != 0
+                );
+                INSERT INTO feed_read_counts (user_id, feed_id, read_count)
+                SELECT user_id, new.feed_id, 1 FROM user_article_state
+                WHERE article_id = new.id AND COALESCE(is_read, 0) != 0
+                ON CONFLICT(user_id, feed_id) DO UPDATE SET read_count = read_count + 1;
+            END;
+
+            -- Read counts per user and feed
+            CREATE TRIGGER IF NOT EXISTS read_count_ai AFTER INSERT ON user_article_state
+            WHEN COALESCE(new.is_read, 0) != 0 BEGIN
+                INSERT INTO feed_read_counts (user_id, feed_id, read_count)
+                SELECT new.user_id, feed_id, 1 FROM articles WHERE id = new.article_id
+                ON CONFLICT(user_id, feed_id) DO UPDATE SET read_count = read_count + 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS read_count_au AFTER UPDATE OF is_read ON user_article_state
+            WHEN (COALESCE(old.is_read, 0) != 0) != (COALESCE(new.is_read, 0) != 0) BEGIN
+                INSERT INTO feed_read_counts (user_id, feed_id, read_count)
+                SELECT new.user_id, feed_id,
+                       CASE WHEN COALESCE(new.is_read, 0) != 0 THEN 1 ELSE -1 END
+                FROM articles WHERE id = new.article_id
+                ON CONFLICT(user_id, feed_id) DO UPDATE SET read_count = read_count + excluded.read_count;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS read_count_ad AFTER DELETE ON user_article_state
+            WHEN COALESCE(old.is_read, 0) != 0 BEGIN
+                UPDATE feed_read_counts SET read_count = read_count - 1
+                WHERE user_id = old.user_id
+                  AND feed_id = (SELECT feed_id FROM articles WHERE id = old.article_id);
+            END;
+        """)
+
     def _migrate_article_state_to_user_state(self, conn: sqlite3.Connection):
         """
         Migrate is_read/is_bookmarked from articles table to user_article_state.
@@ -373,15 +551,94 @@ class DatabaseConnection:
               AND user_id IS NULL
         """)
 
+    def _migrate_fts_update_trigger(self, conn: sqlite3.Connection):
+        """
+        Reindex an article in FTS only when an indexed column changes.
+
+        Older databases have an articles_au trigger that fires on every
+        UPDATE, so summaries, source URLs and featured flags rewrote the
+        article's FTS entry too. Replace it with a column-scoped trigger.
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='trigger' AND name='articles_au'"
+        ).fetchone()
+        if row and "UPDATE OF" in row[0]:
+            return
+
+        conn.executescript("""
+            DROP TRIGGER IF EXISTS articles_au;
+            CREATE TRIGGER articles_au AFTER UPDATE OF title, content, summary_full ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, content, summary_full)
+                VALUES ('delete', old.id, old.title, old.content, old.summary_full);
+                INSERT INTO articles_fts(rowid, title, content, summary_full)
+                VALUES (new.id, new.title, new.content, new.summary_full);
+            END;
+        """)
+
+    def _migrate_columns(self, conn: sqlite3.Connection):
+        """Add columns introduced after a table was first created.
+
+        Bump SCHEMA_VERSION when adding a call here so existing databases
+        run it on their next startup.
+        """
+        # Each table's columns are read once and shared by all the checks,
+        # and the ALTERs share one transaction (DDL would otherwise autocommit)
+        known: dict[str, set[str]] = {}
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+
+        self._migrate_add_column(conn, known, "articles", "source_url", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "content_type", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "file_name", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "file_path", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "reading_time_minutes", "INTEGER")
+        self._migrate_add_column(conn, known, "articles", "word_count", "INTEGER")
+        self._migrate_add_column(conn, known, "articles", "featured_image", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "has_code_blocks", "BOOLEAN DEFAULT FALSE")
+        self._migrate_add_column(conn, known, "articles", "site_name", "TEXT")
+
+        # Multi-user support: add user_id to articles for library item ownership
+        # RSS articles have user_id = NULL (shared), library items have user_id set
+        self._migrate_add_column(conn, known, "articles", "user_id", "INTEGER REFERENCES users(id) ON DELETE CASCADE")
+
+        # Store original feed name for archived articles (when feed is deleted but article is preserved)
+        self._migrate_add_column(conn, known, "articles", "feed_name", "TEXT")
+
+        # Related links feature (Exa neural search)
+        self._migrate_add_column(conn, known, "articles", "related_links", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "extracted_keywords", "TEXT")
+        self._migrate_add_column(conn, known, "articles", "related_links_error", "TEXT")
+
+        # Composer integration: timestamp when article was promoted to Composer
+        self._migrate_add_column(conn, known, "articles", "promoted_to_composer", "TIMESTAMP")
+
+        # Featured (admin-curated, globally visible). Capped at 32 by application logic.
+        self._migrate_add_column(conn, known, "articles", "is_featured", "BOOLEAN DEFAULT FALSE")
+        self._migrate_add_column(conn, known, "articles", "featured_at", "TIMESTAMP")
+        self._migrate_add_column(conn, known, "articles", "featured_by_user_id", "INTEGER REFERENCES users(id) ON DELETE SET NULL")
+        self._migrate_add_column(conn, known, "articles", "featured_note", "TEXT")
+
+        # Trigger-maintained article totals (see _init_unread_counters)
+        self._migrate_add_column(conn, known, "feeds", "article_count", "INTEGER NOT NULL DEFAULT 0")
+        conn.commit()
+
     def _migrate_add_column(
         self,
         conn: sqlite3.Connection,
+        known: dict[str, set[str]],
         table: str,
         column: str,
         column_type: str
     ):
-        """Add a column to a table if it doesn't exist."""
-        cursor = conn.execute(f"PRAGMA table_info({table})")
-        columns = [row[1] for row in cursor.fetchall()]
+        """Add a column to a table if it doesn't exist.
+
+        known caches each table's column names between calls.
+        """
+        columns = known.get(table)
+        if columns is None:
+            columns = known[table] = {
+                row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+            }
         if column not in columns:
             conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            columns.add(column)
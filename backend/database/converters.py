@@ -17,6 +17,13 @@ from .models import (
     DBUserArticleState,
 )
 
+# orjson is optional - decodes key_points several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def parse_datetime(value: str | None, default: datetime | None = None) -> datetime | None:
     """
@@ -37,74 +44,64 @@ def parse_datetime(value: str | None, default: datetime | None = None) -> dateti
         return default
 
 
+def _to_int(value) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
 def row_to_article(row: sqlite3.Row) -> DBArticle:
     """Convert a database row to a DBArticle."""
+    # Optional columns depend on the query (JOINed user state, briefs, chat
+    # flag) and may be missing in older databases. Looking them up in a dict
+    # avoids raising IndexError from sqlite3.Row for every absent column.
+    get = dict(zip(row.keys(), row)).get
+
     key_points = None
-    if row["key_points"]:
+    if get("key_points"):
         try:
-            key_points = json.loads(row["key_points"])
-        except json.JSONDecodeError:
+            key_points = _json_loads(get("key_points"))
+        except ValueError:
+            # json and orjson decode errors are both ValueErrors
             pass
 
-    published_at = parse_datetime(row["published_at"])
-    created_at = parse_datetime(row["created_at"], default=datetime.now())
-
-    # Handle optional columns - may not exist in older databases during migration
-    def safe_get(col: str) -> str | None:
-        try:
-            return row[col]
-        except (IndexError, KeyError):
-            return None
-
-    def safe_get_int(col: str) -> int | None:
-        try:
-            val = row[col]
-            return int(val) if val is not None else None
-        except (IndexError, KeyError, ValueError, TypeError):
-            return None
-
-    def safe_get_bool(col: str) -> bool:
-        try:
-            return bool(row[col])
-        except (IndexError, KeyError):
-            return False
-
     return DBArticle(
-        id=row["id"],
-        feed_id=row["feed_id"],
-        url=row["url"],
-        title=row["title"],
-        content=row["content"],
-        summary_short=row["summary_short"],
-        summary_full=row["summary_full"],
+        id=get("id"),
+        feed_id=get("feed_id"),
+        url=get("url"),
+        title=get("title"),
+        content=get("content"),
+        summary_short=get("summary_short"),
+        summary_full=get("summary_full"),
         key_points=key_points,
         # is_read/is_bookmarked come from user_article_state via JOIN, may not be present
-        is_read=safe_get_bool("is_read"),
-        is_bookmarked=safe_get_bool("is_bookmarked"),
-        published_at=published_at,
-        created_at=created_at,
-        source_url=safe_get("source_url"),
-        content_type=safe_get("content_type"),
-        file_name=safe_get("file_name"),
-        file_path=safe_get("file_path"),
-        author=safe_get("author"),
-        reading_time_minutes=safe_get_int("reading_time_minutes"),
-        word_count=safe_get_int("word_count"),
-        featured_image=safe_get("featured_image"),
-        has_code_blocks=safe_get_bool("has_code_blocks"),
-        site_name=safe_get("site_name"),
-        user_id=safe_get_int("user_id"),
-        feed_name=safe_get("feed_name"),
-        related_links=safe_get("related_links"),
-        extracted_keywords=safe_get("extracted_keywords"),
-        related_links_error=safe_get("related_links_error"),
-        promoted_to_composer=parse_datetime(safe_get("promoted_to_composer")),
-        brief=safe_get("brief"),
-        has_chat=safe_get_bool("has_chat"),
-        is_featured=safe_get_bool("is_featured"),
-        featured_at=parse_datetime(safe_get("featured_at")),
-        featured_by_user_id=safe_get_int("featured_by_user_id"),
-        featured_note=safe_get("featured_note"),
+        is_read=bool(get("is_read")),
+        is_bookmarked=bool(get("is_bookmarked")),
+        published_at=parse_datetime(get("published_at")),
+        created_at=parse_datetime(get("created_at"), default=datetime.now()),
+        source_url=get("source_url"),
+        content_type=get("content_type"),
+        file_name=get("file_name"),
+        file_path=get("file_path"),
+        author=get("author"),
+        reading_time_minutes=_to_int(get("reading_time_minutes")),
+        word_count=_to_int(get("word_count")),
+        featured_image=get("featured_image"),
+        has_code_blocks=bool(get("has_code_blocks")),
+        site_name=get("site_name"),
+        user_id=_to_int(get("user_id")),
+        feed_name=get("feed_name"),
+        related_links=get("related_links"),
+        extracted_keywords=get("extracted_keywords"),
+        related_links_error=get("related_links_error"),
+        promoted_to_composer=parse_datetime(get("promoted_to_composer")),
+        brief=get("brief"),
+        has_chat=bool(get("has_chat")),
+        is_featured=bool(get("is_featured")),
+        featured_at=parse_datetime(get("featured_at")),
+        featured_by_user_id=_to_int(get("featured_by_user_id")),
+        featured_note=get("featured_note"),
     )
 
 
@@ -5,7 +5,7 @@ This class maintains backwards compatibility with the original monolithic Databa
 while delegating to specialized repositories internally.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -47,6 +47,9 @@ class Database:
     STANDALONE_FEED_URL = LibraryRepository.STANDALONE_FEED_URL
     STANDALONE_FEED_NAME = LibraryRepository.STANDALONE_FEED_NAME
 
+    # Minimum time between full VACUUMs run by maintenance()
+    VACUUM_INTERVAL = timedelta(days=7)
+
     def __init__(self, db_path: Path):
         self._connection = DatabaseConnection(db_path)
         self._search: "SearchIndex | None" = None
@@ -83,6 +86,26 @@ class Database:
         """Attach the Tantivy search index. Called once after startup rebuild."""
         self._search = search
 
+    def close(self):
+        """Close pooled database connections. Called on shutdown."""
+        self._connection.close()
+
+    def maintenance(self) -> bool:
+        """
+        Optimize the database; VACUUM too if VACUUM_INTERVAL has passed.
+
+        Deleting feeds removes many articles at once, leaving free pages
+        and fragmented FTS segments behind. Returns True if a VACUUM ran.
+        """
+        self._connection.optimize()
+
+        last_vacuum = self.settings.get("last_vacuum_at")
+        if last_vacuum and datetime.now() - datetime.fromisoformat(last_vacuum) < self.VACUUM_INTERVAL:
+            return False
+        self._connection.vacuum()
+        self.settings.set("last_vacuum_at", datetime.now().isoformat())
+        return True
+
     # ─────────────────────────────────────────────────────────────
     # Feed operations (delegated to FeedRepository)
     # ─────────────────────────────────────────────────────────────
@@ -232,6 +255,17 @@ class Database:
             self._search.add(article_id, feed_id, title, content, None, None)
         return article_id
 
+    def add_articles(self, articles: list[dict]) -> list[int | None]:
+        """Add several articles in one transaction. See ArticleRepository.add_many."""
+        article_ids = self.articles.add_many(articles)
+        if self._search:
+            self._search.add_many([
+                (article_id, article["feed_id"], article["title"], article.get("content"), None, None)
+                for article_id, article in zip(article_ids, articles)
+                if article_id
+            ])
+        return article_ids
+
     def get_articles(
         self,
         user_id: int,
@@ -242,7 +276,8 @@ class Database:
         summarized_only: bool | None = None,
         sort_by: str = "newest",
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        include_content: bool = True
     ) -> list[DBArticle]:
         return self.articles.get_many(
             user_id=user_id,
@@ -254,6 +289,7 @@ class Database:
             sort_by=sort_by,
             limit=limit,
             offset=offset,
+            include_content=include_content,
         )
 
     def feature_article(self, article_id: int, user_id: int, note: str | None = None) -> bool:
@@ -2,6 +2,7 @@
 Feed repository - CRUD operations for feeds.
 """
 
+import json
 from datetime import datetime
 
 from .connection import DatabaseConnection
@@ -28,24 +29,19 @@ class FeedRepository:
         """Get single feed by ID with optional user-specific unread count."""
         with self._db.conn() as conn:
             if user_id is not None:
+                # Unread = articles in feed minus those this user has read;
+                # both counts are maintained by triggers
                 row = conn.execute(
-                    """SELECT f.*,
-                       COUNT(CASE WHEN COALESCE(uas.is_read, FALSE) = FALSE THEN 1 END) as unread_count
+                    """SELECT f.*, f.article_count - COALESCE(rc.read_count, 0) as unread_count
                        FROM feeds f
-                       LEFT JOIN articles a ON f.id = a.feed_id
-                       LEFT JOIN user_article_state uas ON a.id = uas.article_id AND uas.user_id = ?
-                       WHERE f.id = ?
-                       GROUP BY f.id""",
+                       LEFT JOIN feed_read_counts rc ON rc.feed_id = f.id AND rc.user_id = ?
+                       WHERE f.id = ?""",
                     (user_id, feed_id)
                 ).fetchone()
             else:
                 # Without user_id, count all articles as unread (no state)
                 row = conn.execute(
-                    """SELECT f.*, COUNT(a.id) as unread_count
-                       FROM feeds f
-                       LEFT JOIN articles a ON f.id = a.feed_id
-                       WHERE f.id = ?
-                       GROUP BY f.id""",
+                    "SELECT f.*, f.article_count as unread_count FROM feeds f WHERE f.id = ?",
                     (feed_id,)
                 ).fetchone()
             return row_to_feed(row) if row else None
@@ -55,25 +51,20 @@ class FeedRepository:
         with self._db.conn() as conn:
             if user_id is not None:
                 rows = conn.execute("""
-                    SELECT f.*,
-                           COUNT(CASE WHEN COALESCE(uas.is_read, FALSE) = FALSE THEN 1 END) as unread_count
+                    SELECT f.*, f.article_count - COALESCE(rc.read_count, 0) as unread_count
                     FROM feeds f
-                    LEFT JOIN articles a ON f.id = a.feed_id
-                    LEFT JOIN user_article_state uas ON a.id = uas.article_id AND uas.user_id = ?
+                    LEFT JOIN feed_read_counts rc ON rc.feed_id = f.id AND rc.user_id = ?
                     WHERE f.url NOT LIKE 'archive://%'
-                    GROUP BY f.id
                     ORDER BY f.name
-                """, (user_id,)).fetchall()
+                """, (user_id,))
             else:
                 # Without user_id, count all articles as unread
                 rows = conn.execute("""
-                    SELECT f.*, COUNT(a.id) as unread_count
+                    SELECT f.*, f.article_count as unread_count
                     FROM feeds f
-                    LEFT JOIN articles a ON f.id = a.feed_id
                     WHERE f.url NOT LIKE 'archive://%'
-                    GROUP BY f.id
                     ORDER BY f.name
-                """).fetchall()
+                """)
             return [row_to_feed(row) for row in rows]
 
     def update(
@@ -84,13 +75,24 @@ class FeedRepository:
         clear_category: bool = False
     ):
         """Update feed details. Use clear_category=True to remove category."""
+        sets: list[str] = []
+        params: list = []
+        if name is not None:
+            sets.append("name = ?")
+            params.append(name)
+        if clear_category:
+            sets.append("category = NULL")
+        elif category is not None:
+            sets.append("category = ?")
+            params.append(category)
+        if not sets:
+            return
+
         with self._db.conn() as conn:
-            if name is not None:
-                conn.execute("UPDATE feeds SET name = ? WHERE id = ?", (name, feed_id))
-            if clear_category:
-                conn.execute("UPDATE feeds SET category = NULL WHERE id = ?", (feed_id,))
-            elif category is not None:
-                conn.execute("UPDATE feeds SET category = ? WHERE id = ?", (category, feed_id))
+            conn.execute(
+                f"UPDATE feeds SET {', '.join(sets)} WHERE id = ?",
+                (*params, feed_id)
+            )
 
     def update_fetched(self, feed_id: int, error: str | None = None):
         """Update feed's last fetched timestamp."""
@@ -127,17 +129,15 @@ class FeedRepository:
         if not feed_ids:
             return
 
-        placeholders = ",".join("?" * len(feed_ids))
-
         # Find articles that are bookmarked or summarized
-        protected_articles = conn.execute(f"""
+        protected_articles = conn.execute("""
             SELECT a.id, a.feed_id, f.name as feed_name
             FROM articles a
             JOIN feeds f ON a.feed_id = f.id
             LEFT JOIN user_article_state uas ON a.id = uas.article_id
-            WHERE a.feed_id IN ({placeholders})
+            WHERE a.feed_id IN (SELECT value FROM json_each(?))
               AND (uas.is_bookmarked = 1 OR a.summarized_at IS NOT NULL)
-        """, feed_ids).fetchall()
+        """, (json.dumps(feed_ids),)).fetchall()
 
         if not protected_articles:
             return
@@ -183,12 +183,13 @@ class FeedRepository:
             return
         with self._db.conn() as conn:
             # Build the list of feeds to actually delete
-            placeholders = ",".join("?" * len(feed_ids))
             if exclude_newsletters:
                 # Get the actual feed IDs that will be deleted (excluding newsletters)
                 rows = conn.execute(
-                    f"SELECT id FROM feeds WHERE id IN ({placeholders}) AND url NOT LIKE 'newsletter://%'",
-                    feed_ids
+                    """SELECT id FROM feeds
+                       WHERE id IN (SELECT value FROM json_each(?))
+                         AND url NOT LIKE 'newsletter://%'""",
+                    (json.dumps(feed_ids),)
                 ).fetchall()
                 feeds_to_delete = [row["id"] for row in rows]
             else:
@@ -202,10 +203,9 @@ class FeedRepository:
                 self._protect_articles_before_delete(conn, feeds_to_delete)
 
             # Now delete the feeds (cascade will delete unprotected articles)
-            delete_placeholders = ",".join("?" * len(feeds_to_delete))
             conn.execute(
-                f"DELETE FROM feeds WHERE id IN ({delete_placeholders})",
-                feeds_to_delete
+                "DELETE FROM feeds WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(feeds_to_delete),)
             )
 
     def get_or_create_newsletter_feed(
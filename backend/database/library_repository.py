@@ -83,26 +83,18 @@ class LibraryRepository:
         pub_date = published_at or datetime.now()
 
         with self._db.conn() as conn:
-            # Check if user already has this URL
-            existing = conn.execute(
-                "SELECT id FROM articles WHERE user_id = ? AND url = ?",
-                (user_id, url)
+            # URLs are unique across all articles, so a conflict means duplicate
+            row = conn.execute(
+                """INSERT INTO articles
+                   (feed_id, user_id, url, title, content, content_type,
+                    file_name, file_path, author, published_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(url) DO NOTHING
+                   RETURNING id""",
+                (feed_id, user_id, url, title, content, content_type,
+                 file_name, file_path, author, pub_date.isoformat())
             ).fetchone()
-            if existing:
-                return None  # Duplicate for this user
-
-            try:
-                cursor = conn.execute(
-                    """INSERT INTO articles
-                       (feed_id, user_id, url, title, content, content_type,
-                        file_name, file_path, author, published_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (feed_id, user_id, url, title, content, content_type,
-                     file_name, file_path, author, pub_date.isoformat())
-                )
-                return cursor.lastrowid
-            except Exception:
-                return None
+            return row["id"] if row else None
 
     def get_all(
         self,
@@ -138,8 +130,7 @@ class LibraryRepository:
         params.extend([limit, offset])
 
         with self._db.conn() as conn:
-            rows = conn.execute(query, params).fetchall()
-            return [row_to_article(row) for row in rows]
+            return [row_to_article(row) for row in conn.execute(query, params)]
 
     def get_count(self, user_id: int) -> int:
         """Get count of library items for a user."""
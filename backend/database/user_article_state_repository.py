@@ -2,10 +2,12 @@
 Repository for per-user article state (read/bookmark status).
 """
 
+import json
 from datetime import datetime
 
 from .connection import DatabaseConnection
 from .converters import row_to_user_article_state
+from .library_repository import LibraryRepository
 from .models import DBUserArticleState
 
 
@@ -71,33 +73,22 @@ class UserArticleStateRepository:
     def toggle_bookmark(self, user_id: int, article_id: int) -> bool:
         """Toggle bookmark status for a user. Returns new status."""
         with self._db.conn() as conn:
-            self._get_or_create_state(conn, user_id, article_id)
-
-            # Get current status
-            cursor = conn.execute(
+            # Single upsert: a new row starts bookmarked, an existing one flips.
+            # SET expressions see the old row, RETURNING sees the new one.
+            row = conn.execute(
                 """
-                SELECT is_bookmarked FROM user_article_state
-                WHERE user_id = ? AND article_id = ?
-                """,
-                (user_id, article_id)
-            )
-            row = cursor.fetchone()
-            current = bool(row["is_bookmarked"]) if row else False
-
-            # Toggle
-            new_status = not current
-            bookmarked_at = datetime.now().isoformat() if new_status else None
-
-            conn.execute(
-                """
-                UPDATE user_article_state
-                SET is_bookmarked = ?, bookmarked_at = ?
-                WHERE user_id = ? AND article_id = ?
+                INSERT INTO user_article_state
+                    (user_id, article_id, is_read, is_bookmarked, bookmarked_at)
+                VALUES (?, ?, FALSE, TRUE, ?)
+                ON CONFLICT(user_id, article_id) DO UPDATE SET
+                    is_bookmarked = NOT COALESCE(is_bookmarked, FALSE),
+                    bookmarked_at = CASE WHEN COALESCE(is_bookmarked, FALSE)
+                                         THEN NULL ELSE excluded.bookmarked_at END
+                RETURNING is_bookmarked
                 """,
-                (new_status, bookmarked_at, user_id, article_id)
-            )
-
-            return new_status
+                (user_id, article_id, datetime.now().isoformat())
+            ).fetchone()
+            return bool(row["is_bookmarked"])
 
     def bulk_mark_read(
         self,
@@ -112,16 +103,19 @@ class UserArticleStateRepository:
         with self._db.conn() as conn:
             read_at = datetime.now().isoformat() if is_read else None
 
-            # Batch insert/update using executemany for better performance
-            conn.executemany(
+            # One INSERT...SELECT over a JSON array of IDs: a single statement
+            # of fixed shape, whatever the number of articles
+            conn.execute(
                 """
                 INSERT INTO user_article_state (user_id, article_id, is_read, read_at, is_bookmarked)
-                VALUES (?, ?, ?, ?, FALSE)
+                SELECT ?, id, ?, ?, FALSE
+                FROM articles
+                WHERE id IN (SELECT value FROM json_each(?))
                 ON CONFLICT(user_id, article_id) DO UPDATE SET
                     is_read = excluded.is_read,
                     read_at = excluded.read_at
                 """,
-                [(user_id, article_id, is_read, read_at) for article_id in article_ids]
+                (user_id, is_read, read_at, json.dumps(article_ids))
             )
 
     def mark_feed_read(
@@ -133,14 +127,16 @@ class UserArticleStateRepository:
         """
         Mark all articles in a feed as read/unread for a user.
 
-        Returns count of articles updated.
+        Returns count of articles in the feed.
         """
         with self._db.conn() as conn:
             read_at = datetime.now().isoformat() if is_read else None
 
-            # Use INSERT...SELECT to update all articles in one statement
-            # This is much faster than fetching IDs and looping
-            cursor = conn.execute(
+            # Use INSERT...SELECT to update all articles in one statement.
+            # Rows already in the requested state are left alone, so they
+            # are not rewritten and the read-count triggers only run for
+            # articles whose state actually changes.
+            conn.execute(
                 """
                 INSERT INTO user_article_state (user_id, article_id, is_read, read_at, is_bookmarked)
                 SELECT ?, id, ?, ?, FALSE
@@ -149,11 +145,17 @@ class UserArticleStateRepository:
                 ON CONFLICT(user_id, article_id) DO UPDATE SET
                     is_read = excluded.is_read,
                     read_at = excluded.read_at
+                WHERE COALESCE(user_article_state.is_read, 0) != excluded.is_read
                 """,
                 (user_id, is_read, read_at, feed_id)
             )
 
-            return cursor.rowcount
+            # Every article in the feed now has the requested state; the
+            # maintained total avoids counting them again
+            row = conn.execute(
+                "SELECT article_count FROM feeds WHERE id = ?", (feed_id,)
+            ).fetchone()
+            return row["article_count"] if row else 0
 
     def mark_all_read(self, user_id: int, is_read: bool = True) -> int:
         """
@@ -161,14 +163,14 @@ class UserArticleStateRepository:
 
         Only affects shared articles (user_id IS NULL), not library items.
 
-        Returns count of articles updated.
+        Returns count of shared articles.
         """
         with self._db.conn() as conn:
             read_at = datetime.now().isoformat() if is_read else None
 
-            # Use INSERT...SELECT to update all shared articles in one statement
-            # This is much faster than fetching IDs and looping
-            cursor = conn.execute(
+            # Use INSERT...SELECT to update all shared articles in one statement,
+            # skipping rows that are already in the requested state
+            conn.execute(
                 """
                 INSERT INTO user_article_state (user_id, article_id, is_read, read_at, is_bookmarked)
                 SELECT ?, id, ?, ?, FALSE
@@ -177,11 +179,16 @@ class UserArticleStateRepository:
                 ON CONFLICT(user_id, article_id) DO UPDATE SET
                     is_read = excluded.is_read,
                     read_at = excluded.read_at
+                WHERE COALESCE(user_article_state.is_read, 0) != excluded.is_read
                 """,
                 (user_id, is_read, read_at)
             )
 
-            return cursor.rowcount
+            # Shared articles are all outside the standalone library feed
+            return conn.execute(
+                "SELECT COALESCE(SUM(article_count), 0) FROM feeds WHERE url != ?",
+                (LibraryRepository.STANDALONE_FEED_URL,)
+            ).fetchone()[0]
 
     def get_user_stats(self, user_id: int) -> dict:
         """Get read/bookmark stats for a user."""
@@ -218,31 +225,19 @@ class UserArticleStateRepository:
         If feed_id is provided, counts only articles in that feed.
         Only counts shared articles (not library items).
         """
+        # Trigger-maintained counters: per-feed article totals minus the
+        # user's per-feed read totals. Library items (the only articles with
+        # an owner) all live in the standalone feed, which is excluded.
+        query = """
+            SELECT COALESCE(SUM(f.article_count - COALESCE(rc.read_count, 0)), 0) as count
+            FROM feeds f
+            LEFT JOIN feed_read_counts rc ON rc.feed_id = f.id AND rc.user_id = ?
+            WHERE f.url != ?
+        """
+        params: list = [user_id, LibraryRepository.STANDALONE_FEED_URL]
+        if feed_id:
+            query += " AND f.id = ?"
+            params.append(feed_id)
+
         with self._db.conn() as conn:
-            if feed_id:
-                # Count articles in feed that are NOT marked read by user
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) as count FROM articles a
-                    LEFT JOIN user_article_state uas
-                        ON uas.article_id = a.id AND uas.user_id = ?
-                    WHERE a.feed_id = ?
-                      AND a.user_id IS NULL
-                      AND COALESCE(uas.is_read, FALSE) = FALSE
-                    """,
-                    (user_id, feed_id)
-                )
-            else:
-                # Count all shared articles not marked read by user
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) as count FROM articles a
-                    LEFT JOIN user_article_state uas
-                        ON uas.article_id = a.id AND uas.user_id = ?
-                    WHERE a.user_id IS NULL
-                      AND COALESCE(uas.is_read, FALSE) = FALSE
-                    """,
-                    (user_id,)
-                )
-
-            return cursor.fetchone()["count"]
+            return conn.execute(query, params).fetchone()["count"]
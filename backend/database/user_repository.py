@@ -2,6 +2,8 @@
 Repository for user operations.
 """
 
+import threading
+import time
 from datetime import datetime
 
 from .connection import DatabaseConnection
@@ -17,6 +19,9 @@ class UserRepository:
 
     def __init__(self, db: DatabaseConnection):
         self._db = db
+        # email -> (user_id, monotonic time of last recorded login)
+        self._last_touch: dict[str, tuple[int, float]] = {}
+        self._touch_lock = threading.Lock()
 
     def get_or_create(
         self,
@@ -56,6 +61,52 @@ class UserRepository:
             )
             return cursor.lastrowid
 
+    def get_or_create_and_touch(
+        self,
+        email: str,
+        name: str | None = None,
+        provider: str | None = None,
+        min_interval: float = 0.0
+    ) -> int:
+        """
+        Get or create a user by email and record a login, in one statement.
+
+        Equivalent to get_or_create() followed by update_last_login(), but
+        costs a single round-trip and write.
+
+        Args:
+            email: User's email address (unique identifier)
+            name: User's display name, used only when creating
+            provider: Auth provider, used only when creating
+            min_interval: Seconds during which a repeat call for the same
+                email returns the known ID without touching the database
+
+        Returns:
+            User ID (integer)
+        """
+        touched_at = time.monotonic()
+        with self._touch_lock:
+            cached = self._last_touch.get(email)
+        if cached and touched_at - cached[1] < min_interval:
+            return cached[0]
+
+        now = datetime.now().isoformat()
+        with self._db.conn() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO users (email, name, provider, created_at, last_login_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO UPDATE SET last_login_at = excluded.last_login_at
+                RETURNING id
+                """,
+                (email, name, provider, now, now)
+            )
+            user_id = cursor.fetchone()["id"]
+
+        with self._touch_lock:
+            self._last_touch[email] = (user_id, touched_at)
+        return user_id
+
     def get_by_id(self, user_id: int) -> DBUser | None:
         """Get user by ID."""
         with self._db.conn() as conn:
@@ -186,21 +186,25 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 @router.get("/status")
 async def auth_status(request: Request) -> OAuthStatus:
     """Get authentication status and available providers."""
+    # auth imports this module, so resolve its settings snapshot lazily
+    from . import auth
+
+    settings = auth._settings
     user = get_session_from_cookie(request)
 
     # Determine admin status
     is_admin = False
     if user:
-        if not config.ADMIN_EMAILS:
+        if not settings.admin_emails:
             is_admin = True
         else:
-            is_admin = user.email.lower() in config.ADMIN_EMAILS
-    elif not config.OAUTH_ENABLED:
+            is_admin = user.email.lower() in settings.admin_emails
+    elif not settings.oauth_enabled:
         # Dev mode or API key only - treat as admin
         is_admin = True
 
     return OAuthStatus(
-        enabled=config.OAUTH_ENABLED,
+        enabled=settings.oauth_enabled,
         google_enabled=bool(config.GOOGLE_CLIENT_ID and config.GOOGLE_CLIENT_SECRET),
         github_enabled=bool(config.GITHUB_CLIENT_ID and config.GITHUB_CLIENT_SECRET),
         user=user,
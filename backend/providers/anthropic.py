@@ -4,11 +4,42 @@ Anthropic Claude provider implementation.
 Supports Claude models with prompt caching for cost optimization.
 """
 
+import threading
+
 import anthropic
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 from .base import LLMProvider, LLMResponse, ProviderCapabilities, ModelTier
 
 
+# One client per API key, shared by every provider instance so repeat calls
+# reuse pooled keep-alive connections instead of re-handshaking TLS.
+_clients: dict[str, anthropic.Anthropic] = {}
+_clients_lock = threading.Lock()
+
+
+def _shared_client(api_key: str) -> anthropic.Anthropic:
+    """Return the process-wide Anthropic client for an API key."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = anthropic.Anthropic(
+                api_key=api_key,
+                http_client=anthropic.DefaultHttpxClient(
+                    http2=H2_AVAILABLE,
+                    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                ),
+            )
+            _clients[api_key] = client
+        return client
+
+
 class AnthropicProvider(LLMProvider):
     """
     Anthropic Claude provider with prompt caching support.
@@ -47,7 +78,16 @@ class AnthropicProvider(LLMProvider):
             api_key: Anthropic API key
             default_model: Default model to use
         """
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = _shared_client(api_key)
+        # Not shared like the sync client: its connection pool belongs to
+        # the event loop that first uses it
+        self.async_client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=H2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            ),
+        )
         self._default_model = self._resolve_model(default_model)
 
     def _resolve_model(self, model: str) -> str:
@@ -96,7 +136,43 @@ class AnthropicProvider(LLMProvider):
             LLMResponse with generated text
         """
         resolved_model = self._resolve_model(model) if model else self._default_model
+        response = self.client.messages.create(
+            **self._completion_kwargs(resolved_model, user_prompt, system_prompt, max_tokens, temperature, use_cache)
+        )
+        return self._to_llm_response(response, resolved_model)
 
+    async def complete_async(
+        self,
+        user_prompt: str,
+        system_prompt: str | None = None,
+        model: str | None = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.0,
+        use_cache: bool = False,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """
+        Async version of complete using the native async client.
+
+        Awaits the API call on the event loop instead of occupying an
+        executor thread for the whole roundtrip.
+        """
+        resolved_model = self._resolve_model(model) if model else self._default_model
+        response = await self.async_client.messages.create(
+            **self._completion_kwargs(resolved_model, user_prompt, system_prompt, max_tokens, temperature, use_cache)
+        )
+        return self._to_llm_response(response, resolved_model)
+
+    def _completion_kwargs(
+        self,
+        resolved_model: str,
+        user_prompt: str,
+        system_prompt: str | None,
+        max_tokens: int,
+        temperature: float,
+        use_cache: bool,
+    ) -> dict:
+        """Build messages.create arguments for a single-turn completion."""
         # Build messages
         messages = [{"role": "user", "content": user_prompt}]
 
@@ -112,7 +188,6 @@ class AnthropicProvider(LLMProvider):
             else:
                 system = system_prompt
 
-        # Make API call
         kwargs = {
             "model": resolved_model,
             "max_tokens": max_tokens,
@@ -122,9 +197,10 @@ class AnthropicProvider(LLMProvider):
             kwargs["temperature"] = temperature
         if system:
             kwargs["system"] = system
+        return kwargs
 
-        response = self.client.messages.create(**kwargs)
-
+    def _to_llm_response(self, response, resolved_model: str) -> LLMResponse:
+        """Convert an Anthropic message into an LLMResponse."""
         # Extract usage info
         usage = response.usage
         cached_tokens = 0
@@ -94,7 +94,8 @@ async def list_articles(
         summarized_only=summarized_only,
         sort_by=sort_by,
         limit=limit,
-        offset=offset
+        offset=offset,
+        include_content=False,
     )
 
     # Filter out duplicates if requested
@@ -64,6 +64,22 @@ class SearchIndex:
         except Exception:
             logger.exception("Search index: failed to add article %d", article_id)
 
+    def add_many(self, docs: list[tuple]):
+        """
+        Add several documents in one commit. Used by feed refresh.
+
+        Each tuple holds add()'s arguments:
+          (article_id, feed_id, title, content, summary_full, summary_short)
+        """
+        if not docs:
+            return
+        try:
+            with self._index.writer() as writer:
+                for doc in docs:
+                    writer.add_document(self._make_doc(*doc))
+        except Exception:
+            logger.exception("Search index: failed to add %d articles", len(docs))
+
     def update(
         self,
         article_id: int,
@@ -18,6 +18,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from .config import config, state
+from .auth import load_auth_settings
 from .database import Database
 from .search import SearchIndex
 from .cache import create_cache
@@ -53,6 +54,9 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application resources."""
+    # Pick up the current auth configuration for request handlers
+    load_auth_settings()
+
     # Startup - skip if already initialized (e.g., by tests)
     if state.db is None:
         state.db = Database(config.DB_PATH)
@@ -86,6 +90,7 @@ async def lifespan(app: FastAPI):
                     enable_js_render=config.ENABLE_JS_RENDER,
                     enable_archive=config.ENABLE_ARCHIVE,
                     js_render_timeout=config.JS_RENDER_TIMEOUT,
+                    js_render_profile_dir=config.JS_RENDER_PROFILE_DIR or None,
                     archive_max_age_days=config.ARCHIVE_MAX_AGE_DAYS,
                 )
                 await state.enhanced_fetcher.start()
@@ -164,6 +169,17 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Error stopping enhanced fetcher: {e}")
 
+    # Persist any cache writes still queued for disk
+    if state.cache:
+        state.cache.close()
+
+    if state.db:
+        try:
+            state.db.maintenance()
+        except Exception as e:
+            logger.warning(f"Database maintenance failed: {e}")
+        state.db.close()
+
 
 app = FastAPI(
     title="RSS Reader API",
@@ -329,6 +329,7 @@ async def fetch_feed_articles(feed_id: int, feed) -> list[NotificationMatch]:
     notification_matches: list[NotificationMatch] = []
     notification_service = NotificationService(state.db)
 
+    new_articles: list[dict] = []
     for item in feed.items:
         if not item.url:
             continue
@@ -359,37 +360,45 @@ async def fetch_feed_articles(feed_id: int, feed) -> list[NotificationMatch]:
             except Exception:
                 pass  # Use feed content as fallback
 
-        # Add article (with source_url if available from aggregator)
-        article_id = state.db.add_article(
-            feed_id=feed_id,
-            url=item.url,
-            title=item.title,
-            content=content,
-            author=item.author,
-            published_at=item.published,
-            source_url=item.source_url,
-            reading_time_minutes=reading_time,
-            word_count=word_count,
-            featured_image=featured_image,
-            has_code_blocks=has_code_blocks,
-            site_name=site_name,
-        )
+        # Article fields (with source_url if available from aggregator)
+        new_articles.append({
+            "feed_id": feed_id,
+            "url": item.url,
+            "title": item.title,
+            "content": content,
+            "author": item.author,
+            "published_at": item.published,
+            "source_url": item.source_url,
+            "reading_time_minutes": reading_time,
+            "word_count": word_count,
+            "featured_image": featured_image,
+            "has_code_blocks": has_code_blocks,
+            "site_name": site_name,
+        })
+
+    # Insert the whole batch in one transaction
+    article_ids = state.db.add_articles(new_articles)
 
-        if article_id:
-            # Check for notification rules match
-            article = state.db.get_article(article_id)
-            if article:
-                match = notification_service.evaluate_and_record(article)
-                if match:
-                    notification_matches.append(match)
-                    print(f"Notification match for article {article_id}: {match.match_reason}")
-
-        # Auto-summarize only if setting is enabled and API key configured
-        auto_summarize = state.db.get_setting("auto_summarize", "false").lower() == "true"
-        if article_id and state.summarizer and content and auto_summarize:
+    # Auto-summarize only if setting is enabled and API key configured
+    auto_summarize = state.db.get_setting("auto_summarize", "false").lower() == "true"
+
+    for article_id, fields in zip(article_ids, new_articles):
+        if not article_id:
+            continue  # Duplicate URL (e.g. repeated within the feed)
+
+        # Check for notification rules match
+        article = state.db.get_article(article_id)
+        if article:
+            match = notification_service.evaluate_and_record(article)
+            if match:
+                notification_matches.append(match)
+                print(f"Notification match for article {article_id}: {match.match_reason}")
+
+        content = fields["content"]
+        if state.summarizer and content and auto_summarize:
             try:
                 summary = await state.summarizer.summarize_async(
-                    content, item.url, item.title
+                    content, fields["url"], fields["title"]
                 )
                 state.db.update_summary(
                     article_id=article_id,
@@ -399,6 +408,6 @@ async def fetch_feed_articles(feed_id: int, feed) -> list[NotificationMatch]:
                     model_used=summary.model_used.value
                 )
             except Exception as e:
-                print(f"Error summarizing article {item.url}: {e}")
+                print(f"Error summarizing article {fields['url']}: {e}")
 
     return notification_matches
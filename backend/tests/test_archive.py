@@ -0,0 +1,370 @@
+"""
+Tests for the archive fallback service.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from backend.advanced.archive import ArchiveResult, ArchiveService
+
+
+def _hit(source: str, html: str = "<html>archived</html>") -> ArchiveResult:
+    return ArchiveResult(
+        url=f"https://{source}/snapshot",
+        original_url="https://example.com/story",
+        html=html,
+        source=source,
+        cached_date=datetime.now(),
+        success=True,
+    )
+
+
+def _miss(source: str) -> ArchiveResult:
+    return ArchiveResult(
+        url="https://example.com/story",
+        original_url="https://example.com/story",
+        html="",
+        source=source,
+        cached_date=None,
+        success=False,
+        error="Not found",
+    )
+
+
+def _service_with(**backends) -> ArchiveService:
+    """Build an ArchiveService whose backends are replaced by coroutines."""
+    service = ArchiveService(stagger_delay=0.01)
+    names = {
+        "archive_today": "_fetch_archive_today",
+        "archive_ph": "_fetch_archive_ph",
+        "ghostarchive": "_fetch_ghostarchive",
+        "wayback": "_fetch_wayback",
+        "google_cache": "_fetch_google_cache",
+    }
+    for key, attr in names.items():
+        setattr(service, attr, backends.get(key, _returning(_miss(key))))
+    return service
+
+
+class _FakeContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, size: int):
+        for i in range(0, len(self._body), size):
+            yield self._body[i:i + size]
+
+
+class _FakeResponse:
+    def __init__(self, url: str, status: int = 200, body: str = "", headers: dict | None = None):
+        self.url = url
+        self.status = status
+        self.headers = headers or {}
+        self.charset = "utf-8"
+        self.content = _FakeContent(body.encode())
+
+    async def read(self) -> bytes:
+        return self.content._body
+
+    def release(self) -> None:
+        pass
+
+
+class _FakeSession:
+    """Records requests and answers them from a {(method, url): response} map.
+
+    A list value is consumed one response per request.
+    """
+
+    def __init__(self, responses: dict):
+        self.responses = responses
+        self.requests: list[tuple[str, str]] = []
+        self.closed = False
+
+    async def request(self, method: str, url: str, **kwargs) -> _FakeResponse:
+        self.requests.append((method, url))
+        response = self.responses.get((method, url), _FakeResponse(url, status=404))
+        if isinstance(response, list):
+            response = response.pop(0)
+        return response
+
+
+def _returning(result: ArchiveResult, delay: float = 0.0):
+    async def fetch(url: str) -> ArchiveResult:
+        if delay:
+            await asyncio.sleep(delay)
+        return result
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_fetch_returns_first_success():
+    """The fastest successful archive wins even if it has lower priority."""
+    service = _service_with(
+        archive_today=_returning(_hit("archive.today"), delay=1.0),
+        wayback=_returning(_hit("wayback")),
+    )
+
+    result = await service.fetch("https://example.com/story")
+
+    assert result.success
+    assert result.source == "wayback"
+
+
+@pytest.mark.asyncio
+async def test_fetch_tolerates_backend_errors():
+    """A raising backend does not prevent other archives from answering."""
+    async def boom(url: str) -> ArchiveResult:
+        raise RuntimeError("connection reset")
+
+    service = _service_with(
+        archive_today=boom,
+        google_cache=_returning(_hit("google_cache")),
+    )
+
+    result = await service.fetch("https://example.com/story")
+
+    assert result.success
+    assert result.source == "google_cache"
+
+
+@pytest.mark.asyncio
+async def test_fetch_reports_miss_when_all_fail():
+    service = _service_with()
+
+    result = await service.fetch("https://example.com/story")
+
+    assert not result.success
+    assert result.source == "none"
+    assert result.error == "No archived version found"
+
+
+def test_clean_wayback_html_strips_toolbar_and_scripts():
+    service = ArchiveService()
+    html = (
+        "<html><head>"
+        '<script src="https://web.archive.org/_static/js/bundle.js"></script>'
+        "</head><body>"
+        "<!-- BEGIN WAYBACK TOOLBAR INSERT --><div>toolbar</div>"
+        "<!-- END WAYBACK TOOLBAR INSERT -->"
+        "<p>Story</p></body></html>"
+    )
+
+    cleaned = service._clean_wayback_html(html)
+
+    assert "toolbar" not in cleaned
+    assert "web.archive.org" not in cleaned
+    assert "<p>Story</p>" in cleaned
+
+
+def test_clean_wayback_html_leaves_unmarked_pages_alone():
+    service = ArchiveService()
+    html = "<html><body><!-- BEGIN WAYBACK TOOLBAR INSERT --><p>Story</p></body></html>"
+
+    assert service._clean_wayback_html(html) == html
+
+
+@pytest.mark.asyncio
+async def test_fetch_caches_results_per_url():
+    calls = 0
+
+    async def counting(url: str) -> ArchiveResult:
+        nonlocal calls
+        calls += 1
+        return _hit("archive.today")
+
+    service = _service_with(archive_today=counting)
+
+    first = await service.fetch("https://example.com/story")
+    second = await service.fetch("https://example.com/story")
+
+    assert first is second
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_lookup():
+    calls = 0
+
+    async def slow(url: str) -> ArchiveResult:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return _hit("archive.today")
+
+    service = _service_with(archive_today=slow)
+
+    results = await asyncio.gather(
+        *(service.fetch("https://example.com/story") for _ in range(5))
+    )
+
+    assert all(r.success for r in results)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_abort_shared_lookup():
+    async def slow(url: str) -> ArchiveResult:
+        await asyncio.sleep(0.05)
+        return _hit("archive.today")
+
+    service = _service_with(archive_today=slow)
+
+    impatient = asyncio.create_task(service.fetch("https://example.com/story"))
+    patient = asyncio.create_task(service.fetch("https://example.com/story"))
+    await asyncio.sleep(0.01)
+    impatient.cancel()
+
+    result = await patient
+
+    assert result.success
+    assert service._inflight == {}
+
+
+def _timemap(*mementos: tuple[str, str]) -> str:
+    lines = ['<https://example.com/story>; rel="original"']
+    for i, (url, captured) in enumerate(mementos):
+        rel = "last memento" if i == len(mementos) - 1 else "memento"
+        lines.append(f'<{url}>; rel="{rel}"; datetime="{captured}"')
+    return ",\n".join(lines)
+
+
+TIMEMAP_URL = "https://archive.today/timemap/link/https://example.com/story"
+
+
+@pytest.mark.asyncio
+async def test_archive_today_skips_download_of_stale_snapshot():
+    session = _FakeSession({
+        ("GET", TIMEMAP_URL): _FakeResponse(TIMEMAP_URL, body=_timemap(
+            ("https://archive.today/AbCdE", "Mon, 01 Jan 2001 00:00:00 GMT"),
+        )),
+    })
+    service = ArchiveService()
+    service._session = session
+
+    result = await service._fetch_archive_today("https://example.com/story")
+
+    assert not result.success
+    assert result.error == "Cached version too old"
+    assert session.requests == [("GET", TIMEMAP_URL)]
+
+
+@pytest.mark.asyncio
+async def test_archive_today_downloads_newest_memento():
+    today = format_datetime(datetime.now(timezone.utc), usegmt=True)
+    newest = "https://archive.today/NeWeSt"
+    session = _FakeSession({
+        ("GET", TIMEMAP_URL): _FakeResponse(TIMEMAP_URL, body=_timemap(
+            ("https://archive.today/OlDeR", "Mon, 01 Jan 2001 00:00:00 GMT"),
+            (newest, today),
+        )),
+        ("GET", newest): _FakeResponse(newest, body="<html>archived</html>"),
+    })
+    service = ArchiveService()
+    service._session = session
+
+    result = await service._fetch_archive_today("https://example.com/story")
+
+    assert result.success
+    assert result.html == "<html>archived</html>"
+    assert result.url == newest
+    assert session.requests == [("GET", TIMEMAP_URL), ("GET", newest)]
+
+
+@pytest.mark.asyncio
+async def test_archive_today_falls_back_to_newest_redirect():
+    today = datetime.now().strftime("%Y.%m.%d")
+    snapshot = f"https://archive.today/{today}-000000/https://example.com/story"
+    session = _FakeSession({
+        ("GET", TIMEMAP_URL): _FakeResponse(TIMEMAP_URL, status=500),
+        ("HEAD", "https://archive.today/newest/https://example.com/story"): _FakeResponse(snapshot),
+        ("GET", snapshot): _FakeResponse(snapshot, body="<html>archived</html>"),
+    })
+    service = ArchiveService()
+    service._session = session
+
+    result = await service._fetch_archive_today("https://example.com/story")
+
+    assert result.success
+    assert result.url == snapshot
+
+
+@pytest.mark.asyncio
+async def test_read_capped_rejects_oversized_pages():
+    service = ArchiveService(max_response_bytes=100_000)
+
+    small = await service._read_capped(_FakeResponse("https://a", body="x" * 1000))
+    assert small == "x" * 1000
+
+    with pytest.raises(ValueError):
+        await service._read_capped(_FakeResponse("https://a", body="x" * 200_000))
+
+
+@pytest.mark.asyncio
+async def test_request_retries_throttled_responses(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("backend.advanced.archive.asyncio.sleep", fake_sleep)
+    url = "https://web.archive.org/cdx/search/cdx"
+    session = _FakeSession({
+        ("GET", url): [
+            _FakeResponse(url, status=503, headers={"Retry-After": "2"}),
+            _FakeResponse(url, status=429),
+            _FakeResponse(url, status=200),
+        ],
+    })
+    service = ArchiveService()
+    service._session = session
+
+    async with service._request("GET", url) as resp:
+        assert resp.status == 200
+
+    assert len(session.requests) == 3
+    assert sleeps[0] == 2.0
+    assert 2 <= sleeps[1] <= 10
+
+
+@pytest.mark.asyncio
+async def test_wayback_uses_trimmed_cdx_rows():
+    snapshot = "https://web.archive.org/web/20990101000000id_/https://example.com/story"
+    session = _FakeSession({})
+    cdx_body = '[["timestamp","original"],["20990101000000","https://example.com/story"]]'
+
+    async def request(method: str, url: str, **kwargs):
+        session.requests.append((method, url))
+        if "cdx" in url:
+            assert "fl=timestamp,original" in url
+            return _FakeResponse(url, body=cdx_body)
+        return _FakeResponse(url, body="<html>archived</html>")
+
+    session.request = request
+    service = ArchiveService()
+    service._session = session
+
+    result = await service._fetch_wayback("https://example.com/story")
+
+    assert result.success
+    assert result.url == snapshot
+
+
+@pytest.mark.asyncio
+async def test_wayback_handles_empty_cdx_body():
+    session = _FakeSession({})
+
+    async def request(method: str, url: str, **kwargs):
+        return _FakeResponse(url, body="")
+
+    session.request = request
+    service = ArchiveService()
+    service._session = session
+
+    result = await service._fetch_wayback("https://example.com/story")
+
+    assert not result.success
+    assert result.error == "No snapshots found"
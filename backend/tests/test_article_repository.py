@@ -0,0 +1,301 @@
+"""
+Tests for article storage in the database layer.
+"""
+
+from datetime import datetime, timedelta
+
+
+def test_add_articles_inserts_batch(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    existing = test_db.add_article(feed_id, "https://example.com/old", "Old")
+
+    ids = test_db.add_articles([
+        {"feed_id": feed_id, "url": "https://example.com/a", "title": "A",
+         "published_at": datetime(2024, 1, 2, 3, 4, 5)},
+        {"feed_id": feed_id, "url": "https://example.com/old", "title": "Old again"},
+        {"feed_id": feed_id, "url": "https://example.com/b", "title": "B", "content": "Body"},
+        {"feed_id": feed_id, "url": "https://example.com/a", "title": "A repeated"},
+    ])
+
+    assert ids[1] is None and ids[3] is None
+    assert existing not in ids
+    first = test_db.get_article(ids[0])
+    assert first.title == "A"
+    assert first.published_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert test_db.get_article(ids[2]).content == "Body"
+    assert test_db.get_article(existing).title == "Old"
+
+
+def test_add_article_returns_none_for_duplicate_url(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    article_id = test_db.add_article(feed_id, "https://example.com/a", "A")
+
+    assert article_id is not None
+    assert test_db.add_article(feed_id, "https://example.com/a", "Again") is None
+    assert test_db.get_article(article_id).title == "A"
+
+
+def test_add_articles_empty(test_db):
+    assert test_db.add_articles([]) == []
+
+
+def test_list_view_skips_article_body(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    user_id = test_db.users.get_or_create_api_user()
+    article_id = test_db.add_article(feed_id, "https://example.com/a", "A", content="Body")
+    test_db.update_summary(article_id, "Short", "Full summary", ["Point"], "model")
+
+    [listed] = test_db.get_articles(user_id=user_id, include_content=False)
+    [full] = test_db.get_articles(user_id=user_id)
+
+    assert listed.content is None and listed.summary_full is None
+    assert listed.summary_short == "Short"
+    assert listed.key_points == ["Point"]
+    assert full.content == "Body" and full.summary_full == "Full summary"
+
+
+def _unread(db, user_id):
+    return {f.name: f.unread_count for f in db.feeds.get_all(user_id)}
+
+
+def test_feed_unread_counts_follow_read_state(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_a = test_db.add_feed("https://a.example.com/feed.xml", "A")
+    test_db.add_feed("https://b.example.com/feed.xml", "B")
+    ids = [test_db.add_article(feed_a, f"https://a.example.com/{i}", f"A{i}") for i in range(3)]
+
+    assert _unread(test_db, user_id) == {"A": 3, "B": 0}
+
+    test_db.user_state.mark_read(user_id, ids[0])
+    test_db.user_state.bulk_mark_read(user_id, ids[:2])
+    assert _unread(test_db, user_id) == {"A": 1, "B": 0}
+
+    test_db.user_state.mark_read(user_id, ids[1], is_read=False)
+    assert _unread(test_db, user_id) == {"A": 2, "B": 0}
+
+    with test_db._connection.conn() as conn:
+        conn.execute("DELETE FROM articles WHERE id = ?", (ids[0],))
+    assert _unread(test_db, user_id) == {"A": 2, "B": 0}
+    assert test_db.feeds.get(feed_a).unread_count == 2
+
+
+def test_unread_counts_follow_articles_moved_to_archive(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_a = test_db.add_feed("https://a.example.com/feed.xml", "A")
+    feed_b = test_db.add_feed("https://b.example.com/feed.xml", "B")
+    kept = test_db.add_article(feed_a, "https://a.example.com/1", "Kept")
+    test_db.add_article(feed_a, "https://a.example.com/2", "Dropped")
+    moved = test_db.add_article(feed_b, "https://b.example.com/1", "Moved")
+    test_db.user_state.mark_read(user_id, kept)
+    test_db.user_state.toggle_bookmark(user_id, moved)
+
+    test_db.delete_feed(feed_b)
+
+    assert _unread(test_db, user_id) == {"A": 1}
+    archive = [f for f in test_db.feeds.get_all() if f.url == "archive://preserved"]
+    assert archive == []  # Hidden from the list, but still counted
+    with test_db._connection.conn() as conn:
+        count = conn.execute(
+            "SELECT article_count FROM feeds WHERE url = 'archive://preserved'"
+        ).fetchone()[0]
+    assert count == 1
+
+
+def test_toggle_bookmark_flips_state_and_keeps_read_flag(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    article_id = test_db.add_article(feed_id, "https://example.com/a", "A")
+    test_db.user_state.mark_read(user_id, article_id)
+
+    assert test_db.user_state.toggle_bookmark(user_id, article_id) is True
+    state = test_db.user_state.get_state(user_id, article_id)
+    assert state.is_bookmarked and state.bookmarked_at is not None
+    assert state.is_read
+
+    assert test_db.user_state.toggle_bookmark(user_id, article_id) is False
+    state = test_db.user_state.get_state(user_id, article_id)
+    assert not state.is_bookmarked and state.bookmarked_at is None
+
+
+def test_toggle_bookmark_creates_state(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    article_id = test_db.add_article(feed_id, "https://example.com/a", "A")
+
+    assert test_db.user_state.toggle_bookmark(user_id, article_id) is True
+    state = test_db.user_state.get_state(user_id, article_id)
+    assert state.is_bookmarked and not state.is_read
+
+
+def test_search_ranks_title_matches_first(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    body_match = test_db.add_article(
+        feed_id, "https://example.com/a", "Weekly notes",
+        content="A long post that mentions databases once among other things.",
+    )
+    title_match = test_db.add_article(
+        feed_id, "https://example.com/b", "Databases explained", content="Short body.",
+    )
+
+    results = test_db.articles.search("databases")
+
+    assert [a.id for a in results] == [title_match, body_match]
+
+
+def test_search_supports_prefix_and_stemmed_queries(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    article_id = test_db.add_article(feed_id, "https://example.com/a", "Running benchmarks")
+
+    assert [a.id for a in test_db.articles.search("bench*")] == [article_id]
+    assert [a.id for a in test_db.articles.search("run")] == [article_id]
+
+
+def test_grouped_by_date_uses_created_at_when_unpublished(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    first = test_db.add_article(
+        feed_id, "https://example.com/a", "A", published_at=datetime(2024, 3, 1, 23, 59)
+    )
+    second = test_db.add_article(
+        feed_id, "https://example.com/b", "B", published_at=datetime(2024, 3, 1, 0, 0)
+    )
+    unpublished = test_db.add_article(feed_id, "https://example.com/c", "C")
+
+    grouped = test_db.articles.get_grouped_by_date(user_id)
+
+    assert [a.id for a in grouped["2024-03-01"]] == [first, second]
+    today = [a.id for key, articles in grouped.items() if key != "2024-03-01" for a in articles]
+    assert today == [unpublished]
+
+
+def test_unread_count_uses_counters_and_skips_library(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_a = test_db.add_feed("https://a.example.com/feed.xml", "A")
+    feed_b = test_db.add_feed("https://b.example.com/feed.xml", "B")
+    read = test_db.add_article(feed_a, "https://a.example.com/1", "A1")
+    test_db.add_article(feed_a, "https://a.example.com/2", "A2")
+    test_db.add_article(feed_b, "https://b.example.com/1", "B1")
+    test_db.add_standalone_item(user_id, "https://library.example.com/doc", "Doc")
+    test_db.user_state.mark_read(user_id, read)
+
+    assert test_db.get_unread_count(user_id) == 2
+    assert test_db.get_unread_count(user_id, feed_a) == 1
+    assert test_db.get_unread_count(user_id, feed_b) == 1
+    assert test_db.get_unread_count(user_id, test_db.library.feed_id) == 0
+
+
+def test_key_points_stored_as_compact_json(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    article_id = test_db.add_article(feed_id, "https://example.com/a", "A")
+    test_db.update_summary(article_id, "Short", "Full", ["One", "Two"], "model")
+
+    with test_db._connection.conn() as conn:
+        stored = conn.execute(
+            "SELECT key_points FROM articles WHERE id = ?", (article_id,)
+        ).fetchone()[0]
+        assert stored == '["One","Two"]'
+        conn.execute("UPDATE articles SET key_points = 'not json' WHERE id = ?", (article_id,))
+
+    assert test_db.get_article(article_id).key_points is None
+
+
+def test_mark_feed_read_keeps_existing_read_time(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    earlier = test_db.add_article(feed_id, "https://example.com/a", "A")
+    test_db.add_article(feed_id, "https://example.com/b", "B")
+    test_db.user_state.mark_read(user_id, earlier)
+    read_at = test_db.user_state.get_state(user_id, earlier).read_at
+
+    assert test_db.mark_feed_read(user_id, feed_id) == 2
+    assert test_db.user_state.get_state(user_id, earlier).read_at == read_at
+    assert test_db.get_unread_count(user_id, feed_id) == 0
+
+    assert test_db.mark_all_read(user_id, is_read=False) == 2
+    assert test_db.get_unread_count(user_id) == 2
+
+
+def test_get_duplicates_groups_by_content_hash(test_db):
+    feed_a = test_db.add_feed("https://a.example.com/feed.xml", "A")
+    feed_b = test_db.add_feed("https://b.example.com/feed.xml", "B")
+
+    def add(feed_id, slug, content_hash, day):
+        return test_db.add_article(
+            feed_id, f"https://example.com/{slug}", slug,
+            content_hash=content_hash, published_at=datetime(2024, 1, day),
+        )
+
+    pair = [add(feed_a, "p1", "pair", 1), add(feed_b, "p2", "pair", 2)]
+    triple = [add(feed_a, "t1", "triple", 1), add(feed_b, "t2", "triple", 3), add(feed_b, "t3", "triple", 2)]
+    add(feed_a, "unique", "unique", 1)
+    add(feed_a, "blank", "", 1)
+
+    duplicates = test_db.articles.get_duplicates()
+
+    assert [(h, [a.id for a in articles]) for h, articles in duplicates] == [
+        ("triple", [triple[1], triple[2], triple[0]]),
+        ("pair", [pair[1], pair[0]]),
+    ]
+
+
+def test_get_duplicate_ids_keeps_oldest(test_db):
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    newer = test_db.add_article(
+        feed_id, "https://example.com/a", "A", content_hash="h", published_at=datetime(2024, 1, 2)
+    )
+    oldest = test_db.add_article(
+        feed_id, "https://example.com/b", "B", content_hash="h", published_at=datetime(2024, 1, 1)
+    )
+    undated = test_db.add_article(feed_id, "https://example.com/c", "C", content_hash="h")
+
+    ids = test_db.articles.get_duplicate_ids()
+
+    assert oldest not in ids
+    assert ids == {newer, undated}
+
+
+def test_get_stats_buckets_articles_by_age(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    now = datetime.now()
+    recent = test_db.add_article(feed_id, "https://example.com/a", "A", published_at=now - timedelta(days=1))
+    test_db.add_article(feed_id, "https://example.com/b", "B", published_at=now - timedelta(days=10))
+    test_db.add_article(feed_id, "https://example.com/c", "C", published_at=datetime(2020, 1, 1))
+    test_db.add_article(feed_id, "https://example.com/d", "D")  # falls back to created_at
+    test_db.add_standalone_item(user_id, "https://library.example.com/doc", "Doc")
+    test_db.user_state.mark_read(user_id, recent)
+    test_db.user_state.toggle_bookmark(user_id, recent)
+
+    stats = test_db.articles.get_stats(user_id)
+
+    assert stats == {
+        "total": 4,
+        "unread": 3,
+        "bookmarked": 1,
+        "last_week": 2,
+        "last_month": 1,
+        "older_than_month": 1,
+        "oldest_article": datetime(2020, 1, 1).isoformat(),
+    }
+
+
+def test_get_stats_empty(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+
+    stats = test_db.articles.get_stats(user_id)
+
+    assert stats["total"] == 0 and stats["unread"] == 0 and stats["oldest_article"] is None
+
+
+def test_bulk_mark_read_skips_unknown_ids(test_db):
+    user_id = test_db.users.get_or_create_api_user()
+    feed_id = test_db.add_feed("https://example.com/feed.xml", "Example")
+    ids = [test_db.add_article(feed_id, f"https://example.com/{i}", str(i)) for i in range(3)]
+
+    test_db.user_state.bulk_mark_read(user_id, [ids[0], ids[2], 99999])
+
+    assert test_db.get_unread_count(user_id) == 1
+    assert test_db.user_state.get_state(user_id, 99999) is None
+
+    test_db.user_state.bulk_mark_read(user_id, [ids[0]], is_read=False)
+    assert test_db.get_unread_count(user_id) == 2
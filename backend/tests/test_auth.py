@@ -2,9 +2,12 @@
 Tests for API authentication.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.auth import CurrentUser, is_admin_user, load_auth_settings
 from backend.config import config, state
 from backend.database import Database
 from backend.cache import create_cache
@@ -94,6 +97,13 @@ class TestAuthenticationEnabled:
         assert response.status_code == 401
         assert "Invalid API key" in response.json()["detail"]
 
+    def test_protected_endpoint_rejects_key_with_extra_suffix(self, client_with_auth):
+        """A valid key with trailing characters should not authenticate."""
+        response = client_with_auth.get(
+            "/feeds", headers={"X-API-Key": "test-secret-key-12345x"}
+        )
+        assert response.status_code == 401
+
     def test_protected_endpoint_accepts_valid_key(self, client_with_auth):
         """Protected endpoints should accept valid keys."""
         response = client_with_auth.get(
@@ -136,3 +146,85 @@ class TestAuthenticationEnabled:
         """DELETE endpoints should require auth."""
         response = client_with_auth.delete("/feeds/1")
         assert response.status_code == 401
+
+    def test_non_ascii_key_rejected_cleanly(self, client_with_auth):
+        """Non-ASCII keys should be rejected with 401, not a server error."""
+        response = client_with_auth.get(
+            "/feeds", headers={"X-API-Key": "clé-secrète".encode()}
+        )
+        assert response.status_code == 401
+
+
+class TestAdminCheck:
+    """Tests for admin email matching."""
+
+    @pytest.fixture
+    def admin_emails(self, monkeypatch):
+        def configure(emails):
+            monkeypatch.setattr(config, "ADMIN_EMAILS", emails)
+            load_auth_settings()
+        yield configure
+        monkeypatch.undo()
+        load_auth_settings()
+
+    def _db(self, user):
+        lookups = []
+
+        def get_by_id(user_id):
+            lookups.append(user_id)
+            return user
+
+        return SimpleNamespace(users=SimpleNamespace(get_by_id=get_by_id)), lookups
+
+    def test_no_admin_list_skips_user_lookup(self, admin_emails):
+        admin_emails(set())
+        db, lookups = self._db(None)
+
+        assert is_admin_user(db, 1)
+        assert lookups == []
+
+    def test_admin_email_matched_case_insensitively(self, admin_emails):
+        admin_emails({"Admin@Example.com"})
+        admin = SimpleNamespace(email="ADMIN@example.com", provider="google")
+        other = SimpleNamespace(email="reader@example.com", provider="google")
+
+        assert is_admin_user(self._db(admin)[0], 1)
+        assert not is_admin_user(self._db(other)[0], 2)
+
+    def test_cached_request_user_skips_lookup(self, admin_emails):
+        admin_emails({"admin@example.com"})
+        db, lookups = self._db(None)
+        request = SimpleNamespace(state=SimpleNamespace(
+            user=CurrentUser(7, "admin@example.com", "google")
+        ))
+
+        assert is_admin_user(db, 7, request)
+        assert lookups == []
+
+
+class TestUserLogin:
+    """Tests for recording OAuth logins."""
+
+    def test_get_or_create_and_touch(self, temp_db_path):
+        db = Database(temp_db_path)
+
+        user_id = db.users.get_or_create_and_touch("reader@example.com", "Reader", "google")
+        first_login = db.users.get_by_id(user_id).last_login_at
+        again = db.users.get_or_create_and_touch("reader@example.com", "Renamed", "github")
+        user = db.users.get_by_id(user_id)
+
+        assert again == user_id
+        assert first_login is not None
+        assert user.last_login_at >= first_login
+        assert user.name == "Reader"
+        assert user.provider == "google"
+
+    def test_repeat_logins_within_interval_skip_write(self, temp_db_path):
+        db = Database(temp_db_path)
+        user_id = db.users.get_or_create_and_touch("reader@example.com", min_interval=60)
+        first_login = db.users.get_by_id(user_id).last_login_at
+
+        again = db.users.get_or_create_and_touch("reader@example.com", min_interval=60)
+
+        assert again == user_id
+        assert db.users.get_by_id(user_id).last_login_at == first_login
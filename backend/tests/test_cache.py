@@ -0,0 +1,269 @@
+"""
+Tests for the cache backends.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend import cache as cache_module
+from backend.cache import DiskCache, MemoryCache, TieredCache
+
+
+class TestMemoryCache:
+    """Tests for the in-memory LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_overwrite_refreshes_recency_without_evicting(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.set("a", 10)
+        cache.set("c", 3)
+
+        assert cache.size == 2
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = MemoryCache()
+        cache.set("short", 1, ttl=10)
+        cache.set("forever", 2)
+
+        now[0] += 11
+
+        assert cache.get("short") is None
+        assert cache.get("forever") == 2
+
+    def test_delete_and_clear(self):
+        cache = MemoryCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get("a") is None
+        assert cache.size == 1
+
+        cache.clear()
+        assert cache.size == 0
+
+
+class TestDiskCache:
+    """Tests for the persistent disk cache."""
+
+    def test_round_trip(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("summary:https://example.com", {"title": "Story", "topics": ["a"]})
+
+        assert cache.get("summary:https://example.com") == {"title": "Story", "topics": ["a"]}
+        assert cache.get("summary:https://other.com") is None
+
+    def test_set_leaves_no_temp_files(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("summary:a", "first")
+        cache.set("summary:a", "second")
+
+        assert cache.get("summary:a") == "second"
+        assert list(tmp_path.glob("**/*.tmp")) == []
+
+    def test_cleanup_expired_uses_file_age(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl_days=30)
+        cache.set("summary:old", "v")
+        cache.set("summary:new", "v")
+        old = cache._key_to_path("summary:old")
+        month_ago = time.time() - 31 * 86400
+        os.utime(old, (month_ago, month_ago))
+
+        assert cache.cleanup_expired() == 1
+        assert not old.exists()
+        assert cache.get("summary:new") == "v"
+
+    def test_get_expires_by_file_age(self, tmp_path):
+        cache = DiskCache(tmp_path, ttl_days=30)
+        cache.set("summary:a", "v")
+        path = cache._key_to_path("summary:a")
+        month_ago = time.time() - 31 * 86400
+        os.utime(path, (month_ago, month_ago))
+
+        assert cache.get("summary:a") is None
+        assert not path.exists()
+
+    def test_files_are_plain_json(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("clustering:abc", {1: "one", "when": datetime(2024, 1, 2)})
+
+        data = json.loads(cache._key_to_path("clustering:abc").read_text())
+
+        assert data["key"] == "clustering:abc"
+        assert data["value"]["1"] == "one"
+        assert data["value"]["when"].startswith("2024-01-02")
+
+    def test_reads_and_migrates_legacy_entries(self, tmp_path):
+        """Pre-sharding files with ISO timestamps are still served."""
+        cache = DiskCache(tmp_path, ttl_days=30)
+        (tmp_path / "summary").mkdir()
+        legacy = {}
+        for key, age in (("summary:fresh", 1), ("summary:stale", 31)):
+            path = cache._key_to_path(key)
+            legacy[key] = path.parent.parent / path.name
+            created = datetime.now() - timedelta(days=age)
+            legacy[key].write_text(json.dumps({"key": key, "value": "v", "created_at": created.isoformat()}))
+            os.utime(legacy[key], (created.timestamp(), created.timestamp()))
+
+        assert cache.get("summary:fresh") == "v"
+        assert cache._key_to_path("summary:fresh").exists()
+        assert not legacy["summary:fresh"].exists()
+
+        assert cache.get("summary:stale") is None
+        assert list(tmp_path.glob("**/*.json")) == [cache._key_to_path("summary:fresh")]
+
+    def test_entries_sharded_by_hash_prefix(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("summary:a", "v")
+        path = cache._key_to_path("summary:a")
+
+        assert path.parent.parent == tmp_path / "summary"
+        assert path.name.startswith(path.parent.name)
+
+        cache.clear("summary")
+        assert not path.exists()
+
+
+class TestTieredCache:
+    """Tests for the memory -> disk cache."""
+
+    def test_repeated_miss_skips_disk(self, tmp_path, monkeypatch):
+        cache = TieredCache(tmp_path)
+        disk_reads = []
+        original_get = cache.disk.get
+        monkeypatch.setattr(
+            cache.disk, "get",
+            lambda key, default=None: disk_reads.append(key) or original_get(key, default),
+        )
+
+        assert cache.get("summary:a") is None
+        assert cache.get("summary:a") is None
+        assert disk_reads == ["summary:a"]
+
+        cache.set("summary:a", "v")
+        assert cache.get("summary:a") == "v"
+
+    @pytest.mark.parametrize("value", [0, "", [], {}, False, None])
+    def test_falsy_values_are_hits(self, tmp_path, monkeypatch, value):
+        cache = TieredCache(tmp_path)
+        cache.set("summary:a", value)
+        cache.close()
+        monkeypatch.setattr(cache.disk, "get", lambda *args: pytest.fail("memory hit went to disk"))
+
+        assert cache.get("summary:a", "missing") == value
+
+        fresh = TieredCache(tmp_path)
+        assert fresh.get("summary:a", "missing") == value
+        assert fresh.get("summary:b", "missing") == "missing"
+
+    def test_disk_hits_promoted_on_second_read(self, tmp_path):
+        writer = TieredCache(tmp_path)
+        writer.set("summary:a", "v")
+        writer.close()
+        cache = TieredCache(tmp_path)
+
+        assert cache.get("summary:a") == "v"
+        assert cache.memory.get("summary:a") is None
+        assert cache.get("summary:a") == "v"
+        assert cache.memory.get("summary:a") == "v"
+
+    def test_disk_writes_happen_in_background(self, tmp_path):
+        cache = TieredCache(tmp_path, memory_size=1)
+        cache.set("summary:a", "first")
+        cache.set("summary:b", "second")  # evicts "a" from memory
+
+        # Still readable while its disk write may be pending
+        assert cache.get("summary:a") == "first"
+
+        cache.delete("summary:a")
+        cache.flush()
+
+        assert cache.get("summary:a") is None
+        assert cache.disk.get("summary:a") is None
+        assert cache.disk.get("summary:b") == "second"
+        cache.close()
+
+    @pytest.mark.parametrize("failing", ["set", "delete"])
+    def test_failed_disk_write_keeps_writer_alive(self, tmp_path, monkeypatch, failing):
+        cache = TieredCache(tmp_path)
+
+        def boom(*args):
+            raise IsADirectoryError("boom")
+
+        def flush_returns() -> bool:
+            # flush() blocks forever if the writer thread has died
+            flusher = threading.Thread(target=cache.flush, daemon=True)
+            flusher.start()
+            flusher.join(timeout=5)
+            return not flusher.is_alive()
+
+        monkeypatch.setattr(cache.disk, failing, boom)
+        cache.set("summary:a", "v")
+        cache.delete("summary:a")
+        assert flush_returns()
+
+        monkeypatch.undo()
+        cache.set("summary:b", "w")
+
+        assert flush_returns()
+        assert cache._writer.is_alive()
+        assert cache.disk.get("summary:b") == "w"
+        assert cache._pending == {}
+        cache.close()
+
+    def test_sync_write_lands_after_queued_older_write(self, tmp_path, monkeypatch):
+        cache = TieredCache(tmp_path)
+        cache._write_queue = queue.Queue(maxsize=1)
+        writing, release = threading.Event(), threading.Event()
+        disk_set = cache.disk.set
+
+        def slow_set(key, value, ttl=None):
+            if key == "summary:block":
+                writing.set()
+                release.wait(timeout=5)
+            disk_set(key, value, ttl)
+
+        monkeypatch.setattr(cache.disk, "set", slow_set)
+        cache.set("summary:block", "x")
+        assert writing.wait(timeout=5)
+        cache.set("summary:a", "old")  # fills the queue behind the blocked write
+
+        threading.Timer(0.1, release.set).start()
+        cache.set("summary:a", "new")  # queue full: written synchronously
+        cache.flush()
+
+        assert cache.disk.get("summary:a") == "new"
+        cache.close()
+
+    def test_full_write_queue_falls_back_to_sync_write(self, tmp_path, monkeypatch):
+        cache = TieredCache(tmp_path)
+        monkeypatch.setattr(cache, "_enqueue", lambda op: False)
+
+        cache.set("summary:a", "v")
+
+        assert cache.disk.get("summary:a") == "v"
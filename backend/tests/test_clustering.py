@@ -0,0 +1,169 @@
+"""
+Tests for the topic clusterer.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.cache import TieredCache
+from backend.clustering import Clusterer, create_clusterer_from_api_key
+from backend.providers.base import LLMProvider, LLMResponse, ProviderCapabilities, ModelTier
+
+
+def _articles(*ids: int) -> list:
+    return [SimpleNamespace(id=i) for i in ids]
+
+
+def _full_articles(*ids: int) -> list:
+    return [
+        SimpleNamespace(id=i, title=f"Story {i}", summary_short="", content="Body")
+        for i in ids
+    ]
+
+
+class AsyncOnlyProvider(LLMProvider):
+    """Provider whose sync path fails, to prove the async path is native."""
+
+    TIER_MODELS = {
+        ModelTier.FAST: "mock-fast",
+        ModelTier.STANDARD: "mock-standard",
+        ModelTier.ADVANCED: "mock-advanced",
+    }
+
+    def __init__(self, text: str):
+        self.text = text
+        self.async_calls = 0
+
+    @property
+    def name(self) -> str:
+        return "mock"
+
+    @property
+    def capabilities(self) -> ProviderCapabilities:
+        return ProviderCapabilities()
+
+    def complete(self, *args, **kwargs) -> LLMResponse:
+        raise AssertionError("cluster_async must not use the sync client")
+
+    async def complete_async(self, user_prompt, system_prompt=None, model=None,
+                             max_tokens=1024, temperature=0.0, use_cache=False,
+                             json_mode=False) -> LLMResponse:
+        self.async_calls += 1
+        return LLMResponse(text=self.text, model=model or "mock-fast")
+
+
+class TestCacheKey:
+    """Tests for clustering cache keys."""
+
+    def test_key_ignores_article_order(self):
+        clusterer = Clusterer(provider=None)
+
+        assert clusterer._make_cache_key(_articles(3, 1, 2)) == clusterer._make_cache_key(_articles(1, 2, 3))
+
+    def test_key_depends_on_article_set(self):
+        clusterer = Clusterer(provider=None)
+        key = clusterer._make_cache_key(_articles(1, 2, 3))
+
+        assert key.startswith("clustering:")
+        assert len(key) == len("clustering:") + 16
+        assert key != clusterer._make_cache_key(_articles(1, 2, 4))
+        assert key != clusterer._make_cache_key(_articles(12, 3))
+
+
+class TestClientReuse:
+    """Tests for sharing the Anthropic client between clusterers."""
+
+    def test_clusterers_with_same_key_share_client(self):
+        first = create_clusterer_from_api_key("sk-ant-test-shared")
+        second = create_clusterer_from_api_key("sk-ant-test-shared")
+        other = create_clusterer_from_api_key("sk-ant-test-other")
+
+        assert first.provider.client is second.provider.client
+        assert first.provider.client is not other.provider.client
+
+
+class TestClusterAsync:
+    """Tests for the native async clustering path."""
+
+    @pytest.mark.asyncio
+    async def test_uses_async_completion(self):
+        provider = AsyncOnlyProvider(json.dumps({
+            "topics": [{"label": "Pair", "article_ids": [1, 2]}]
+        }))
+        clusterer = Clusterer(provider=provider)
+
+        result = await clusterer.cluster_async(_full_articles(1, 2, 3))
+
+        assert provider.async_calls == 1
+        assert [t.article_ids for t in result.topics] == [[1, 2], [3]]
+        assert not result.cached
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self, tmp_path):
+        provider = AsyncOnlyProvider(json.dumps({
+            "topics": [{"label": "All", "article_ids": [1, 2]}]
+        }))
+        cache = TieredCache(tmp_path)
+        clusterer = Clusterer(provider=provider, cache=cache)
+
+        await clusterer.cluster_async(_full_articles(1, 2))
+        result = await clusterer.cluster_async(_full_articles(2, 1))
+        cache.close()
+
+        assert provider.async_calls == 1
+        assert result.cached
+        assert result.topics[0].article_ids == [1, 2]
+
+
+class TestParseResponse:
+    """Tests for parsing the LLM's clustering reply."""
+
+    PAYLOAD = '{"topics": [{"label": "Pair", "article_ids": [1, 2]}]}'
+
+    @pytest.mark.parametrize("text", [
+        PAYLOAD,
+        f"  {PAYLOAD}\n",
+        f"```json\n{PAYLOAD}\n```",
+        f"```\n{PAYLOAD}\n```",
+        f"Here are the clusters:\n```json\n{PAYLOAD}\n```\nDone.",
+        f"```json\n{PAYLOAD}",
+    ])
+    def test_extracts_json(self, text):
+        result = Clusterer(provider=None)._parse_response(text, _articles(1, 2, 3))
+
+        assert [t.label for t in result.topics] == ["Pair", "Other"]
+        assert [t.article_ids for t in result.topics] == [[1, 2], [3]]
+
+    def test_invalid_json_falls_back_to_single_topic(self):
+        result = Clusterer(provider=None)._parse_response("not json", _articles(1, 2))
+
+        assert [t.id for t in result.topics] == ["all"]
+        assert result.topics[0].article_ids == [1, 2]
+
+
+class TestBuildPrompt:
+    """Tests for the clustering prompt."""
+
+    def test_lists_articles_with_summary_or_content(self):
+        articles = [
+            SimpleNamespace(id=1, title="One", summary_short="Short summary", content="x" * 500),
+            SimpleNamespace(id=2, title="Two", summary_short=None, content="y" * 500),
+            SimpleNamespace(id=3, title="Three", summary_short="", content=None),
+        ]
+
+        prompt = Clusterer(provider=None)._build_prompt(articles, 2, 4)
+
+        assert "Group them into 2-4 specific topic clusters" in prompt
+        assert '[id=1] "One" - Short summary\n' in prompt
+        assert f'[id=2] "Two" - {"y" * 150}...\n' in prompt
+        assert '[id=3] "Three" - \n' in prompt
+
+    def test_edited_article_gets_new_line(self):
+        clusterer = Clusterer(provider=None)
+        before = SimpleNamespace(id=1, title="Old title", summary_short="S", content=None)
+        after = SimpleNamespace(id=1, title="New title", summary_short="S", content=None)
+
+        assert '"Old title"' in clusterer._build_prompt([before], 2, 4)
+        assert '"New title"' in clusterer._build_prompt([after], 2, 4)
@@ -0,0 +1,171 @@
+"""
+Tests for database connection setup.
+"""
+
+import pytest
+
+from backend.database.connection import DatabaseConnection
+
+
+def test_database_uses_wal_journal(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+
+    with connection.conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_connection_pragmas_applied(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+
+    with connection.conn() as conn:
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_connections_are_reused(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+
+    with connection.conn() as first:
+        pass
+    with connection.conn() as second:
+        pass
+
+    assert first is second
+
+
+def test_concurrent_callers_get_separate_connections(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+
+    with connection.conn() as outer:
+        with connection.conn() as inner:
+            assert inner is not outer
+
+
+def test_error_rolls_back_and_keeps_connection_usable(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+
+    with pytest.raises(RuntimeError):
+        with connection.conn() as conn:
+            conn.execute("INSERT INTO settings (key, value) VALUES ('k', 'v')")
+            raise RuntimeError("boom")
+
+    with connection.conn() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM settings").fetchone()[0] == 0
+
+
+def test_close_empties_pool(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as first:
+        pass
+
+    connection.close()
+
+    with connection.conn() as second:
+        assert second is not first
+        assert second.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_fts_update_trigger_scoped_to_indexed_columns(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        # Simulate a database created before the trigger was column-scoped
+        conn.executescript("""
+            DROP TRIGGER articles_au;
+            CREATE TRIGGER articles_au AFTER UPDATE ON articles BEGIN
+                SELECT 1;
+            END;
+        """)
+    connection.close()
+
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='trigger' AND name='articles_au'"
+        ).fetchone()[0]
+        assert "UPDATE OF title, content, summary_full" in sql
+
+        conn.execute("INSERT INTO feeds (url, name) VALUES ('https://example.com/feed', 'Feed')")
+        conn.execute(
+            "INSERT INTO articles (feed_id, url, title) VALUES (1, 'https://example.com/a', 'Before')"
+        )
+        conn.execute("UPDATE articles SET title = 'After' WHERE id = 1")
+        matches = conn.execute(
+            "SELECT rowid FROM articles_fts WHERE articles_fts MATCH 'After'"
+        ).fetchall()
+        assert [row[0] for row in matches] == [1]
+
+
+def test_legacy_fts_table_is_rebuilt(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        conn.executescript("""
+            DROP TABLE articles_fts;
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                title, content, summary_full, content='articles', content_rowid='id'
+            );
+        """)
+        conn.execute("INSERT INTO feeds (url, name) VALUES ('https://example.com/feed', 'Feed')")
+        conn.execute(
+            "INSERT INTO articles (feed_id, url, title) VALUES (1, 'https://example.com/a', 'Kept')"
+        )
+    connection.close()
+
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='articles_fts'"
+        ).fetchone()[0]
+        assert "prefix=" in sql
+        matches = conn.execute(
+            "SELECT rowid FROM articles_fts WHERE articles_fts MATCH 'kep*'"
+        ).fetchall()
+        assert [row[0] for row in matches] == [1]
+
+
+def test_maintenance_vacuums_once_per_interval(test_db):
+    assert test_db.maintenance() is True
+    assert test_db.get_setting("last_vacuum_at") is not None
+
+    # Within the interval only the cheap optimize step runs
+    assert test_db.maintenance() is False
+
+
+def test_default_article_order_uses_index(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+    order = "ORDER BY published_at DESC NULLS LAST, created_at DESC LIMIT 50"
+
+    with connection.conn() as conn:
+        for where in ("user_id IS NULL", "feed_id = 1 AND user_id IS NULL"):
+            plan = " ".join(
+                row["detail"] for row in
+                conn.execute(f"EXPLAIN QUERY PLAN SELECT id FROM articles WHERE {where} {order}")
+            )
+            assert "TEMP B-TREE" not in plan
+
+
+def test_column_migrations_run_once_per_schema_version(temp_db_path, monkeypatch):
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    assert version == DatabaseConnection.SCHEMA_VERSION
+    connection.close()
+
+    calls = []
+    monkeypatch.setattr(DatabaseConnection, "_migrate_columns", lambda self, conn: calls.append(conn))
+    DatabaseConnection(temp_db_path).close()
+    assert calls == []
+
+
+def test_unversioned_database_is_migrated(temp_db_path):
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        conn.execute("PRAGMA user_version = 0")
+        conn.execute("ALTER TABLE articles DROP COLUMN featured_note")
+    connection.close()
+
+    connection = DatabaseConnection(temp_db_path)
+    with connection.conn() as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(articles)")]
+        assert "featured_note" in columns
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == DatabaseConnection.SCHEMA_VERSION
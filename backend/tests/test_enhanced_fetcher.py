@@ -0,0 +1,126 @@
+"""
+Tests for the enhanced fetcher's fallback decisions.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.advanced.enhanced_fetcher import EnhancedFetcher, EnhancedFetchResult
+from backend.fetcher import FetchResult
+
+
+@pytest.fixture
+def fetcher():
+    return EnhancedFetcher(enable_js_render=False, enable_archive=False)
+
+
+def _result(content: str = "x" * 1000, source: str = "readability") -> FetchResult:
+    return FetchResult(
+        url="https://example.com/story",
+        title="Story",
+        content=content,
+        source=source,
+    )
+
+
+class TestDomainMatching:
+    """Domain lists match on hostnames, not URL substrings."""
+
+    def test_js_heavy_domain_and_subdomains(self, fetcher):
+        assert fetcher._should_try_js_render("https://medium.com/@a/post", 1000)
+        assert fetcher._should_try_js_render("https://blog.substack.com/p/post", 1000)
+
+    def test_js_heavy_ignores_lookalike_hosts(self, fetcher):
+        # "x.com" is a substring of these URLs but not their domain
+        assert not fetcher._should_try_js_render("https://netflix.com/story", 1000)
+        assert not fetcher._should_try_js_render("https://example.com/?ref=x.com", 1000)
+
+    def test_paywalled_domain(self, fetcher):
+        assert fetcher._should_try_archive("https://www.nytimes.com/2024/story.html", False)
+        assert not fetcher._should_try_archive("https://notnytimes.com.example.org/", False)
+
+    def test_short_content_triggers_js_render(self, fetcher):
+        assert fetcher._should_try_js_render("https://example.com/", 150)
+
+    def test_paywalled_source_triggers_archive(self, fetcher):
+        assert fetcher._should_try_archive("https://example.com/", True)
+
+
+class TestHedgedFallbacks:
+    """JS rendering and archive lookups race; the first good result wins."""
+
+    @pytest.fixture
+    def hedged(self, fetcher):
+        fetcher.enable_js_render = True
+        fetcher.enable_archive = True
+        fetcher.archive_hedge_delay = 0.01
+
+        async def paywalled(url):
+            return _result(content="Subscribe to continue", source="paywalled")
+
+        fetcher._fetcher.fetch = paywalled
+        return fetcher
+
+    @staticmethod
+    def _fallback(kind: str, latency: float = 0.0, content: str = "y" * 1000):
+        async def run(url, delay: float = 0.0):
+            await asyncio.sleep(delay + latency)
+            return EnhancedFetchResult(
+                url=url, title="Story", content=content, source=kind, fallback_used=kind,
+            )
+        return run
+
+    @pytest.mark.asyncio
+    async def test_archive_wins_when_js_render_is_slow(self, hedged):
+        hedged._fetch_with_js = self._fallback("js_render", latency=1.0)
+        hedged._fetch_from_archive = self._fallback("archive")
+
+        result = await hedged.fetch("https://www.washingtonpost.com/story")
+
+        assert result.fallback_used == "archive"
+        assert result.original_error == "Content appears paywalled"
+
+    @pytest.mark.asyncio
+    async def test_bot_detection_page_from_js_render_is_skipped(self, hedged):
+        hedged._fetch_with_js = self._fallback("js_render", content="Just a moment... cloudflare")
+        hedged._fetch_from_archive = self._fallback("archive")
+        hedged._is_bot_detection_page = lambda content: "cloudflare" in content
+
+        result = await hedged.fetch("https://www.washingtonpost.com/story")
+
+        assert result.fallback_used == "archive"
+        assert result.original_error == "JS render blocked by bot detection"
+
+    @pytest.mark.asyncio
+    async def test_js_render_skipped_for_bot_walled_domain(self, hedged):
+        js_calls = []
+
+        async def js(url, delay: float = 0.0):
+            js_calls.append(url)
+            return await self._fallback("js_render")(url)
+
+        hedged._fetch_with_js = js
+        hedged._fetch_from_archive = self._fallback("archive")
+
+        result = await hedged.fetch("https://www.wsj.com/story")
+
+        assert result.fallback_used == "archive"
+        assert js_calls == []
+
+    @pytest.mark.asyncio
+    async def test_bot_detection_host_is_remembered(self, hedged):
+        js_calls = []
+
+        async def js(url, delay: float = 0.0):
+            js_calls.append(url)
+            return await self._fallback("js_render", content="Just a moment... cloudflare")(url)
+
+        hedged._fetch_with_js = js
+        hedged._fetch_from_archive = self._fallback("archive")
+        hedged._is_bot_detection_page = lambda content: "cloudflare" in content
+
+        await hedged.fetch("https://www.washingtonpost.com/one")
+        await hedged.fetch("https://www.washingtonpost.com/two")
+
+        assert js_calls == ["https://www.washingtonpost.com/one"]
@@ -121,6 +121,16 @@ class TestUpdateFeed:
         assert response.status_code == 200
         assert response.json()["category"] == "New Category"
 
+    def test_update_feed_name_and_category(self, client_with_data):
+        """Should update both fields in one request."""
+        client, data = client_with_data
+        response = client.put(f"/feeds/{data['feed_id']}", json={
+            "name": "Renamed", "category": "Tech"
+        })
+        assert response.status_code == 200
+        assert response.json()["name"] == "Renamed"
+        assert response.json()["category"] == "Tech"
+
     def test_update_feed_not_found(self, client):
         """Should return 404 for non-existent feed."""
         response = client.put("/feeds/99999", json={"name": "Test"})
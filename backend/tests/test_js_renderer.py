@@ -0,0 +1,360 @@
+"""
+Tests for the Playwright renderer, using fake browser objects.
+"""
+
+import asyncio
+import os
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from backend.advanced.js_renderer import _BLOCKED_URL_PATTERNS, JSRenderer, PlaywrightTimeout
+
+
+class FakePage:
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+        self.url = "https://example.com/story"
+        self.closed = False
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        browser = self.context.browser
+        browser.in_flight += 1
+        browser.peak_in_flight = max(browser.peak_in_flight, browser.in_flight)
+        await asyncio.sleep(browser.latency)
+        browser.in_flight -= 1
+        return object()
+
+    async def wait_for_function(self, expression, **kwargs):
+        self.context.waits.append(("function", kwargs.get("timeout")))
+        if self.context.browser.renavigating:
+            raise Exception("Execution context was destroyed, most likely because of a navigation")
+        if "querySelector" in expression and self.context.browser.selector_missing:
+            raise PlaywrightTimeout("article selector not found")
+
+    async def wait_for_load_state(self, state, **kwargs):
+        self.context.waits.append((state, kwargs.get("timeout")))
+
+    async def wait_for_timeout(self, ms):
+        self.context.waits.append(("sleep", ms))
+
+    async def evaluate(self, script, *args):
+        self.context.evaluated.append((script, args))
+        return None
+
+    async def eval_on_selector(self, selector, script):
+        if selector != "article":
+            raise Exception(f"Failed to find element matching selector {selector!r}")
+        return "<article>Story</article>"
+
+    async def content(self):
+        return "<html><article>Story</article></html>"
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.init_scripts: list[str] = []
+        self.routes: list = []
+        self.pages: list[FakePage] = []
+        self.evaluated: list[tuple] = []
+        self.waits: list[tuple] = []
+        self.cdp_commands: list[tuple] = []
+        self.closed = False
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def new_cdp_session(self, page):
+        return SimpleNamespace(send=self._send_cdp)
+
+    async def _send_cdp(self, method, params=None):
+        self.cdp_commands.append((method, params))
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(
+        self, latency: float = 0.0, selector_missing: bool = False, renavigating: bool = False
+    ):
+        self.latency = latency
+        self.selector_missing = selector_missing
+        self.renavigating = renavigating
+        self.contexts: list[FakeContext] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    async def new_context(self, **kwargs):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+def _renderer(browser: FakeBrowser, **kwargs) -> JSRenderer:
+    renderer = JSRenderer(scroll_to_load=False, **kwargs)
+    renderer._browser = browser
+    return renderer
+
+
+@pytest.mark.asyncio
+async def test_sequential_renders_reuse_one_context():
+    browser = FakeBrowser()
+    renderer = _renderer(browser)
+
+    for _ in range(3):
+        result = await renderer.render("https://example.com/story")
+        assert result.success
+
+    assert len(browser.contexts) == 1
+    context = browser.contexts[0]
+    assert len(context.pages) == 3
+    assert all(page.closed for page in context.pages)
+    assert len(context.init_scripts) == 1
+
+
+@pytest.mark.asyncio
+async def test_context_recycled_after_max_uses():
+    browser = FakeBrowser()
+    renderer = _renderer(browser, context_max_uses=2)
+
+    for _ in range(3):
+        await renderer.render("https://example.com/story")
+
+    assert len(browser.contexts) == 2
+    assert browser.contexts[0].closed
+    assert not browser.contexts[1].closed
+
+
+@pytest.mark.asyncio
+async def test_concurrent_renders_capped_by_pool_size():
+    browser = FakeBrowser(latency=0.02)
+    renderer = _renderer(browser, max_contexts=2)
+
+    results = await asyncio.gather(
+        *(renderer.render(f"https://example.com/{i}") for i in range(6))
+    )
+
+    assert all(r.success for r in results)
+    assert len(browser.contexts) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiters_rebuild_when_holders_recycle():
+    browser = FakeBrowser(latency=0.01)
+    renderer = _renderer(browser, max_contexts=1, max_concurrency=3, context_max_uses=1)
+
+    # Every holder recycles its context, so waiters are never handed one
+    # back and must build their own in the freed slot
+    results = await asyncio.wait_for(
+        asyncio.gather(*(renderer.render(f"https://example.com/{i}") for i in range(3))),
+        timeout=5,
+    )
+
+    assert all(r.success for r in results)
+    assert len(browser.contexts) == 3
+    assert browser.peak_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_render_many_preserves_order():
+    browser = FakeBrowser(latency=0.01)
+    renderer = _renderer(browser, max_concurrency=2)
+    urls = [f"https://example.com/{i}" for i in range(5)]
+
+    results = await renderer.render_many(urls)
+
+    assert [r.url for r in results] == urls
+    assert all(r.success for r in results)
+    assert browser.peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_renders_run_concurrently_up_to_limit():
+    browser = FakeBrowser(latency=0.02)
+    renderer = _renderer(browser, max_contexts=8, max_concurrency=3)
+
+    await asyncio.gather(
+        *(renderer.render(f"https://example.com/{i}") for i in range(9))
+    )
+
+    assert browser.peak_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_browser_and_pool():
+    browser = FakeBrowser()
+    renderer = _renderer(browser)
+    await renderer.render("https://example.com/story")
+
+    await renderer.stop()
+    await renderer.stop()
+
+    assert browser.closed
+    assert browser.contexts[0].closed
+    assert renderer._browser is None
+
+
+@pytest.mark.asyncio
+async def test_render_serializes_only_selected_subtree():
+    renderer = _renderer(FakeBrowser())
+
+    result = await renderer.render("https://example.com/story", extract_selector="article")
+
+    assert result.html == "<article>Story</article>"
+
+
+@pytest.mark.asyncio
+async def test_render_falls_back_to_full_page_when_selector_misses():
+    browser = FakeBrowser()
+    renderer = _renderer(browser)
+
+    result = await renderer.render(
+        "https://example.com/story", extract_selector=".missing", strip_scripts=True
+    )
+
+    assert result.success
+    assert result.html == "<html><article>Story</article></html>"
+    assert any("script,style" in script for script, _ in browser.contexts[0].evaluated)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("selector_missing", [False, True])
+async def test_render_waits_on_events_not_fixed_sleeps(selector_missing):
+    browser = FakeBrowser(selector_missing=selector_missing)
+    renderer = _renderer(browser)
+
+    result = await renderer.render("https://example.com/story")
+
+    assert result.success
+    waits = browser.contexts[0].waits
+    assert not any(kind == "sleep" for kind, _ in waits)
+    assert ("networkidle", 1500) in waits
+    assert waits[0] == ("function", 10000)
+    assert (("function", 2000) in waits) == selector_missing
+
+
+@pytest.mark.asyncio
+async def test_render_survives_navigation_during_content_waits():
+    browser = FakeBrowser(renavigating=True)
+    renderer = _renderer(browser)
+
+    result = await renderer.render("https://example.com/story")
+
+    assert result.success
+    assert [w for w in browser.contexts[0].waits if w[0] == "function"] == [
+        ("function", 10000), ("function", 2000),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scroll_runs_in_one_evaluate_call():
+    browser = FakeBrowser()
+    renderer = JSRenderer(max_scrolls=5)
+    renderer._browser = browser
+
+    await renderer.render("https://example.com/story")
+
+    context = browser.contexts[0]
+    scrolls = [(script, args) for script, args in context.evaluated if "scrollBy" in script]
+    assert scrolls == [(scrolls[0][0], (5,))]
+    assert not any(kind == "sleep" for kind, _ in context.waits)
+
+
+@pytest.mark.asyncio
+async def test_subresources_blocked_through_cdp():
+    browser = FakeBrowser()
+    renderer = _renderer(browser)
+
+    await renderer.render("https://example.com/story")
+
+    context = browser.contexts[0]
+    assert context.routes == []
+    method, params = context.cdp_commands[-1]
+    assert method == "Network.setBlockedURLs"
+    assert "*.woff2" in params["urls"]
+    assert "*.woff2?*" in params["urls"]
+    assert "*google-analytics.com*" in params["urls"]
+
+
+def _blocked(url: str) -> bool:
+    # setBlockedURLs wildcards: "*" matches any run of characters, the rest
+    # is literal
+    return any(
+        re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+        for pattern in _BLOCKED_URL_PATTERNS
+    )
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.gifts.example/article",
+    "https://www.giffgaff.com/news",
+    "https://www.icould.com/story",
+    "https://example.com/posts/the.svg.format.explained",
+])
+def test_blocked_patterns_spare_documents(url):
+    assert not _blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://cdn.example/hero.png",
+    "https://cdn.example/font.woff2?v=3",
+    "https://www.google-analytics.com/collect",
+])
+def test_blocked_patterns_match_subresources(url):
+    assert _blocked(url)
+
+
+@pytest.mark.asyncio
+async def test_persistent_profile_shares_one_context():
+    browser = FakeBrowser()
+    renderer = JSRenderer(scroll_to_load=False, user_data_dir="/tmp/profiles")
+    renderer._persistent = FakeContext(browser)
+
+    await asyncio.gather(
+        *(renderer.render(f"https://example.com/{i}") for i in range(3))
+    )
+
+    assert browser.contexts == []
+    assert len(renderer._persistent.pages) == 3
+    assert not renderer._persistent.closed
+    assert renderer.user_data_dir == "/tmp/profiles"
+
+
+def test_profile_shared_across_restarts_and_temp_when_locked(tmp_path):
+    first = JSRenderer(user_data_dir=str(tmp_path))
+    second = JSRenderer(user_data_dir=str(tmp_path))
+
+    first._profile_dir = first._claim_profile()
+    second._profile_dir = second._claim_profile()
+
+    shared_profile = str(tmp_path / "profile")
+    temp_profile = second._profile_dir
+    assert first._profile_dir == shared_profile
+    assert not temp_profile.startswith(str(tmp_path))
+
+    second._release_profile()
+    first._release_profile()
+
+    assert not os.path.exists(temp_profile)
+    restarted = JSRenderer(user_data_dir=str(tmp_path))
+    assert restarted._claim_profile() == shared_profile
+    restarted._release_profile()
@@ -5,11 +5,13 @@ Tests for OAuth authentication.
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.auth import load_auth_settings
 from backend.config import config, state
 from backend.database import Database
 from backend.cache import create_cache
 from backend.feed_parser import FeedParser
 from backend.fetcher import Fetcher
+from backend.oauth import UserSession, get_serializer
 from backend.server import app
 
 
@@ -98,6 +100,27 @@ class TestOAuthEnabled:
         assert data["github_enabled"] is False  # Only Google configured
         assert data["user"] is None  # Not logged in
 
+    def test_auth_status_matches_admin_email_case_insensitively(self, client_with_oauth, monkeypatch):
+        """Admin status should use the same normalized list as require_admin."""
+        monkeypatch.setattr(config, "ADMIN_EMAILS", ["Admin@Example.com"])
+        load_auth_settings()
+        try:
+            token = get_serializer().dumps(UserSession(
+                email="admin@example.com",
+                provider="google",
+                created_at="2024-01-01T00:00:00+00:00",
+            ).model_dump())
+            response = client_with_oauth.get(
+                "/auth/status", headers={"Authorization": f"Bearer {token}"}
+            )
+        finally:
+            monkeypatch.undo()
+            load_auth_settings()
+
+        data = response.json()
+        assert data["user"]["email"] == "admin@example.com"
+        assert data["is_admin"] is True
+
     def test_protected_endpoint_requires_auth(self, client_with_oauth):
         """Protected endpoints should require auth when OAuth is enabled."""
         response = client_with_oauth.get("/feeds")